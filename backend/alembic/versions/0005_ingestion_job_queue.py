@@ -0,0 +1,31 @@
+"""Track queued PDF ingestion jobs.
+
+Revision ID: 0005_ingestion_job_queue
+Revises: 0004_add_recommendation_history
+Create Date: 2025-11-24
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0005_ingestion_job_queue"
+down_revision: str | None = "0004_add_recommendation_history"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("pdfingestion") as batch_op:
+        batch_op.add_column(sa.Column("scheduled_date", sa.Date(), nullable=True))
+        batch_op.add_column(sa.Column("started_at", sa.DateTime(), nullable=True))
+        batch_op.create_index("ix_pdfingestion_status", ["status"])
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("pdfingestion") as batch_op:
+        batch_op.drop_index("ix_pdfingestion_status")
+        batch_op.drop_column("started_at")
+        batch_op.drop_column("scheduled_date")
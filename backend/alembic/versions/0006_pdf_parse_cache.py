@@ -0,0 +1,43 @@
+"""Add a content-addressed cache of parsed PDF lines.
+
+Revision ID: 0006_pdf_parse_cache
+Revises: 0005_ingestion_job_queue
+Create Date: 2025-11-26
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0006_pdf_parse_cache"
+down_revision: str | None = "0005_ingestion_job_queue"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "pdf_parse_cache",
+        sa.Column("content_hash", sa.String(length=64), primary_key=True),
+        sa.Column("cache_version", sa.String(length=64), nullable=False),
+        sa.Column("lines", sa.Text(), nullable=False),
+        sa.Column("cleaned_lines", sa.Text(), nullable=False),
+        sa.Column("hit_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("created_at", sa.DateTime(), nullable=False, server_default=sa.func.now()),
+        sa.Column("last_used_at", sa.DateTime(), nullable=False, server_default=sa.func.now()),
+    )
+    op.create_index("ix_pdf_parse_cache_last_used_at", "pdf_parse_cache", ["last_used_at"])
+
+    with op.batch_alter_table("pdfingestion") as batch_op:
+        batch_op.add_column(sa.Column("content_hash", sa.String(length=64), nullable=True))
+        batch_op.create_index("ix_pdfingestion_content_hash", ["content_hash"])
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("pdfingestion") as batch_op:
+        batch_op.drop_index("ix_pdfingestion_content_hash")
+        batch_op.drop_column("content_hash")
+    op.drop_index("ix_pdf_parse_cache_last_used_at", table_name="pdf_parse_cache")
+    op.drop_table("pdf_parse_cache")
@@ -0,0 +1,25 @@
+"""Record the stored size of uploaded PDFs.
+
+Revision ID: 0007_ingestion_file_size
+Revises: 0006_pdf_parse_cache
+Create Date: 2025-11-28
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0007_ingestion_file_size"
+down_revision: str | None = "0006_pdf_parse_cache"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column("pdfingestion", sa.Column("file_size_bytes", sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("pdfingestion", "file_size_bytes")
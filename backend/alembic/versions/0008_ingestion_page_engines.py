@@ -0,0 +1,27 @@
+"""Record which extraction engine handled each PDF page.
+
+Revision ID: 0008_ingestion_page_engines
+Revises: 0007_ingestion_file_size
+Create Date: 2025-12-02
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0008_ingestion_page_engines"
+down_revision: str | None = "0007_ingestion_file_size"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column("pdfingestion", sa.Column("page_engines", sa.Text(), nullable=True))
+    op.add_column("pdf_parse_cache", sa.Column("page_engines", sa.Text(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("pdf_parse_cache", "page_engines")
+    op.drop_column("pdfingestion", "page_engines")
@@ -0,0 +1,41 @@
+"""Add a shared cache of LLM responses keyed by model and prompt.
+
+Revision ID: 0009_llm_response_cache
+Revises: 0008_ingestion_page_engines
+Create Date: 2025-12-04
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0009_llm_response_cache"
+down_revision: str | None = "0008_ingestion_page_engines"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "llm_response_cache",
+        sa.Column("cache_key", sa.String(length=64), primary_key=True),
+        sa.Column("namespace", sa.String(length=64), nullable=False),
+        sa.Column("model", sa.String(length=128), nullable=False),
+        sa.Column("response_text", sa.Text(), nullable=False),
+        sa.Column("hit_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("created_at", sa.DateTime(), nullable=False, server_default=sa.func.now()),
+        sa.Column("expires_at", sa.DateTime(), nullable=False),
+        sa.Column("last_used_at", sa.DateTime(), nullable=False, server_default=sa.func.now()),
+    )
+    op.create_index("ix_llm_response_cache_namespace", "llm_response_cache", ["namespace"])
+    op.create_index("ix_llm_response_cache_expires_at", "llm_response_cache", ["expires_at"])
+    op.create_index("ix_llm_response_cache_last_used_at", "llm_response_cache", ["last_used_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_llm_response_cache_last_used_at", table_name="llm_response_cache")
+    op.drop_index("ix_llm_response_cache_expires_at", table_name="llm_response_cache")
+    op.drop_index("ix_llm_response_cache_namespace", table_name="llm_response_cache")
+    op.drop_table("llm_response_cache")
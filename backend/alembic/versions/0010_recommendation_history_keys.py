@@ -0,0 +1,91 @@
+"""Add hashed title/URL dedup keys to recommendation history.
+
+Revision ID: 0010_recommendation_history_keys
+Revises: 0009_llm_response_cache
+Create Date: 2025-12-09
+"""
+
+import hashlib
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0010_recommendation_history_keys"
+down_revision: str | None = "0009_llm_response_cache"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+BACKFILL_BATCH_SIZE = 5000
+
+history = sa.table(
+    "recommendation_history",
+    sa.column("id", sa.String()),
+    sa.column("title", sa.Text()),
+    sa.column("resource_url", sa.Text()),
+    sa.column("title_key", sa.String()),
+    sa.column("url_key", sa.String()),
+)
+
+
+# Copied from app.models.recommendation_history so this revision keeps producing
+# the same keys even if the application code changes later.
+def _title_key(title: str) -> str:
+    return hashlib.sha256((title or "").strip().lower().encode("utf-8")).hexdigest()
+
+
+def _url_key(resource_url: str | None) -> str | None:
+    if not resource_url:
+        return None
+    return hashlib.sha256(resource_url.encode("utf-8")).hexdigest()
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("recommendation_history") as batch_op:
+        batch_op.add_column(sa.Column("title_key", sa.String(length=64), nullable=True))
+        batch_op.add_column(sa.Column("url_key", sa.String(length=64), nullable=True))
+
+    # Keyset-paginated backfill. env.py runs every revision in one transaction, so
+    # the backfill steps out into an autocommit block: the ADD COLUMN commits first
+    # and each batch then commits on its own, keeping row locks short on large tables.
+    with op.get_context().autocommit_block():
+        _backfill_keys(op.get_bind())
+
+    with op.batch_alter_table("recommendation_history") as batch_op:
+        batch_op.alter_column("title_key", existing_type=sa.String(length=64), nullable=False)
+        batch_op.create_index(
+            "ix_recommendation_history_user_title_key", ["user_id", "title_key", "created_at"]
+        )
+        batch_op.create_index("ix_recommendation_history_user_url_key", ["user_id", "url_key", "created_at"])
+
+
+def _backfill_keys(connection: sa.engine.Connection) -> None:
+    last_id = ""
+    while True:
+        rows = connection.execute(
+            sa.select(history.c.id, history.c.title, history.c.resource_url)
+            .where(history.c.id > last_id)
+            .order_by(history.c.id)
+            .limit(BACKFILL_BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        connection.execute(
+            history.update()
+            .where(history.c.id == sa.bindparam("row_id"))
+            .values(title_key=sa.bindparam("new_title_key"), url_key=sa.bindparam("new_url_key")),
+            [
+                {"row_id": row.id, "new_title_key": _title_key(row.title), "new_url_key": _url_key(row.resource_url)}
+                for row in rows
+            ],
+        )
+        last_id = rows[-1].id
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("recommendation_history") as batch_op:
+        batch_op.drop_index("ix_recommendation_history_user_url_key")
+        batch_op.drop_index("ix_recommendation_history_user_title_key")
+        batch_op.drop_column("url_key")
+        batch_op.drop_column("title_key")
@@ -0,0 +1,39 @@
+"""Store recommendations precomputed overnight.
+
+Revision ID: 0011_precomputed_recommendations
+Revises: 0010_recommendation_history_keys
+Create Date: 2025-12-11
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0011_precomputed_recommendations"
+down_revision: str | None = "0010_recommendation_history_keys"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "precomputed_recommendation",
+        sa.Column("id", sa.String(), primary_key=True),
+        sa.Column("user_id", sa.String(), sa.ForeignKey("user.id"), nullable=False),
+        sa.Column("scheduled_date", sa.Date(), nullable=False),
+        sa.Column("input_fingerprint", sa.String(length=64), nullable=False),
+        sa.Column("todos", sa.Text(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False, server_default=sa.func.now()),
+        sa.Column("served_at", sa.DateTime(), nullable=True),
+        sa.UniqueConstraint("user_id", "scheduled_date", name="uq_precomputed_recommendation_user_date"),
+    )
+    op.create_index("ix_precomputed_recommendation_user_id", "precomputed_recommendation", ["user_id"])
+    op.create_index("ix_precomputed_recommendation_scheduled_date", "precomputed_recommendation", ["scheduled_date"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_precomputed_recommendation_scheduled_date", table_name="precomputed_recommendation")
+    op.drop_index("ix_precomputed_recommendation_user_id", table_name="precomputed_recommendation")
+    op.drop_table("precomputed_recommendation")
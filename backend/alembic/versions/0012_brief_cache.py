@@ -0,0 +1,34 @@
+"""Add a shared cache of rendered daily briefs.
+
+Revision ID: 0012_brief_cache
+Revises: 0011_precomputed_recommendations
+Create Date: 2025-12-15
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0012_brief_cache"
+down_revision: str | None = "0011_precomputed_recommendations"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "brief_cache",
+        sa.Column("user_id", sa.String(), sa.ForeignKey("user.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column("brief_date", sa.Date(), primary_key=True),
+        sa.Column("payload", sa.Text(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False, server_default=sa.func.now()),
+        sa.Column("expires_at", sa.DateTime(), nullable=False),
+    )
+    op.create_index("ix_brief_cache_expires_at", "brief_cache", ["expires_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_brief_cache_expires_at", table_name="brief_cache")
+    op.drop_table("brief_cache")
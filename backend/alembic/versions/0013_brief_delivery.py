@@ -0,0 +1,45 @@
+"""Record daily brief email deliveries so each brief is sent at most once.
+
+Revision ID: 0013_brief_delivery
+Revises: 0012_brief_cache
+Create Date: 2025-12-18
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0013_brief_delivery"
+down_revision: str | None = "0012_brief_cache"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "brief_delivery",
+        sa.Column("id", sa.String(), primary_key=True),
+        sa.Column("user_id", sa.String(), sa.ForeignKey("user.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("brief_date", sa.Date(), nullable=False),
+        sa.Column("status", sa.String(length=16), nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("provider_message_id", sa.String(length=255), nullable=True),
+        sa.Column("error_message", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False, server_default=sa.func.now()),
+        sa.Column("sent_at", sa.DateTime(), nullable=True),
+        sa.UniqueConstraint("user_id", "brief_date", name="uq_brief_delivery_user_date"),
+    )
+    op.create_index("ix_brief_delivery_brief_date", "brief_delivery", ["brief_date"])
+    # Due users are looked up by timezone and paged by id.
+    op.create_index("ix_user_timezone_id", "user", ["timezone", "id"])
+    # Briefs read each user's latest goal; without this every lookup scans the goal table.
+    op.create_index("ix_goal_user_id_created_at", "goal", ["user_id", "created_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_goal_user_id_created_at", table_name="goal")
+    op.drop_index("ix_user_timezone_id", table_name="user")
+    op.drop_index("ix_brief_delivery_brief_date", table_name="brief_delivery")
+    op.drop_table("brief_delivery")
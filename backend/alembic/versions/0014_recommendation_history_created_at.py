@@ -0,0 +1,26 @@
+"""Index recommendation history by creation time for retention purges.
+
+Revision ID: 0014_history_created_at
+Revises: 0013_brief_delivery
+Create Date: 2025-12-20
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+
+revision: str = "0014_history_created_at"
+down_revision: str | None = "0013_brief_delivery"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Each purge batch is `created_at < cutoff ORDER BY created_at LIMIT n`; without this
+    # index every batch is a full scan and sort.
+    op.create_index("ix_recommendation_history_created_at", "recommendation_history", ["created_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_recommendation_history_created_at", table_name="recommendation_history")
@@ -0,0 +1,30 @@
+"""Share brief cache invalidation counters across API workers.
+
+Revision ID: 0015_brief_cache_generation
+Revises: 0014_history_created_at
+Create Date: 2025-12-21
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0015_brief_cache_generation"
+down_revision: str | None = "0014_history_created_at"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "brief_cache_generation",
+        sa.Column("user_id", sa.String(), sa.ForeignKey("user.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column("generation", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("updated_at", sa.DateTime(), nullable=False, server_default=sa.func.now()),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("brief_cache_generation")
@@ -0,0 +1,27 @@
+"""Record which worker holds a processing ingestion and when it last checked in.
+
+Revision ID: 0016_ingestion_heartbeat
+Revises: 0015_brief_cache_generation
+Create Date: 2025-12-22
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0016_ingestion_heartbeat"
+down_revision: str | None = "0015_brief_cache_generation"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column("pdfingestion", sa.Column("claimed_by", sa.String(length=128), nullable=True))
+    op.add_column("pdfingestion", sa.Column("heartbeat_at", sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("pdfingestion", "heartbeat_at")
+    op.drop_column("pdfingestion", "claimed_by")
@@ -1,9 +1,10 @@
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator
 
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.core.config import settings
-from app.db.session import get_db
+from app.db.session import get_async_db, get_db
 
 
 def get_settings():
@@ -12,3 +13,8 @@ def get_settings():
 
 def get_db_session() -> Generator[Session, None, None]:
     yield from get_db()
+
+
+async def get_async_db_session() -> AsyncGenerator[AsyncSession, None]:
+    async for db in get_async_db():
+        yield db
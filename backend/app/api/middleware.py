@@ -0,0 +1,75 @@
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+
+# Slack for multipart boundaries and the form fields sent alongside the file.
+MULTIPART_OVERHEAD_BYTES = 64 * 1024
+
+
+class _BodyTooLarge(Exception):
+    """Raised from the wrapped `receive` to stop the app once the body passes the limit."""
+
+
+class UploadSizeLimitMiddleware:
+    """Reject oversized uploads before the body is buffered.
+
+    A declared Content-Length over the limit is refused up front. Bodies without
+    one (chunked transfer) are counted as they are received, and the request is
+    answered with 413 as soon as the count passes the limit, so the form parser
+    never spools the rest.
+    """
+
+    def __init__(self, app: ASGIApp, path_suffix: str = "/uploads/pdf") -> None:
+        self.app = app
+        self.path_suffix = path_suffix
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if not (scope["type"] == "http" and scope["method"] == "POST" and scope["path"].endswith(self.path_suffix)):
+            await self.app(scope, receive, send)
+            return
+
+        limit = settings.upload_max_bytes + MULTIPART_OVERHEAD_BYTES
+        for name, value in scope["headers"]:
+            if name == b"content-length" and value.isdigit() and int(value) > limit:
+                await self._reject(scope, receive, send)
+                return
+
+        received = 0
+        response_started = False
+        rejected = False
+
+        async def limited_receive() -> Message:
+            nonlocal received, rejected
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > limit:
+                    if not response_started and not rejected:
+                        rejected = True
+                        await self._reject(scope, receive, send)
+                    raise _BodyTooLarge()
+            return message
+
+        async def guarded_send(message: Message) -> None:
+            nonlocal response_started
+            if rejected:
+                # The 413 is already out; drop whatever the app answers to the aborted read.
+                return
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, limited_receive, guarded_send)
+        except _BodyTooLarge:
+            if not rejected:
+                raise
+
+    @staticmethod
+    async def _reject(scope: Scope, receive: Receive, send: Send) -> None:
+        response = JSONResponse(
+            {"detail": f"Upload exceeds the {settings.upload_max_bytes} byte limit"},
+            status_code=413,
+        )
+        await response(scope, receive, send)
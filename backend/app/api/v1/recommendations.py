@@ -1,20 +1,36 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_db_session
+from app.api.deps import get_async_db_session
 from app.schemas.recommendation import RecommendationRequest, RecommendationsResponse
 from app.services import recommendations as recommendations_service
-from app.services import users as user_service
 
 router = APIRouter()
 
 
 @router.post("/recommendations", response_model=RecommendationsResponse, status_code=status.HTTP_200_OK)
-def fetch_recommendations(payload: RecommendationRequest, db: Session = Depends(get_db_session)) -> RecommendationsResponse:
-    if user_service.get_user(db, payload.user_id) is None:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+async def fetch_recommendations(payload: RecommendationRequest) -> RecommendationsResponse:
+    try:
+        return await recommendations_service.generate_recommendations_coalesced(payload)
+    except LookupError as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+
 
+@router.post("/recommendations/stream", response_class=StreamingResponse)
+async def stream_recommendations(
+    payload: RecommendationRequest, db: AsyncSession = Depends(get_async_db_session)
+) -> StreamingResponse:
     try:
-        return recommendations_service.generate_recommendations(db, payload)
+        events = await recommendations_service.open_recommendation_stream(db, payload)
+    except LookupError as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
     except ValueError as exc:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    return StreamingResponse(
+        events,
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
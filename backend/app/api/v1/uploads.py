@@ -5,24 +5,53 @@ from fastapi import Form
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_db_session
-from app.schemas.pdf import PDFIngestionWithTasks
+from app.core.executors import ExecutorSaturatedError, upload_executor
+from app.models.pdf_ingestion import PDFIngestion
+from app.schemas.pdf import PDFIngestionRead, PDFIngestionWithTasks
 from app.services import pdf_ingestions as pdf_service
 from app.services import users as user_service
+from app.services.ingestion_queue import ingestion_workers
+from app.services.upload_storage import UploadTooLargeError
 
 router = APIRouter()
 
 
-@router.post("/uploads/pdf", response_model=PDFIngestionWithTasks, status_code=status.HTTP_201_CREATED)
+@router.post("/uploads/pdf", response_model=PDFIngestionRead, status_code=status.HTTP_202_ACCEPTED)
 async def upload_pdf(
     user_id: str = Form(...),
     scheduled_date: date = Form(...),
     file: UploadFile = File(...),
     db: Session = Depends(get_db_session),
-) -> PDFIngestionWithTasks:
-    if user_service.get_user(db, user_id) is None:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
-
+) -> PDFIngestionRead:
+    # Disk and database work runs on the dedicated upload executor so the event loop stays free.
     try:
-        return pdf_service.ingest_pdf(db, user_id=user_id, file=file, scheduled_date=scheduled_date)
+        ingestion = await upload_executor.run(_accept_upload, db, user_id, scheduled_date, file)
+    except UploadTooLargeError as exc:
+        raise HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail=str(exc)) from exc
+    except ExecutorSaturatedError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many uploads in progress, try again shortly",
+            headers={"Retry-After": "5"},
+        ) from exc
+    except HTTPException:
+        raise
     except Exception as exc:  # pragma: no cover
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+
+    ingestion_workers.notify()
+    return pdf_service.serialize_ingestion(ingestion, tasks_created=[])
+
+
+def _accept_upload(db: Session, user_id: str, scheduled_date: date, file: UploadFile) -> PDFIngestion:
+    if user_service.get_user(db, user_id) is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+    return pdf_service.create_ingestion(db, user_id=user_id, file=file, scheduled_date=scheduled_date)
+
+
+@router.get("/uploads/{ingestion_id}", response_model=PDFIngestionWithTasks)
+def fetch_ingestion(ingestion_id: str, db: Session = Depends(get_db_session)) -> PDFIngestionWithTasks:
+    ingestion = pdf_service.get_ingestion(db, ingestion_id)
+    if ingestion is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Upload not found")
+    return pdf_service.serialize_ingestion(ingestion)
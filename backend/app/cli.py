@@ -0,0 +1,127 @@
+"""Operational commands, run as `python -m app.cli <command>`."""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+from datetime import date, datetime
+
+from app.db.session import SessionLocal
+from app.services.brief_dispatch import dispatch_daily_briefs
+from app.services.mail import LocalMailTransport
+from app.services.recommendation_precompute import precompute_recommendations
+from app.services.retention import purge_recommendation_history
+from app.services.task_rollover import rollover_incomplete_tasks
+
+
+def _purge_history(args: argparse.Namespace) -> None:
+    with SessionLocal() as db:
+        result = purge_recommendation_history(
+            db,
+            retention_days=args.retention_days,
+            batch_size=args.batch_size,
+            archive_dir=args.archive_dir,
+            dry_run=args.dry_run,
+        )
+    verb = "would purge" if result.dry_run else "purged"
+    print(
+        f"recommendation_history: {verb} {result.rows_purged} rows older than {result.cutoff:%Y-%m-%d %H:%M} "
+        f"in {result.batches} batches ({result.elapsed_seconds:.2f}s)"
+    )
+    if result.archive_path:
+        print(f"archived to {result.archive_path}")
+
+
+def _precompute(args: argparse.Namespace) -> None:
+    result = asyncio.run(
+        precompute_recommendations(
+            args.date, concurrency=args.concurrency, requests_per_minute=args.requests_per_minute
+        )
+    )
+    print(
+        f"precomputed recommendations for {result.scheduled_date}: {result.generated} generated, "
+        f"{result.skipped} already current, {result.failed} failed of {result.users_seen} users "
+        f"({result.elapsed_seconds:.2f}s, {result.pruned} past rows pruned)"
+    )
+
+
+def _dispatch_briefs(args: argparse.Namespace) -> None:
+    transport = LocalMailTransport(args.outbox_dir) if args.local else None
+    result = asyncio.run(dispatch_daily_briefs(args.at, transport=transport, concurrency=args.concurrency))
+    if not result.due_timezones:
+        print(f"no timezone is at the send hour at {result.run_at:%Y-%m-%d %H:%M %Z}")
+        return
+    print(
+        f"daily briefs: {result.sent} sent, {result.failed} failed, {result.skipped} already sent "
+        f"of {result.users_due} users in {len(result.due_timezones)} timezone(s) "
+        f"({result.elapsed_seconds:.2f}s, {result.per_second:.0f}/s)"
+    )
+
+
+def _rollover(args: argparse.Namespace) -> None:
+    result = rollover_incomplete_tasks(args.at, chunk_size=args.chunk_size)
+    if not result.due_timezones:
+        print(f"no timezone is at midnight at {result.run_at:%Y-%m-%d %H:%M %Z}")
+        return
+    for index, chunk in enumerate(result.chunks, start=1):
+        print(f"chunk {index}: {chunk.rows_moved} tasks moved for {chunk.users} users in {chunk.elapsed_seconds:.3f}s")
+    print(
+        f"rollover: {result.rows_moved} tasks moved in {len(result.chunks)} chunks "
+        f"across {len(result.due_timezones)} timezone(s) ({result.elapsed_seconds:.2f}s)"
+    )
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m app.cli", description=__doc__)
+    subcommands = parser.add_subparsers(dest="command", required=True)
+
+    purge = subcommands.add_parser("purge-history", help="Delete recommendation history past the retention window.")
+    purge.add_argument("--retention-days", type=int, default=None)
+    purge.add_argument("--batch-size", type=int, default=None)
+    purge.add_argument("--archive-dir", default=None, help="Write purged rows to gzip JSONL here before deleting.")
+    purge.add_argument("--dry-run", action="store_true", help="Only count the rows that would be purged.")
+    purge.set_defaults(handler=_purge_history)
+
+    precompute = subcommands.add_parser(
+        "precompute-recommendations", help="Generate recommendations ahead of time for every user with a goal."
+    )
+    precompute.add_argument("--date", type=date.fromisoformat, default=None, help="Defaults to tomorrow (UTC).")
+    precompute.add_argument("--concurrency", type=int, default=None)
+    precompute.add_argument("--requests-per-minute", type=int, default=None)
+    precompute.set_defaults(handler=_precompute)
+
+    dispatch = subcommands.add_parser(
+        "dispatch-briefs", help="Email the daily brief to users whose local time is at the send hour."
+    )
+    dispatch.add_argument(
+        "--at", type=datetime.fromisoformat, default=None, help="Pretend it is this time (UTC unless an offset is given)."
+    )
+    dispatch.add_argument("--concurrency", type=int, default=None)
+    dispatch.add_argument("--local", action="store_true", help="Use the local stand-in transport instead of Resend.")
+    dispatch.add_argument("--outbox-dir", default=None, help="With --local, also write each message here as JSON.")
+    dispatch.set_defaults(handler=_dispatch_briefs)
+
+    rollover = subcommands.add_parser(
+        "rollover-tasks", help="Carry yesterday's incomplete tasks forward for users whose local day just started."
+    )
+    rollover.add_argument(
+        "--at", type=datetime.fromisoformat, default=None, help="Pretend it is this time (UTC unless an offset is given)."
+    )
+    rollover.add_argument("--chunk-size", type=int, default=None)
+    rollover.set_defaults(handler=_rollover)
+    return parser
+
+
+def main(argv: list[str] | None = None) -> None:
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(name)s: %(message)s")
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    try:
+        args.handler(args)
+    except ValueError as exc:
+        parser.error(str(exc))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Generic, TypeVar
+
+from app.core.metrics import metrics
+
+T = TypeVar("T")
+
+
+class SingleFlight(Generic[T]):
+    """Coalesces concurrent calls with the same key into one execution, then remembers the result briefly.
+
+    The shared work runs as its own task, so a caller that disconnects does not
+    cancel it for the others. Failures reach every waiter and are not cached.
+    State is per process; each API worker coalesces its own callers.
+    """
+
+    def __init__(self, name: str, ttl_seconds: float, max_entries: int) -> None:
+        self.name = name
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._in_flight: dict[Hashable, asyncio.Task[T]] = {}
+        self._results: OrderedDict[Hashable, tuple[float, T]] = OrderedDict()
+
+    async def run(self, key: Hashable, factory: Callable[[], Awaitable[T]], *, use_cached: bool = True) -> T:
+        if use_cached:
+            cached = self._cached(key)
+            if cached is not None:
+                metrics.increment(f"{self.name}.result_cache.hit")
+                return cached[1]
+
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(factory())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done: self._finish(key, done))
+        else:
+            metrics.increment(f"{self.name}.coalesced")
+        return await asyncio.shield(task)
+
+    def invalidate(self, key: Hashable) -> None:
+        self._results.pop(key, None)
+
+    def clear(self) -> None:
+        self._results.clear()
+
+    def _cached(self, key: Hashable) -> tuple[float, T] | None:
+        entry = self._results.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del self._results[key]
+            return None
+        return entry
+
+    def _finish(self, key: Hashable, task: asyncio.Task[T]) -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        if task.cancelled() or task.exception() is not None or self.ttl_seconds <= 0:
+            return
+        self._results[key] = (time.monotonic() + self.ttl_seconds, task.result())
+        self._results.move_to_end(key)
+        while len(self._results) > self.max_entries:
+            self._results.popitem(last=False)
@@ -15,12 +15,69 @@ class Settings(BaseSettings):
     database_url: str = Field(default="sqlite:///./planner.db")
     resend_api_key: str | None = None
     daily_brief_default_send_hour: int = Field(default=7, ge=0, le=23)
+    brief_dispatch_enabled: bool = False
+    brief_dispatch_page_size: int = Field(default=500, ge=1)
+    brief_dispatch_concurrency: int = Field(default=16, ge=1)
+    brief_dispatch_max_attempts: int = Field(default=3, ge=1)
+    brief_dispatch_retry_base_delay_seconds: float = Field(default=1.0, ge=0)
+    brief_mail_transport: str = Field(default="resend", pattern="^(resend|local)$")
+    brief_mail_from: str = Field(default="AI Daily Planner <briefs@example.com>")
+    brief_mail_outbox_dir: str | None = None
     openai_api_key: str | None = Field(default=None)
     openai_model: str = Field(default="gpt-4o-mini")
+    openai_base_url: str | None = None
+    openai_connect_timeout_seconds: float = Field(default=5.0, gt=0)
+    openai_read_timeout_seconds: float = Field(default=30.0, gt=0)
+    openai_request_deadline_seconds: float = Field(default=45.0, gt=0)
+    openai_max_retries: int = Field(default=2, ge=0)
+    openai_retry_base_delay_seconds: float = Field(default=0.5, ge=0)
+    openai_max_connections: int = Field(default=20, ge=1)
     google_project_id: str | None = None
     google_location: str = Field(default="us")
     google_processor_id: str | None = None
     google_credentials_path: str | None = None
+    document_ai_timeout_seconds: float = Field(default=60.0, gt=0)
+    document_ai_fake_document_path: str | None = None
+    document_ai_fake_latency_seconds: float = Field(default=0.0, ge=0)
+    ingestion_worker_count: int = Field(default=2, ge=0)
+    ingestion_poll_interval_seconds: float = Field(default=2.0, gt=0)
+    ingestion_heartbeat_interval_seconds: float = Field(default=30.0, gt=0)
+    ingestion_stale_after_seconds: int = Field(default=180, ge=60)
+    upload_executor_max_workers: int = Field(default=4, ge=1)
+    upload_executor_max_pending: int = Field(default=32, ge=0)
+    upload_max_bytes: int = Field(default=25 * 1024 * 1024, ge=1024)
+    ocr_pool_size: int = Field(default=1, ge=1)
+    ocr_preload_on_startup: bool = False
+    easyocr_gpu: bool = False
+    text_layer_min_chars: int = Field(default=12, ge=1)
+    ocr_dpi: int = Field(default=200, ge=72, le=600)
+    strikethrough_dpi: int = Field(default=100, ge=50, le=600)
+    page_image_cache_size: int = Field(default=2, ge=0)
+    llm_cleanup_confidence_threshold: float = Field(default=0.85, ge=0, le=1)
+    llm_cache_enabled: bool = True
+    llm_cache_max_entries: int = Field(default=2000, ge=1)
+    llm_cache_prune_every: int = Field(default=50, ge=1)
+    llm_cache_cleanup_ttl_seconds: int = Field(default=7 * 24 * 3600, ge=0)
+    llm_cache_recommendations_ttl_seconds: int = Field(default=3600, ge=0)
+    recommendations_result_cache_seconds: float = Field(default=30.0, ge=0)
+    recommendations_result_cache_max_entries: int = Field(default=1024, ge=1)
+    precompute_enabled: bool = False
+    precompute_hour_utc: int = Field(default=2, ge=0, le=23)
+    precompute_concurrency: int = Field(default=4, ge=1)
+    precompute_requests_per_minute: int = Field(default=120, ge=1)
+    precompute_page_size: int = Field(default=200, ge=1)
+    brief_cache_backend: str = Field(default="memory", pattern="^(none|memory|database)$")
+    brief_cache_ttl_seconds: int = Field(default=600, ge=0)
+    brief_cache_max_entries: int = Field(default=2048, ge=1)
+    brief_range_max_days: int = Field(default=31, ge=1)
+    rollover_enabled: bool = False
+    rollover_chunk_size: int = Field(default=1000, ge=1)
+    recommendation_history_retention_days: int = Field(default=90, ge=15)
+    retention_batch_size: int = Field(default=5000, ge=1)
+    retention_archive_dir: str | None = None
+    parse_cache_enabled: bool = True
+    parse_cache_max_entries: int = Field(default=500, ge=1)
+    parse_cache_max_age_days: int = Field(default=30, ge=1)
 
     @property
     def base_path(self) -> Path:
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, TypeVar
+
+from app.core.config import settings
+
+T = TypeVar("T")
+
+
+class ExecutorSaturatedError(RuntimeError):
+    """Raised when a bounded executor already has its maximum number of jobs in flight."""
+
+
+class BoundedExecutor:
+    """Thread pool with a hard cap on running + queued jobs.
+
+    Kept separate from FastAPI's default threadpool so slow blocking work (PDF
+    uploads, OCR) cannot starve the sync endpoints that share that pool.
+    """
+
+    def __init__(self, max_workers: int, max_pending: int, thread_name_prefix: str) -> None:
+        self.max_workers = max_workers
+        self.capacity = max_workers + max_pending
+        self.thread_name_prefix = thread_name_prefix
+        self._slots = threading.BoundedSemaphore(self.capacity)
+        self._executor: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix=self.thread_name_prefix,
+                )
+            return self._executor
+
+    async def run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        if not self._slots.acquire(blocking=False):
+            raise ExecutorSaturatedError(f"{self.thread_name_prefix} executor is at capacity ({self.capacity} jobs)")
+        try:
+            future = self._get_executor().submit(partial(func, *args, **kwargs))
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return await asyncio.wrap_future(future)
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+
+upload_executor = BoundedExecutor(
+    max_workers=settings.upload_executor_max_workers,
+    max_pending=settings.upload_executor_max_pending,
+    thread_name_prefix="pdf-upload",
+)
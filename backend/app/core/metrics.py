@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+
+class MetricsRegistry:
+    """In-process counters and timing summaries, exposed through `GET /metrics`."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counters: dict[str, float] = {}
+        self._timings: dict[str, dict[str, float]] = {}
+
+    def increment(self, name: str, value: float = 1) -> None:
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def observe(self, name: str, seconds: float) -> None:
+        with self._lock:
+            timing = self._timings.setdefault(name, {"count": 0, "total_seconds": 0.0, "max_seconds": 0.0})
+            timing["count"] += 1
+            timing["total_seconds"] += seconds
+            timing["max_seconds"] = max(timing["max_seconds"], seconds)
+
+    @contextmanager
+    def timer(self, name: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - started)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            timings = {
+                name: {**timing, "avg_seconds": timing["total_seconds"] / timing["count"] if timing["count"] else 0.0}
+                for name, timing in self._timings.items()
+            }
+            return {"counters": dict(self._counters), "timings": timings}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters.clear()
+            self._timings.clear()
+
+
+metrics = MetricsRegistry()
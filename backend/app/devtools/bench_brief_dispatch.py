@@ -0,0 +1,132 @@
+"""Run the daily brief dispatch against many seeded users and report throughput and latency.
+
+    DATABASE_URL=sqlite:////tmp/dispatch.db python -m app.devtools.bench_brief_dispatch --users 100000
+
+Seeds the database named by DATABASE_URL (tables are created if missing; it
+must not already contain users) with UTC users, each with a goal, availability
+and tasks, then runs `dispatch_daily_briefs` once at the send hour through
+`LocalMailTransport` with a simulated provider latency and prints the run's
+metrics.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from datetime import datetime, timezone
+from uuid import uuid4
+
+from sqlalchemy import func, insert, select
+
+from app import models  # noqa: F401  # register every table with Base.metadata
+from app.core.config import settings
+from app.core.metrics import metrics
+from app.db.base import Base
+from app.db.session import SessionLocal, engine
+from app.models.availability import DailyAvailability
+from app.models.task import Task
+from app.models.user import Goal, User
+from app.services.brief_dispatch import dispatch_daily_briefs
+from app.services.mail import LocalMailTransport
+
+INSERT_BATCH_SIZE = 10_000
+
+
+def populate(users: int, tasks_per_user: int, now: datetime) -> None:
+    brief_date = now.date()
+    created = datetime.utcnow()
+    with SessionLocal() as db:
+        if db.scalar(select(func.count()).select_from(User)):
+            raise SystemExit("DATABASE_URL already has users; point the benchmark at an empty database")
+        for offset in range(0, users, INSERT_BATCH_SIZE):
+            user_ids = [str(uuid4()) for _ in range(min(INSERT_BATCH_SIZE, users - offset))]
+            db.execute(
+                insert(User),
+                [
+                    {
+                        "id": user_id,
+                        "email": f"{user_id}@bench.local",
+                        "full_name": "Bench User",
+                        "timezone": "UTC",
+                        "created_at": created,
+                        "updated_at": created,
+                    }
+                    for user_id in user_ids
+                ],
+            )
+            db.execute(
+                insert(Goal),
+                [
+                    {"user_id": user_id, "goal_statement": "Grow into a staff engineer role", "created_at": created}
+                    for user_id in user_ids
+                ],
+            )
+            db.execute(
+                insert(DailyAvailability),
+                [
+                    {"user_id": user_id, "day": brief_date, "minutes_available": 240, "created_at": created}
+                    for user_id in user_ids
+                ],
+            )
+            db.execute(
+                insert(Task),
+                [
+                    {
+                        "id": str(uuid4()),
+                        "user_id": user_id,
+                        "title": f"Bench task {index}",
+                        "scheduled_date": brief_date,
+                        "estimated_minutes": 25,
+                        "status": "pending",
+                        "source": "manual",
+                        "created_at": created,
+                        "updated_at": created,
+                    }
+                    for user_id in user_ids
+                    for index in range(tasks_per_user)
+                ],
+            )
+            db.commit()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=100_000)
+    parser.add_argument("--tasks-per-user", type=int, default=3)
+    parser.add_argument("--concurrency", type=int, default=None)
+    parser.add_argument("--page-size", type=int, default=None)
+    parser.add_argument("--latency", type=float, default=0.05, help="Simulated provider latency per email, seconds.")
+    args = parser.parse_args()
+
+    now = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0)
+    now = now.replace(hour=settings.daily_brief_default_send_hour)
+    Base.metadata.create_all(engine)
+    started = time.perf_counter()
+    populate(args.users, args.tasks_per_user, now)
+    print(f"seeded {args.users} users in {time.perf_counter() - started:.1f}s")
+
+    transport = LocalMailTransport(latency_seconds=args.latency, keep=1)
+    result = asyncio.run(
+        dispatch_daily_briefs(now, transport=transport, concurrency=args.concurrency, page_size=args.page_size)
+    )
+    timings = metrics.snapshot()["timings"]
+    send = timings.get("brief_dispatch.send_seconds", {})
+    page = timings.get("brief_dispatch.page_seconds", {})
+    build = timings.get("brief_dispatch.build_seconds", {})
+    print(
+        f"sent {result.sent}, failed {result.failed}, skipped {result.skipped} "
+        f"of {result.users_due} users in {result.pages} pages"
+    )
+    print(f"wall time:  {result.elapsed_seconds:.1f}s  throughput: {result.per_second:.0f} emails/s")
+    print(
+        f"send:       avg {send.get('avg_seconds', 0) * 1000:.1f} ms  max {send.get('max_seconds', 0) * 1000:.1f} ms"
+    )
+    print(
+        f"page:       avg {page.get('avg_seconds', 0):.2f}s  max {page.get('max_seconds', 0):.2f}s"
+        f"  (brief build avg {build.get('avg_seconds', 0) * 1000:.0f} ms)"
+    )
+
+
+if __name__ == "__main__":
+    main()
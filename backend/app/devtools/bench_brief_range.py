@@ -0,0 +1,139 @@
+"""Benchmark a week of briefs built through `/briefs/range` against seven single-day calls.
+
+    python -m app.devtools.bench_brief_range --users 500 --tasks-per-day 8
+
+Builds a throwaway SQLite database (or uses --database-url), fills it with tasks
+and availability for every user over the last few weeks, then times both ways
+of building a week of briefs with the brief cache disabled, and counts the SQL
+statements each one runs.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from uuid import uuid4
+
+from sqlalchemy import create_engine, event, insert
+from sqlalchemy.orm import Session
+
+from app import models  # noqa: F401  # register every table with Base.metadata
+from app.db.base import Base
+from app.models.availability import DailyAvailability
+from app.models.task import Task
+from app.models.user import Goal, User
+from app.services import briefs as brief_service
+from app.services.brief_cache import brief_cache
+
+RANGE_DAYS = 7
+
+
+def populate(session: Session, users: int, days: int, tasks_per_day: int) -> tuple[list[str], date]:
+    user_ids = [str(uuid4()) for _ in range(users)]
+    now = datetime.utcnow()
+    first_day = now.date() - timedelta(days=days)
+    session.execute(
+        insert(User),
+        [{"id": user_id, "email": f"{user_id}@bench.local", "created_at": now, "updated_at": now} for user_id in user_ids],
+    )
+    session.execute(
+        insert(Goal),
+        [
+            {"user_id": user_id, "goal_statement": "Grow into a staff engineer role", "created_at": now, "updated_at": now}
+            for user_id in user_ids
+        ],
+    )
+    for user_id in user_ids:
+        session.execute(
+            insert(DailyAvailability),
+            [
+                {"user_id": user_id, "day": first_day + timedelta(days=offset), "minutes_available": 240, "created_at": now}
+                for offset in range(days)
+            ],
+        )
+        session.execute(
+            insert(Task),
+            [
+                {
+                    "id": str(uuid4()),
+                    "user_id": user_id,
+                    "title": f"Bench task {offset}-{index}",
+                    "scheduled_date": first_day + timedelta(days=offset),
+                    "estimated_minutes": 20,
+                    "status": "pending",
+                    "source": "manual",
+                    "created_at": now,
+                    "updated_at": now,
+                }
+                for offset in range(days)
+                for index in range(tasks_per_day)
+            ],
+        )
+    session.commit()
+    return user_ids, first_day
+
+
+def single_day_calls(session: Session, user_id: str, start: date) -> None:
+    for offset in range(RANGE_DAYS):
+        brief_service.generate_daily_brief(session, user_id, start + timedelta(days=offset))
+
+
+def range_call(session: Session, user_id: str, start: date) -> None:
+    brief_service.generate_daily_briefs(session, user_id, start, start + timedelta(days=RANGE_DAYS - 1))
+
+
+def time_calls(label: str, func, session: Session, user_ids: list[str], first_day: date, days: int, samples: int) -> None:
+    statements = 0
+
+    def count(*_):
+        nonlocal statements
+        statements += 1
+
+    engine = session.get_bind()
+    event.listen(engine, "before_cursor_execute", count)
+    durations = []
+    for user_id in random.sample(user_ids, min(samples, len(user_ids))):
+        start = first_day + timedelta(days=random.randint(0, days - RANGE_DAYS))
+        session.expunge_all()
+        started = time.perf_counter()
+        func(session, user_id, start)
+        durations.append(time.perf_counter() - started)
+    event.remove(engine, "before_cursor_execute", count)
+    durations.sort()
+    print(
+        f"{label:<15} p50 {statistics.median(durations) * 1000:8.2f} ms"
+        f"   p95 {durations[int(len(durations) * 0.95) - 1] * 1000:8.2f} ms"
+        f"   {statements / len(durations):5.1f} statements per week"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=500)
+    parser.add_argument("--days", type=int, default=28)
+    parser.add_argument("--tasks-per-day", type=int, default=8)
+    parser.add_argument("--samples", type=int, default=200)
+    parser.add_argument("--database-url", default=None, help="Defaults to a temporary SQLite file.")
+    args = parser.parse_args()
+
+    brief_cache.backend = None
+    with tempfile.TemporaryDirectory() as scratch:
+        url = args.database_url or f"sqlite:///{Path(scratch) / 'bench.db'}"
+        engine = create_engine(url)
+        Base.metadata.create_all(engine)
+        with Session(engine) as session:
+            started = time.perf_counter()
+            user_ids, first_day = populate(session, args.users, args.days, args.tasks_per_day)
+            print(f"seeded {args.users} users over {args.days} days in {time.perf_counter() - started:.1f}s")
+            time_calls("7 single days", single_day_calls, session, user_ids, first_day, args.days, args.samples)
+            time_calls("one range", range_call, session, user_ids, first_day, args.days, args.samples)
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Benchmark OCR throughput in pages per second for different OCR pool sizes.
+
+    python -m app.devtools.bench_ocr_pool --pages 24 --workers 1 4 8
+
+Writes a synthetic image-only PDF (no text layer, so every page goes through
+OCR) with task-list style lines, some struck through, then OCRs every page with
+each pool size. One worker uses the in-process path; larger sizes go through the
+page-parallel process pool. Each size gets one warm-up pass so model loading and
+process start-up are not counted. Needs the OCR engines and poppler installed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from PIL import Image, ImageDraw, ImageFont
+
+from app.core.config import settings
+from app.services.pdf_ingestions import ocr_pdf_lines, shutdown_ocr_pool
+
+PAGE_SIZE = (1275, 1650)  # US letter at 150 DPI
+TASK_WORDS = ["review", "draft", "email", "budget", "meeting", "notes", "deploy", "invoice", "plan", "call"]
+
+
+def write_synthetic_pdf(path: Path, pages: int, lines_per_page: int, seed: int) -> None:
+    rng = random.Random(seed)
+    font = ImageFont.load_default(size=28)
+    images = []
+    for page_number in range(pages):
+        image = Image.new("L", PAGE_SIZE, color=255)
+        draw = ImageDraw.Draw(image)
+        draw.text((90, 60), f"Daily plan - page {page_number + 1}", fill=0, font=font)
+        y = 140
+        for _ in range(lines_per_page):
+            words = " ".join(rng.choice(TASK_WORDS) for _ in range(rng.randint(2, 5)))
+            text = f"- {words.capitalize()} ({rng.choice([15, 30, 45, 60])} min)"
+            draw.text((90, y), text, fill=0, font=font)
+            if rng.random() < 0.25:
+                left, top, right, bottom = draw.textbbox((90, y), text, font=font)
+                middle = (top + bottom) // 2
+                draw.line((left, middle, right, middle), fill=0, width=3)
+            y += 60
+        images.append(image)
+    images[0].save(path, "PDF", resolution=150, save_all=True, append_images=images[1:])
+
+
+def time_pool_size(pdf_path: Path, workers: int, pages: int, repeats: int) -> None:
+    settings.ocr_pool_size = workers
+    shutdown_ocr_pool()
+    page_indices = list(range(pages))
+    ocr_pdf_lines(pdf_path, page_indices=page_indices[: max(workers, 1)])  # warm-up
+
+    durations = []
+    lines = 0
+    for _ in range(repeats):
+        started = time.perf_counter()
+        lines = len(ocr_pdf_lines(pdf_path, page_indices=page_indices))
+        durations.append(time.perf_counter() - started)
+    shutdown_ocr_pool()
+    best = min(durations)
+    print(
+        f"{workers:>3} worker(s)   {pages / statistics.median(durations):7.2f} pages/s median"
+        f"   {pages / best:7.2f} pages/s best   {lines} lines"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=24)
+    parser.add_argument("--lines-per-page", type=int, default=20)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument(
+        "--workers", type=int, nargs="+", default=None, help="Pool sizes to compare; defaults to 1, 4 and the CPU count."
+    )
+    args = parser.parse_args()
+    worker_counts = args.workers or sorted({1, 4, os.cpu_count() or 1})
+
+    # Document AI would bypass the local OCR path being measured.
+    settings.google_processor_id = None
+    settings.document_ai_fake_document_path = None
+    with tempfile.TemporaryDirectory() as scratch:
+        pdf_path = Path(scratch) / "bench.pdf"
+        write_synthetic_pdf(pdf_path, args.pages, args.lines_per_page, args.seed)
+        print(f"{args.pages} pages, {args.lines_per_page} lines each, {os.cpu_count()} CPUs")
+        for workers in worker_counts:
+            time_pool_size(pdf_path, workers, args.pages, args.repeats)
+
+
+if __name__ == "__main__":
+    main()
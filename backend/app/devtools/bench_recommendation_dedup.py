@@ -0,0 +1,135 @@
+"""Benchmark the recent-duplicate check against a large recommendation_history table.
+
+    python -m app.devtools.bench_recommendation_dedup --rows 1000000 --users 2000
+
+Builds a throwaway SQLite database (or uses --database-url), fills it with history
+spread over the last 60 days, then times the indexed key lookup used by
+`_filter_recent_duplicates` against the previous approach of loading every row
+from the last 15 days and building Python sets.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from uuid import uuid4
+
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.orm import Session
+
+from app.db.base import Base
+from app.models.recommendation_history import (
+    RecommendationHistory,
+    recommendation_title_key,
+    recommendation_url_key,
+)
+from app.models.user import User
+from app.schemas.recommendation import RecommendedTodo
+from app.services.recommendations import _recent_duplicate_keys
+
+CATEGORIES = ("Research", "Practice", "Share")
+INSERT_BATCH_SIZE = 20_000
+
+
+def populate(session: Session, rows: int, users: int) -> list[str]:
+    user_ids = [str(uuid4()) for _ in range(users)]
+    now = datetime.utcnow()
+    session.execute(
+        insert(User),
+        [{"id": user_id, "email": f"{user_id}@bench.local", "created_at": now, "updated_at": now} for user_id in user_ids],
+    )
+    batch: list[dict] = []
+    for index in range(rows):
+        title = f"{CATEGORIES[index % 3]}: topic {index}"
+        url = f"https://www.youtube.com/results?search_query=topic+{index}"
+        batch.append(
+            {
+                "id": str(uuid4()),
+                "user_id": user_ids[index % users],
+                "title": title,
+                "resource_url": url,
+                "title_key": recommendation_title_key(title),
+                "url_key": recommendation_url_key(url),
+                "category": CATEGORIES[index % 3],
+                "estimated_minutes": 30,
+                "created_at": now - timedelta(seconds=random.randint(0, 60 * 24 * 3600)),
+            }
+        )
+        if len(batch) >= INSERT_BATCH_SIZE:
+            session.execute(insert(RecommendationHistory), batch)
+            batch.clear()
+    if batch:
+        session.execute(insert(RecommendationHistory), batch)
+    session.commit()
+    return user_ids
+
+
+def legacy_scan(session: Session, user_id: str, todos: list[RecommendedTodo]) -> int:
+    cutoff = datetime.utcnow() - timedelta(days=15)
+    history = session.scalars(
+        select(RecommendationHistory).where(
+            RecommendationHistory.user_id == user_id, RecommendationHistory.created_at >= cutoff
+        )
+    ).all()
+    seen_titles = {entry.title.strip().lower() for entry in history if entry.title}
+    seen_urls = {entry.resource_url for entry in history if entry.resource_url}
+    return sum(1 for todo in todos if todo.title.strip().lower() in seen_titles or todo.resource_url in seen_urls)
+
+
+def indexed_lookup(session: Session, user_id: str, todos: list[RecommendedTodo]) -> int:
+    title_keys, url_keys = _recent_duplicate_keys(session, user_id, todos)
+    return len(title_keys) + len(url_keys)
+
+
+def time_calls(label: str, func, session: Session, user_ids: list[str], samples: int) -> None:
+    todos = [
+        RecommendedTodo(
+            title=f"{category}: candidate {index}",
+            description="Benchmark candidate todo.",
+            category=category,
+            estimated_minutes=30,
+            resource_url=f"https://example.com/{index}",
+        )
+        for index, category in enumerate(CATEGORIES)
+    ]
+    durations = []
+    for user_id in random.sample(user_ids, min(samples, len(user_ids))):
+        session.expunge_all()
+        started = time.perf_counter()
+        func(session, user_id, todos)
+        durations.append(time.perf_counter() - started)
+    durations.sort()
+    print(
+        f"{label:<15} p50 {statistics.median(durations) * 1000:8.2f} ms"
+        f"   p95 {durations[int(len(durations) * 0.95) - 1] * 1000:8.2f} ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--users", type=int, default=2_000)
+    parser.add_argument("--samples", type=int, default=200)
+    parser.add_argument("--database-url", default=None, help="Defaults to a temporary SQLite file.")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as scratch:
+        url = args.database_url or f"sqlite:///{Path(scratch) / 'bench.db'}"
+        engine = create_engine(url)
+        Base.metadata.create_all(engine, tables=[User.__table__, RecommendationHistory.__table__])
+        with Session(engine) as session:
+            started = time.perf_counter()
+            user_ids = populate(session, args.rows, args.users)
+            print(f"inserted {args.rows} rows for {args.users} users in {time.perf_counter() - started:.1f}s")
+            time_calls("legacy scan", legacy_scan, session, user_ids, args.samples)
+            time_calls("indexed lookup", indexed_lookup, session, user_ids, args.samples)
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""Benchmark OCR line normalization against the previous per-token difflib version.
+
+    python -m app.devtools.bench_text_normalization --lines 200000 --extra-words 3000
+
+Generates a synthetic corpus of OCR-like lines (misspelled vocabulary words,
+stray glyphs, known typos, noise tokens), checks that `TextNormalizer` returns
+exactly what the old `get_close_matches` loop returned for every line, then
+times both. `--extra-words` grows the fuzzy vocabulary to show how each version
+scales with it.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import re
+import string
+import time
+from difflib import get_close_matches
+from typing import Mapping, Sequence
+
+from app.services.text_normalization import (
+    CANONICAL_WORDS,
+    COMMON_FIXES,
+    FUZZY_CUTOFF,
+    REPLACEMENTS,
+    TextNormalizer,
+)
+
+NOISE_TOKENS = ["(30", "min)", "-", "@", "x2", "10:30", "w/", "&", "TODO", "Q4"]
+
+
+def legacy_normalize_line(
+    line: str, replacements: Mapping[str, str], common_fixes: Mapping[str, str], canonical_words: Sequence[str]
+) -> str:
+    """`normalize_text_line` as it was before `TextNormalizer`, with the vocabularies passed in."""
+    cleaned = line.strip()
+    for bad, good in replacements.items():
+        cleaned = cleaned.replace(bad, good)
+    cleaned = re.sub(r"\s{2,}", " ", cleaned)
+    lower = cleaned.lower()
+    for typo, correct in common_fixes.items():
+        if typo in lower:
+            cleaned = lower.replace(typo, correct)
+            lower = cleaned
+    words = []
+    for token in cleaned.split():
+        if len(token) < 3:
+            words.append(token)
+            continue
+        match = get_close_matches(token.lower().strip("-"), canonical_words, n=1, cutoff=FUZZY_CUTOFF)
+        if match:
+            replacement = match[0]
+            if token.istitle():
+                replacement = replacement.title()
+            words.append(replacement)
+        else:
+            words.append(token)
+    return " ".join(words).strip(" -–.")
+
+
+def build_vocabulary(rng: random.Random, extra_words: int) -> list[str]:
+    words = list(CANONICAL_WORDS)
+    seen = set(words)
+    while len(words) < len(CANONICAL_WORDS) + extra_words:
+        word = "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(4, 10)))
+        if word not in seen:
+            seen.add(word)
+            words.append(word)
+    return words
+
+
+def misspell(rng: random.Random, word: str) -> str:
+    chars = list(word)
+    for _ in range(rng.randint(0, 2)):
+        position = rng.randrange(len(chars))
+        action = rng.random()
+        if action < 0.4:
+            chars[position] = rng.choice(string.ascii_lowercase)
+        elif action < 0.7 and len(chars) > 3:
+            del chars[position]
+        else:
+            chars.insert(position, rng.choice(string.ascii_lowercase))
+    text = "".join(chars)
+    return text.title() if rng.random() < 0.3 else text
+
+
+def build_corpus(rng: random.Random, lines: int, vocabulary: Sequence[str]) -> list[str]:
+    glyphs = list(REPLACEMENTS)
+    typos = list(COMMON_FIXES)
+    corpus = []
+    for _ in range(lines):
+        tokens = []
+        for _ in range(rng.randint(2, 9)):
+            roll = rng.random()
+            if roll < 0.55:
+                tokens.append(misspell(rng, rng.choice(vocabulary)))
+            elif roll < 0.65:
+                tokens.append(rng.choice(typos))
+            elif roll < 0.75:
+                tokens.append(rng.choice(glyphs))
+            else:
+                tokens.append(rng.choice(NOISE_TOKENS))
+        separator = "  " if rng.random() < 0.2 else " "
+        corpus.append(rng.choice(["", "- ", "• "]) + separator.join(tokens))
+    return corpus
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lines", type=int, default=200_000)
+    parser.add_argument("--extra-words", type=int, default=0, help="Random words added to the fuzzy vocabulary.")
+    parser.add_argument("--seed", type=int, default=9)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    vocabulary = build_vocabulary(rng, args.extra_words)
+    # Misspellings are drawn mostly from the real vocabulary, like actual task lists.
+    corpus = build_corpus(rng, args.lines, list(CANONICAL_WORDS) * 4 + vocabulary)
+    print(f"{len(corpus)} lines, {len(vocabulary)} vocabulary words")
+
+    started = time.perf_counter()
+    expected = [legacy_normalize_line(line, REPLACEMENTS, COMMON_FIXES, vocabulary) for line in corpus]
+    legacy_seconds = time.perf_counter() - started
+
+    normalizer = TextNormalizer(REPLACEMENTS, COMMON_FIXES, vocabulary)
+    started = time.perf_counter()
+    actual = [normalizer.normalize(line) for line in corpus]
+    current_seconds = time.perf_counter() - started
+
+    mismatches = sum(1 for old, new in zip(expected, actual) if old != new)
+    print(f"legacy      {legacy_seconds:8.2f}s   {len(corpus) / legacy_seconds:10.0f} lines/s")
+    print(f"normalizer  {current_seconds:8.2f}s   {len(corpus) / current_seconds:10.0f} lines/s")
+    print(f"speedup     {legacy_seconds / current_seconds:8.1f}x   {mismatches} mismatched lines")
+    if mismatches:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,197 @@
+"""Minimal stand-in for the OpenAI Responses API, for local runs and load tests.
+
+    python -m app.devtools.fake_openai --port 8089 --latency 0.3
+    OPENAI_BASE_URL=http://127.0.0.1:8089/v1 OPENAI_API_KEY=fake uvicorn app.main:app
+
+Recommendation prompts get three canned todos; cleanup prompts get their OCR
+lines echoed back as a numbered list. `"stream": true` requests are answered as
+server-sent events with the text split into small deltas spread over the
+latency. `--fail-every N` answers every Nth request with a 500 so retry
+behaviour can be observed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import json
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+STREAM_CHUNK_CHARS = 24
+
+
+class FakeOpenAIServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 256
+
+    def __init__(self, address: tuple[str, int], latency: float = 0.0, fail_every: int = 0) -> None:
+        super().__init__(address, FakeOpenAIHandler)
+        self.latency = latency
+        self.fail_every = fail_every
+        self._counter = itertools.count(1)
+        self._counter_lock = threading.Lock()
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def next_request_number(self) -> int:
+        with self._counter_lock:
+            return next(self._counter)
+
+
+class FakeOpenAIHandler(BaseHTTPRequestHandler):
+    server: FakeOpenAIServer
+
+    def do_POST(self) -> None:  # noqa: N802
+        if self.path.rstrip("/") != "/v1/responses":
+            self._send_json(404, {"error": {"message": f"Unknown path {self.path}", "type": "invalid_request_error"}})
+            return
+        length = int(self.headers.get("content-length") or 0)
+        body = json.loads(self.rfile.read(length) or b"{}")
+
+        request_number = self.server.next_request_number()
+        if self.server.fail_every and request_number % self.server.fail_every == 0:
+            self._send_json(500, {"error": {"message": "Injected failure", "type": "server_error"}})
+            return
+
+        text = canned_response_text(_prompt_text(body.get("input")))
+        payload = _response_payload(body.get("model", "fake-model"), text)
+        if body.get("stream"):
+            self._send_stream(payload, text)
+            return
+        if self.server.latency:
+            time.sleep(self.server.latency)
+        self._send_json(200, payload)
+
+    def log_message(self, format: str, *args) -> None:  # noqa: A002
+        return
+
+    def _send_stream(self, payload: dict, text: str) -> None:
+        self.send_response(200)
+        self.send_header("content-type", "text/event-stream")
+        self.send_header("cache-control", "no-cache")
+        self.end_headers()
+
+        item_id = payload["output"][0]["id"]
+        chunks = [text[index : index + STREAM_CHUNK_CHARS] for index in range(0, len(text), STREAM_CHUNK_CHARS)]
+        pause = self.server.latency / (len(chunks) + 1) if chunks else self.server.latency
+        events = [{"type": "response.created", "response": {**payload, "status": "in_progress", "output": []}}]
+        events += [
+            {
+                "type": "response.output_text.delta",
+                "item_id": item_id,
+                "output_index": 0,
+                "content_index": 0,
+                "delta": chunk,
+                "logprobs": [],
+            }
+            for chunk in chunks
+        ]
+        events.append({"type": "response.completed", "response": payload})
+
+        for sequence_number, event in enumerate(events):
+            if event["type"] != "response.completed":
+                time.sleep(pause)
+            event["sequence_number"] = sequence_number
+            self.wfile.write(f"event: {event['type']}\ndata: {json.dumps(event)}\n\n".encode("utf-8"))
+            self.wfile.flush()
+        self.close_connection = True
+
+    def _send_json(self, status: int, payload: dict) -> None:
+        encoded = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("content-type", "application/json")
+        self.send_header("content-length", str(len(encoded)))
+        self.end_headers()
+        self.wfile.write(encoded)
+
+
+def canned_response_text(prompt: str) -> str:
+    if "recommended_todos" in prompt:
+        todos = [
+            {
+                "title": f"{category}: fake recommendation",
+                "description": f"A canned {category.lower()} task served by the fake OpenAI server.",
+                "category": category,
+                "estimated_minutes": minutes,
+                "resource_url": f"https://example.com/{category.lower()}",
+            }
+            for category, minutes in (("Research", 30), ("Practice", 25), ("Share", 20))
+        ]
+        return json.dumps({"recommended_todos": todos})
+
+    _, _, ocr_block = prompt.partition("OCR Input:")
+    items = [line.strip(" -") for line in ocr_block.split("Clean list:")[0].splitlines() if line.strip(" -")]
+    return "\n".join(f"{index}. {item}" for index, item in enumerate(items, start=1))
+
+
+def _prompt_text(raw_input) -> str:
+    if isinstance(raw_input, str):
+        return raw_input
+    if isinstance(raw_input, list):
+        parts = []
+        for message in raw_input:
+            content = message.get("content") if isinstance(message, dict) else None
+            if isinstance(content, str):
+                parts.append(content)
+            elif isinstance(content, list):
+                parts.extend(item.get("text", "") for item in content if isinstance(item, dict))
+        return "\n".join(parts)
+    return ""
+
+
+def _response_payload(model: str, text: str) -> dict:
+    return {
+        "id": f"resp_{uuid.uuid4().hex}",
+        "object": "response",
+        "created_at": int(time.time()),
+        "status": "completed",
+        "model": model,
+        "output": [
+            {
+                "id": f"msg_{uuid.uuid4().hex}",
+                "type": "message",
+                "status": "completed",
+                "role": "assistant",
+                "content": [{"type": "output_text", "text": text, "annotations": []}],
+            }
+        ],
+        "parallel_tool_calls": True,
+        "tool_choice": "auto",
+        "tools": [],
+    }
+
+
+def start_in_thread(host: str = "127.0.0.1", port: int = 0, latency: float = 0.0, fail_every: int = 0) -> FakeOpenAIServer:
+    """Start a server on a background thread; port 0 picks a free port. Call `shutdown()` when done."""
+    server = FakeOpenAIServer((host, port), latency=latency, fail_every=fail_every)
+    threading.Thread(target=server.serve_forever, name="fake-openai", daemon=True).start()
+    return server
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8089)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds to wait before answering each request.")
+    parser.add_argument("--fail-every", type=int, default=0, help="Answer every Nth request with a 500.")
+    args = parser.parse_args()
+
+    server = FakeOpenAIServer((args.host, args.port), latency=args.latency, fail_every=args.fail_every)
+    print(f"Fake OpenAI listening on {server.base_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
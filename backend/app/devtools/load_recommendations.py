@@ -0,0 +1,73 @@
+"""Fire concurrent requests at POST /api/v1/recommendations and report throughput.
+
+    python -m app.devtools.fake_openai --latency 2 &
+    OPENAI_BASE_URL=http://127.0.0.1:8089/v1 OPENAI_API_KEY=fake uvicorn app.main:app &
+    python -m app.devtools.load_recommendations --user-id <id> [<id> ...] --concurrency 200
+
+Identical concurrent requests are coalesced into one model call, so by default
+every request differs: they cycle through the given users and move the
+scheduled date one day forward per cycle, and all of them bypass the LLM
+response cache. Pass --identical to measure the coalesced path instead.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+from collections import Counter
+from datetime import date, timedelta
+
+import httpx
+
+
+def build_payloads(user_ids: list[str], concurrency: int, scheduled_date: date, identical: bool) -> list[dict]:
+    if identical:
+        return [{"user_id": user_ids[0], "scheduled_date": scheduled_date.isoformat()}] * concurrency
+    return [
+        {
+            "user_id": user_ids[index % len(user_ids)],
+            "scheduled_date": (scheduled_date + timedelta(days=index // len(user_ids))).isoformat(),
+            "bypass_cache": True,
+        }
+        for index in range(concurrency)
+    ]
+
+
+async def run(base_url: str, payloads: list[dict], concurrency: int) -> None:
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=120) as client:
+
+        async def one(payload: dict) -> tuple[int, float]:
+            started = time.perf_counter()
+            response = await client.post("/api/v1/recommendations", json=payload)
+            return response.status_code, time.perf_counter() - started
+
+        started = time.perf_counter()
+        results = await asyncio.gather(*(one(payload) for payload in payloads))
+        elapsed = time.perf_counter() - started
+
+    latencies = sorted(latency for _, latency in results)
+    print(f"requests:   {len(results)}  statuses: {dict(Counter(status for status, _ in results))}")
+    print(f"wall time:  {elapsed:.2f}s  throughput: {len(results) / elapsed:.1f} req/s")
+    print(
+        f"latency:    p50 {statistics.median(latencies):.2f}s"
+        f"  p95 {latencies[int(len(latencies) * 0.95) - 1]:.2f}s  max {latencies[-1]:.2f}s"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument("--user-id", nargs="+", required=True, help="One or more existing user ids to cycle through.")
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--scheduled-date", type=date.fromisoformat, default=date.today())
+    parser.add_argument("--identical", action="store_true", help="Send the same payload every time (coalesced).")
+    args = parser.parse_args()
+    payloads = build_payloads(args.user_id, args.concurrency, args.scheduled_date, args.identical)
+    asyncio.run(run(args.base_url, payloads, args.concurrency))
+
+
+if __name__ == "__main__":
+    main()
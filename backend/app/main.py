@@ -1,16 +1,48 @@
+import asyncio
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from app.api.middleware import UploadSizeLimitMiddleware
 from app.api.v1.router import api_v1_router
 from app.core.config import settings
+from app.core.executors import upload_executor
+from app.core.metrics import metrics
+from app.db.session import async_engine
+from app.services.ingestion_queue import ingestion_workers
+from app.services.llm_client import llm_client
+from app.services.ocr_engines import ocr_engines
+from app.services.pdf_ingestions import shutdown_ocr_pool
+from app.services.scheduled_jobs import scheduled_jobs
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI):
+    if settings.ocr_preload_on_startup:
+        await asyncio.to_thread(ocr_engines.warm)
+    ingestion_workers.start()
+    scheduled_jobs.start()
+    try:
+        yield
+    finally:
+        scheduled_jobs.stop()
+        ingestion_workers.stop()
+        upload_executor.shutdown()
+        shutdown_ocr_pool()
+        llm_client.close()
+        await llm_client.aclose()
+        await async_engine.dispose()
 
-app = FastAPI(title=settings.project_name)
+
+app = FastAPI(title=settings.project_name, lifespan=lifespan)
 
 allowed_origins = [
     "http://localhost:5173",
     "http://127.0.0.1:5173",
 ]
 
+app.add_middleware(UploadSizeLimitMiddleware)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=allowed_origins,
@@ -25,3 +57,8 @@ app.include_router(api_v1_router)
 @app.get("/healthz")
 def healthcheck():
     return {"status": "ok"}
+
+
+@app.get("/metrics")
+def read_metrics():
+    return metrics.snapshot()
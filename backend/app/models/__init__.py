@@ -1,6 +1,11 @@
 from app.models.availability import DailyAvailability
+from app.models.brief_cache import BriefCacheEntry, BriefCacheGeneration
+from app.models.brief_delivery import BriefDelivery
+from app.models.llm_response_cache import LLMResponseCache
 from app.models.pdf_ingestion import PDFIngestion
+from app.models.pdf_parse_cache import PDFParseCache
+from app.models.precomputed_recommendation import PrecomputedRecommendation
 from app.models.task import Task
 from app.models.user import Goal, User
 
-__all__ = ["User", "Goal", "Task", "DailyAvailability", "PDFIngestion"]
+__all__ = ["User", "Goal", "Task", "DailyAvailability", "PDFIngestion", "PDFParseCache", "LLMResponseCache", "PrecomputedRecommendation", "BriefCacheEntry", "BriefCacheGeneration", "BriefDelivery"]
@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, Integer, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class PDFParseCache(Base):
+    __tablename__ = "pdf_parse_cache"
+
+    content_hash: Mapped[str] = mapped_column(String(64), primary_key=True)
+    cache_version: Mapped[str] = mapped_column(String(64), nullable=False)
+    lines: Mapped[str] = mapped_column(Text, nullable=False)
+    cleaned_lines: Mapped[str] = mapped_column(Text, nullable=False)
+    page_engines: Mapped[str | None] = mapped_column(Text)
+    hit_count: Mapped[int] = mapped_column(Integer, default=0)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    last_used_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, index=True)
@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+from datetime import date, datetime
+from uuid import uuid4
+
+from sqlalchemy import Date, DateTime, ForeignKey, String, Text, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class PrecomputedRecommendation(Base):
+    __tablename__ = "precomputed_recommendation"
+    __table_args__ = (UniqueConstraint("user_id", "scheduled_date", name="uq_precomputed_recommendation_user_date"),)
+
+    id: Mapped[str] = mapped_column(String, primary_key=True, default=lambda: str(uuid4()))
+    user_id: Mapped[str] = mapped_column(ForeignKey("user.id"), nullable=False, index=True)
+    scheduled_date: Mapped[date] = mapped_column(Date, nullable=False, index=True)
+    input_fingerprint: Mapped[str] = mapped_column(String(64), nullable=False)
+    todos: Mapped[str] = mapped_column(Text, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    served_at: Mapped[datetime | None] = mapped_column(DateTime)
@@ -1,21 +1,40 @@
 from __future__ import annotations
 
+import hashlib
 from datetime import datetime
 from uuid import uuid4
 
-from sqlalchemy import DateTime, ForeignKey, String, Text
+from sqlalchemy import DateTime, ForeignKey, Index, String, Text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db.base import Base
 
 
+def recommendation_title_key(title: str) -> str:
+    return hashlib.sha256(title.strip().lower().encode("utf-8")).hexdigest()
+
+
+def recommendation_url_key(resource_url: str | None) -> str | None:
+    if not resource_url:
+        return None
+    return hashlib.sha256(resource_url.encode("utf-8")).hexdigest()
+
+
 class RecommendationHistory(Base):
     __tablename__ = "recommendation_history"
+    __table_args__ = (
+        Index("ix_recommendation_history_user_title_key", "user_id", "title_key", "created_at"),
+        Index("ix_recommendation_history_user_url_key", "user_id", "url_key", "created_at"),
+        # Retention purges walk the table oldest first.
+        Index("ix_recommendation_history_created_at", "created_at"),
+    )
 
     id: Mapped[str] = mapped_column(String, primary_key=True, default=lambda: str(uuid4()))
     user_id: Mapped[str] = mapped_column(ForeignKey("user.id"), nullable=False, index=True)
     title: Mapped[str] = mapped_column(Text, nullable=False)
     resource_url: Mapped[str | None] = mapped_column(Text, nullable=True)
+    title_key: Mapped[str] = mapped_column(String(64), nullable=False)
+    url_key: Mapped[str | None] = mapped_column(String(64), nullable=True)
     category: Mapped[str] = mapped_column(String(64), nullable=False)
     estimated_minutes: Mapped[int | None] = mapped_column()
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
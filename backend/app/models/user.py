@@ -3,13 +3,15 @@ from __future__ import annotations
 from datetime import datetime
 from uuid import uuid4
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
 
 
 class User(Base):
+    __table_args__ = (Index("ix_user_timezone_id", "timezone", "id"),)
+
     id: Mapped[str] = mapped_column(String, primary_key=True, default=lambda: str(uuid4()))
     email: Mapped[str] = mapped_column(String(255), unique=True, nullable=False, index=True)
     full_name: Mapped[str | None] = mapped_column(String(255), nullable=True)
@@ -32,6 +34,8 @@ class User(Base):
 
 
 class Goal(Base):
+    __table_args__ = (Index("ix_goal_user_id_created_at", "user_id", "created_at"),)
+
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     user_id: Mapped[str] = mapped_column(ForeignKey("user.id"), nullable=False)
     goal_statement: Mapped[str] = mapped_column(Text, nullable=False)
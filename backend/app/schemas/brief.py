@@ -10,6 +10,12 @@ class DailyBriefRequest(BaseModel):
     scheduled_date: date
 
 
+class DailyBriefRangeRequest(BaseModel):
+    user_id: str = Field(min_length=1)
+    start_date: date
+    end_date: date
+
+
 class LearningSuggestion(BaseModel):
     title: str
     description: str
@@ -12,10 +12,15 @@ class PDFIngestionRead(BaseModel):
     id: str
     user_id: str
     original_filename: str
+    scheduled_date: date | None = None
     status: str
+    page_engines: list[str] = Field(
+        default_factory=list, description="Engine per page: text, documentai, easyocr, tesseract or none."
+    )
     parsed_task_count: int
     error_message: str | None = None
     created_at: datetime
+    started_at: datetime | None = None
     completed_at: datetime | None = None
 
 
@@ -9,6 +9,9 @@ class RecommendationRequest(BaseModel):
     primary_goal: str | None = None
     secondary_goals: str | None = None
     skills_focus: str | None = None
+    bypass_cache: bool = Field(
+        default=False, description="Ask the model again even if an identical prompt was answered recently."
+    )
 
 
 class RecommendedTodo(BaseModel):
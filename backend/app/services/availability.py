@@ -7,6 +7,7 @@ from sqlalchemy.orm import Session
 
 from app.models.availability import DailyAvailability
 from app.schemas.availability import DailyAvailabilityCreate, DailyAvailabilityRead
+from app.services.brief_cache import brief_cache
 
 
 def upsert_daily_availability(db: Session, payload: DailyAvailabilityCreate) -> DailyAvailability:
@@ -27,6 +28,7 @@ def upsert_daily_availability(db: Session, payload: DailyAvailabilityCreate) ->
 
     db.commit()
     db.refresh(availability)
+    brief_cache.invalidate(availability.user_id, availability.day)
     return availability
 
 
@@ -0,0 +1,305 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from datetime import date, datetime, timedelta
+from typing import Protocol
+
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.metrics import metrics
+from app.db.session import SessionLocal
+from app.models.brief_cache import BriefCacheEntry, BriefCacheGeneration
+from app.schemas.brief import DailyBrief
+
+logger = logging.getLogger(__name__)
+
+
+class BriefCacheBackend(Protocol):
+    """Storage for serialized briefs keyed by (user_id, brief_date).
+
+    Each user also has a generation that every `delete` bumps. `set` stores only
+    when the generation still equals the one read before the brief was built, so
+    a build that raced an invalidation is dropped rather than cached.
+    """
+
+    def get_many(self, user_id: str, brief_dates: Iterable[date]) -> dict[date, str]:
+        """Unexpired payloads for whichever of `brief_dates` are cached."""
+        ...
+
+    def generation(self, user_id: str) -> int: ...
+
+    def set_many(self, user_id: str, payloads: dict[date, str], ttl_seconds: int, generation: int) -> None:
+        """Store every payload, or none of them if the user's generation has moved past `generation`."""
+        ...
+
+    def delete(self, user_id: str, brief_dates: Iterable[date] | None) -> None:
+        """Bump the user's generation and drop the given dates, or every date when `brief_dates` is None."""
+        ...
+
+
+class MemoryBriefCacheBackend:
+    """Per-process LRU. Invalidations only reach the process that made the change.
+
+    Generations come from one process-wide counter, and only the most recently
+    invalidated `max_entries` users keep their own. Users without one report
+    `_floor`, which is raised to the counter whenever a generation is evicted, so
+    a build that started before an evicted invalidation can never match again.
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[tuple[str, date], tuple[float, str]] = OrderedDict()
+        self._generations: OrderedDict[str, int] = OrderedDict()
+        self._counter = 0
+        self._floor = 0
+
+    def get_many(self, user_id: str, brief_dates: Iterable[date]) -> dict[date, str]:
+        now = time.monotonic()
+        payloads: dict[date, str] = {}
+        with self._lock:
+            for brief_date in brief_dates:
+                key = (user_id, brief_date)
+                entry = self._entries.get(key)
+                if entry is None:
+                    continue
+                if entry[0] <= now:
+                    del self._entries[key]
+                    continue
+                self._entries.move_to_end(key)
+                payloads[brief_date] = entry[1]
+        return payloads
+
+    def generation(self, user_id: str) -> int:
+        with self._lock:
+            return self._generations.get(user_id, self._floor)
+
+    def set_many(self, user_id: str, payloads: dict[date, str], ttl_seconds: int, generation: int) -> None:
+        expires_at = time.monotonic() + ttl_seconds
+        with self._lock:
+            if self._generations.get(user_id, self._floor) != generation:
+                return
+            for brief_date, payload in payloads.items():
+                key = (user_id, brief_date)
+                self._entries[key] = (expires_at, payload)
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, user_id: str, brief_dates: Iterable[date] | None) -> None:
+        with self._lock:
+            self._counter += 1
+            self._generations[user_id] = self._counter
+            self._generations.move_to_end(user_id)
+            while len(self._generations) > self.max_entries:
+                self._generations.popitem(last=False)
+                self._floor = self._counter
+            if brief_dates is None:
+                for key in [key for key in self._entries if key[0] == user_id]:
+                    del self._entries[key]
+                return
+            for brief_date in brief_dates:
+                self._entries.pop((user_id, brief_date), None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._generations.clear()
+            self._floor = self._counter
+
+
+class DatabaseBriefCacheBackend:
+    """Shared across API workers through the `brief_cache` table.
+
+    Uses its own short sessions, so caching never joins the caller's transaction,
+    and errors only log, so a broken cache degrades to rebuilding the brief.
+    """
+
+    def get_many(self, user_id: str, brief_dates: Iterable[date]) -> dict[date, str]:
+        try:
+            with SessionLocal() as db:
+                rows = db.execute(
+                    select(BriefCacheEntry.brief_date, BriefCacheEntry.payload).where(
+                        BriefCacheEntry.user_id == user_id,
+                        BriefCacheEntry.brief_date.in_(list(brief_dates)),
+                        BriefCacheEntry.expires_at > datetime.utcnow(),
+                    )
+                ).all()
+                return dict(rows)
+        except SQLAlchemyError as exc:
+            logger.warning("Brief cache lookup failed: %s", exc)
+            return {}
+
+    def generation(self, user_id: str) -> int:
+        try:
+            with SessionLocal() as db:
+                return _stored_generation(db, user_id)
+        except SQLAlchemyError as exc:
+            logger.warning("Brief cache generation lookup failed: %s", exc)
+            # Matches no stored generation, so the brief is served but not cached.
+            return -1
+
+    def set_many(self, user_id: str, payloads: dict[date, str], ttl_seconds: int, generation: int) -> None:
+        if not payloads:
+            return
+        now = datetime.utcnow()
+        expires_at = now + timedelta(seconds=ttl_seconds)
+        try:
+            with SessionLocal() as db:
+                if not _claim_generation(db, user_id, generation):
+                    metrics.increment("brief_cache.stale_store")
+                    return
+                # The claim holds the generation row lock, so replacing the rows cannot race another store.
+                db.execute(
+                    delete(BriefCacheEntry).where(
+                        BriefCacheEntry.user_id == user_id, BriefCacheEntry.brief_date.in_(list(payloads))
+                    )
+                )
+                db.execute(
+                    insert(BriefCacheEntry),
+                    [
+                        {
+                            "user_id": user_id,
+                            "brief_date": brief_date,
+                            "payload": payload,
+                            "created_at": now,
+                            "expires_at": expires_at,
+                        }
+                        for brief_date, payload in payloads.items()
+                    ],
+                )
+                db.commit()
+        except IntegrityError:
+            # An invalidation created the generation row first; the build is stale.
+            metrics.increment("brief_cache.stale_store")
+        except SQLAlchemyError as exc:
+            logger.warning("Brief cache store failed: %s", exc)
+
+    def delete(self, user_id: str, brief_dates: Iterable[date] | None) -> None:
+        stmt = delete(BriefCacheEntry).where(BriefCacheEntry.user_id == user_id)
+        if brief_dates is not None:
+            stmt = stmt.where(BriefCacheEntry.brief_date.in_(list(brief_dates)))
+        for _ in range(2):
+            try:
+                with SessionLocal() as db:
+                    _bump_generation(db, user_id)
+                    db.execute(stmt)
+                    db.commit()
+                return
+            except IntegrityError:
+                # A concurrent store created the generation row first; bump it on the second pass.
+                continue
+            except SQLAlchemyError as exc:
+                logger.warning("Brief cache invalidation failed: %s", exc)
+                return
+
+
+def _stored_generation(db: Session, user_id: str) -> int:
+    stmt = select(BriefCacheGeneration.generation).where(BriefCacheGeneration.user_id == user_id)
+    return db.scalar(stmt) or 0
+
+
+def _claim_generation(db: Session, user_id: str, generation: int) -> bool:
+    """Lock the user's generation row if it still equals `generation`.
+
+    The no-op UPDATE takes the row lock (the write lock on SQLite), so an
+    invalidation cannot commit between this check and the caller's commit.
+    """
+    matched = db.execute(
+        update(BriefCacheGeneration)
+        .where(BriefCacheGeneration.user_id == user_id, BriefCacheGeneration.generation == generation)
+        .values(generation=BriefCacheGeneration.generation)
+    ).rowcount
+    if matched:
+        return True
+    if generation != 0 or _stored_generation(db, user_id) != 0:
+        return False
+    # Never invalidated yet: create the row so a concurrent invalidation has something to wait on.
+    db.add(BriefCacheGeneration(user_id=user_id, generation=0))
+    db.flush()
+    return True
+
+
+def _bump_generation(db: Session, user_id: str) -> None:
+    bumped = db.execute(
+        update(BriefCacheGeneration)
+        .where(BriefCacheGeneration.user_id == user_id)
+        .values(generation=BriefCacheGeneration.generation + 1, updated_at=datetime.utcnow())
+    ).rowcount
+    if not bumped:
+        db.add(BriefCacheGeneration(user_id=user_id, generation=1))
+        db.flush()
+
+
+class BriefCache:
+    """Caches `DailyBrief`s per (user, date) until a task, availability or goal change invalidates them.
+
+    Every mutation of a brief's inputs calls `invalidate` after its commit. The
+    TTL only bounds staleness from writes that bypass the services. The
+    backend's per-user generation keeps a build that raced an invalidation from
+    being stored; with the database backend that holds across API workers.
+    """
+
+    def __init__(self, backend: BriefCacheBackend | None, ttl_seconds: int) -> None:
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+
+    def get_or_build(self, user_id: str, brief_date: date, build: Callable[[], DailyBrief]) -> DailyBrief:
+        return self.get_many_or_build(user_id, [brief_date], lambda _: {brief_date: build()})[brief_date]
+
+    def get_many_or_build(
+        self,
+        user_id: str,
+        brief_dates: list[date],
+        build_missing: Callable[[list[date]], dict[date, DailyBrief]],
+    ) -> dict[date, DailyBrief]:
+        """Cached briefs for `brief_dates`, with every miss built by one `build_missing` call."""
+        if self.backend is None or self.ttl_seconds <= 0:
+            return build_missing(brief_dates)
+
+        briefs = {
+            brief_date: DailyBrief.model_validate_json(payload)
+            for brief_date, payload in self.backend.get_many(user_id, brief_dates).items()
+        }
+        missing = [brief_date for brief_date in brief_dates if brief_date not in briefs]
+        if briefs:
+            metrics.increment("brief_cache.hit", len(briefs))
+        if not missing:
+            return briefs
+
+        metrics.increment("brief_cache.miss", len(missing))
+        generation = self.backend.generation(user_id)
+        built = build_missing(missing)
+        self.backend.set_many(
+            user_id, {brief_date: brief.model_dump_json() for brief_date, brief in built.items()}, self.ttl_seconds, generation
+        )
+        briefs.update(built)
+        return briefs
+
+    def invalidate(self, user_id: str, *brief_dates: date | None) -> None:
+        """Forget the user's briefs for `brief_dates`, or for every date when none are given."""
+        if self.backend is None:
+            return
+        dates = {brief_date for brief_date in brief_dates if brief_date is not None}
+        if brief_dates and not dates:
+            return
+        metrics.increment("brief_cache.invalidations")
+        self.backend.delete(user_id, dates or None)
+
+
+def _build_backend() -> BriefCacheBackend | None:
+    if settings.brief_cache_backend == "database":
+        return DatabaseBriefCacheBackend()
+    if settings.brief_cache_backend == "memory":
+        return MemoryBriefCacheBackend(settings.brief_cache_max_entries)
+    return None
+
+
+brief_cache = BriefCache(_build_backend(), settings.brief_cache_ttl_seconds)
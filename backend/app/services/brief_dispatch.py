@@ -0,0 +1,306 @@
+from __future__ import annotations
+
+import asyncio
+import html
+import logging
+import random
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import date, datetime, timezone
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from sqlalchemy import or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.metrics import metrics
+from app.db.session import AsyncSessionLocal
+from app.models.brief_delivery import BriefDelivery
+from app.models.user import User
+from app.schemas.brief import DailyBrief
+from app.services.briefs import build_briefs_for_users
+from app.services.mail import MailDeliveryError, MailMessage, MailTransport, build_mail_transport
+
+logger = logging.getLogger(__name__)
+
+UTC = ZoneInfo("UTC")
+
+
+@dataclass
+class DispatchResult:
+    run_at: datetime
+    due_timezones: dict[str | None, date] = field(default_factory=dict)
+    users_due: int = 0
+    sent: int = 0
+    failed: int = 0
+    skipped: int = 0
+    pages: int = 0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def per_second(self) -> float:
+        return self.sent / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+
+@dataclass
+class _Recipient:
+    user_id: str
+    email: str
+    full_name: str | None
+    brief_date: date
+
+
+def due_timezones(timezones: Iterable[str | None], now: datetime, send_hour: int) -> dict[str | None, date]:
+    """The timezones (as stored on users) where it is currently `send_hour`, each with its local date.
+
+    Missing or unknown timezone names are treated as UTC.
+    """
+    due: dict[str | None, date] = {}
+    for name in timezones:
+        local = now.astimezone(_zone(name))
+        if local.hour == send_hour:
+            due[name] = local.date()
+    return due
+
+
+async def dispatch_daily_briefs(
+    now: datetime | None = None,
+    *,
+    transport: MailTransport | None = None,
+    concurrency: int | None = None,
+    page_size: int | None = None,
+) -> DispatchResult:
+    """Email today's brief to every user whose local time is at the send hour.
+
+    Meant to run at the top of every hour. Only the timezones that are due are
+    queried; their users are read in id-ordered pages, each page's briefs are
+    built in a few batched queries, and the emails go out with bounded
+    concurrency and retries. A `brief_delivery` row per user and date makes a
+    rerun skip users that already got their brief.
+    """
+    now = now or datetime.now(timezone.utc)
+    if now.tzinfo is None:
+        now = now.replace(tzinfo=timezone.utc)
+    result = DispatchResult(run_at=now)
+    started = time.perf_counter()
+
+    async with AsyncSessionLocal() as db:
+        timezones = (await db.scalars(select(User.timezone).distinct())).all()
+    result.due_timezones = due_timezones(timezones, now, settings.daily_brief_default_send_hour)
+    if not result.due_timezones:
+        return result
+
+    owns_transport = transport is None
+    transport = transport or build_mail_transport()
+    semaphore = asyncio.Semaphore(concurrency or settings.brief_dispatch_concurrency)
+    page_size = page_size or settings.brief_dispatch_page_size
+
+    named = [name for name in result.due_timezones if name is not None]
+    due_filter = User.timezone.in_(named)
+    if None in result.due_timezones:
+        due_filter = or_(due_filter, User.timezone.is_(None))
+
+    async def send_page(
+        pending: list[_Recipient],
+        briefs: dict[str, DailyBrief],
+        deliveries: dict[str, BriefDelivery],
+        page_started: float,
+    ) -> None:
+        outcomes = await asyncio.gather(
+            *(
+                _deliver(transport, semaphore, recipient, briefs[recipient.user_id])
+                for recipient in pending
+                if recipient.user_id in briefs
+            )
+        )
+        async with db_lock:
+            await _record(outcomes, deliveries)
+        for outcome in outcomes:
+            if outcome.message_id is not None:
+                result.sent += 1
+            else:
+                result.failed += 1
+        metrics.observe("brief_dispatch.page_seconds", time.perf_counter() - page_started)
+
+    # The next page is read and built while the previous one is still sending. Its
+    # database work still takes turns with recording the previous page, because on
+    # SQLite an open read transaction blocks the other connection's commit.
+    db_lock = asyncio.Lock()
+    sending: asyncio.Task | None = None
+    try:
+        last_user_id = ""
+        while True:
+            page_started = time.perf_counter()
+            async with db_lock, AsyncSessionLocal() as db:
+                rows = (
+                    await db.execute(
+                        select(User.id, User.email, User.full_name, User.timezone)
+                        .where(due_filter, User.id > last_user_id)
+                        .order_by(User.id)
+                        .limit(page_size)
+                    )
+                ).all()
+                if not rows:
+                    break
+                last_user_id = rows[-1].id
+                result.pages += 1
+                result.users_due += len(rows)
+                recipients = [
+                    _Recipient(row.id, row.email, row.full_name, result.due_timezones[row.timezone]) for row in rows
+                ]
+                deliveries = await _existing_deliveries(db, recipients)
+                pending = [r for r in recipients if _needs_delivery(deliveries.get(r.user_id))]
+                result.skipped += len(recipients) - len(pending)
+                with metrics.timer("brief_dispatch.build_seconds"):
+                    briefs = await db.run_sync(
+                        build_briefs_for_users, {recipient.user_id: recipient.brief_date for recipient in pending}
+                    )
+                # Release the connection before the sends.
+                await db.commit()
+
+            if sending is not None:
+                await sending
+            sending = asyncio.create_task(send_page(pending, briefs, deliveries, page_started))
+        if sending is not None:
+            await sending
+    finally:
+        if sending is not None and not sending.done():
+            sending.cancel()
+            await asyncio.gather(sending, return_exceptions=True)
+        if owns_transport:
+            await transport.aclose()
+
+    result.elapsed_seconds = time.perf_counter() - started
+    metrics.increment("brief_dispatch.sent", result.sent)
+    metrics.increment("brief_dispatch.failed", result.failed)
+    metrics.increment("brief_dispatch.skipped", result.skipped)
+    metrics.observe("brief_dispatch.run_seconds", result.elapsed_seconds)
+    logger.info(
+        "Dispatched briefs for %s timezone(s): %s sent, %s failed, %s skipped of %s users in %.1fs (%.0f/s)",
+        len(result.due_timezones),
+        result.sent,
+        result.failed,
+        result.skipped,
+        result.users_due,
+        result.elapsed_seconds,
+        result.per_second,
+    )
+    return result
+
+
+def render_brief_email(email: str, full_name: str | None, brief: DailyBrief) -> MailMessage:
+    day = brief.scheduled_date
+    subject = f"Your plan for {day:%A}, {day:%B} {day.day}"
+    first_name = (full_name or "").split()[:1]
+    greeting = f"Good morning, {first_name[0]}!" if first_name else "Good morning!"
+
+    text_lines = [greeting, "", f"Goal: {brief.goal_statement}", "", f"Tasks ({brief.total_task_minutes} min):"]
+    for task in brief.tasks:
+        text_lines.append(f"- {task.title}" + (f" ({task.estimated_minutes} min)" if task.estimated_minutes else ""))
+    if not brief.tasks:
+        text_lines.append("- Nothing scheduled yet.")
+    text_lines += ["", "Learning suggestions:"]
+    text_lines += [f"- {item.title} ({item.time_minutes} min)" for item in brief.learning_suggestions]
+
+    task_items = "".join(
+        f"<li>{html.escape(task.title)}"
+        + (f" <small>({task.estimated_minutes} min)</small>" if task.estimated_minutes else "")
+        + "</li>"
+        for task in brief.tasks
+    ) or "<li>Nothing scheduled yet.</li>"
+    suggestion_items = "".join(
+        f"<li><strong>{html.escape(item.title)}</strong> ({item.time_minutes} min)"
+        f"<br>{html.escape(item.description)}</li>"
+        for item in brief.learning_suggestions
+    )
+    body = (
+        f"<p>{html.escape(greeting)}</p>"
+        f"<p><strong>Goal:</strong> {html.escape(brief.goal_statement)}</p>"
+        f"<h3>Tasks ({brief.total_task_minutes} min)</h3><ul>{task_items}</ul>"
+        f"<h3>Learning suggestions</h3><ul>{suggestion_items}</ul>"
+    )
+    return MailMessage(to=email, subject=subject, html=body, text="\n".join(text_lines))
+
+
+@dataclass
+class _Outcome:
+    recipient: _Recipient
+    attempts: int
+    message_id: str | None = None
+    error: str | None = None
+    retryable: bool = True
+
+
+async def _deliver(
+    transport: MailTransport, semaphore: asyncio.Semaphore, recipient: _Recipient, brief: DailyBrief
+) -> _Outcome:
+    message = render_brief_email(recipient.email, recipient.full_name, brief)
+    max_attempts = settings.brief_dispatch_max_attempts
+    for attempt in range(1, max_attempts + 1):
+        try:
+            # Only the send holds a slot; backoff sleeps do not.
+            async with semaphore:
+                with metrics.timer("brief_dispatch.send_seconds"):
+                    message_id = await transport.send(message)
+            return _Outcome(recipient, attempt, message_id=message_id)
+        except MailDeliveryError as exc:
+            if not exc.retryable or attempt == max_attempts:
+                logger.warning("Brief email to user=%s failed after %s attempt(s): %s", recipient.user_id, attempt, exc)
+                return _Outcome(recipient, attempt, error=str(exc), retryable=exc.retryable)
+            metrics.increment("brief_dispatch.retries")
+            delay = settings.brief_dispatch_retry_base_delay_seconds * 2 ** (attempt - 1)
+            await asyncio.sleep(random.uniform(delay / 2, delay))
+    return _Outcome(recipient, max_attempts, error="no attempts made")  # pragma: no cover
+
+
+async def _existing_deliveries(db: AsyncSession, recipients: list[_Recipient]) -> dict[str, BriefDelivery]:
+    brief_dates = {recipient.brief_date for recipient in recipients}
+    by_user = {recipient.user_id: recipient.brief_date for recipient in recipients}
+    rows = await db.scalars(
+        select(BriefDelivery).where(
+            BriefDelivery.user_id.in_(list(by_user)), BriefDelivery.brief_date.in_(brief_dates)
+        )
+    )
+    return {row.user_id: row for row in rows if by_user[row.user_id] == row.brief_date}
+
+
+def _needs_delivery(delivery: BriefDelivery | None) -> bool:
+    if delivery is None:
+        return True
+    # Failed sends get another try on a rerun; messages the provider rejected do not.
+    return delivery.status == "failed" and delivery.attempts < settings.brief_dispatch_max_attempts
+
+
+async def _record(outcomes: list[_Outcome], deliveries: dict[str, BriefDelivery]) -> None:
+    if not outcomes:
+        return
+    now = datetime.utcnow()
+    async with AsyncSessionLocal() as db:
+        for outcome in outcomes:
+            existing = deliveries.get(outcome.recipient.user_id)
+            if existing is not None:
+                delivery = await db.merge(existing)
+            else:
+                delivery = BriefDelivery(
+                    user_id=outcome.recipient.user_id, brief_date=outcome.recipient.brief_date, attempts=0
+                )
+            delivery.attempts = (delivery.attempts or 0) + outcome.attempts
+            if outcome.message_id is not None:
+                delivery.status = "sent"
+            else:
+                delivery.status = "failed" if outcome.retryable else "rejected"
+            delivery.provider_message_id = outcome.message_id
+            delivery.error_message = outcome.error
+            delivery.sent_at = now if outcome.message_id is not None else None
+            db.add(delivery)
+        await db.commit()
+
+
+def _zone(name: str | None) -> ZoneInfo:
+    if not name:
+        return UTC
+    try:
+        return ZoneInfo(name)
+    except (ZoneInfoNotFoundError, ValueError):
+        return UTC
@@ -1,30 +1,137 @@
 from __future__ import annotations
 
-from datetime import date
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import date, timedelta
 
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
+from app.core.config import settings
+from app.models.availability import DailyAvailability
+from app.models.task import Task
+from app.models.user import Goal, User
 from app.schemas.brief import DailyBrief, LearningSuggestion
 from app.schemas.task import TaskRead
-from app.services import availability as availability_service
 from app.services import tasks as task_service
-from app.services import users as user_service
+from app.services.brief_cache import brief_cache
+
+
+@dataclass
+class BriefInputs:
+    goal_statement: str | None
+    minutes_available: int | None
 
 
 def generate_daily_brief(db: Session, user_id: str, brief_date: date) -> DailyBrief:
-    user = user_service.get_user(db, user_id)
-    if user is None:
-        raise ValueError("User not found")
+    return brief_cache.get_or_build(user_id, brief_date, lambda: _build_daily_brief(db, user_id, brief_date))
+
+
+def generate_daily_briefs(db: Session, user_id: str, start_date: date, end_date: date) -> list[DailyBrief]:
+    """Briefs for every day from `start_date` to `end_date` inclusive, sharing one query per table."""
+    if end_date < start_date:
+        raise ValueError("end_date must not be before start_date")
+    days = (end_date - start_date).days + 1
+    if days > settings.brief_range_max_days:
+        raise ValueError(f"Brief ranges are limited to {settings.brief_range_max_days} days")
+
+    brief_dates = [start_date + timedelta(days=offset) for offset in range(days)]
+    briefs = brief_cache.get_many_or_build(
+        user_id, brief_dates, lambda missing: _build_daily_briefs(db, user_id, missing)
+    )
+    return [briefs[brief_date] for brief_date in brief_dates]
+
+
+def _build_daily_brief(db: Session, user_id: str, brief_date: date) -> DailyBrief:
+    inputs = load_brief_inputs(db, user_id, brief_date)
+    if inputs is None:
+        raise LookupError("User not found")
 
     raw_tasks = task_service.list_tasks_for_day(db, user_id=user_id, scheduled_day=brief_date)
+    return _assemble_brief(user_id, brief_date, inputs, raw_tasks)
+
+
+def _build_daily_briefs(db: Session, user_id: str, brief_dates: list[date]) -> dict[date, DailyBrief]:
+    first, last = min(brief_dates), max(brief_dates)
+    goal_row = db.execute(select(_latest_goal_statement()).where(User.id == user_id)).first()
+    if goal_row is None:
+        raise LookupError("User not found")
+
+    minutes_by_day = dict(
+        db.execute(
+            select(DailyAvailability.day, DailyAvailability.minutes_available).where(
+                DailyAvailability.user_id == user_id, DailyAvailability.day.between(first, last)
+            )
+        ).all()
+    )
+    tasks_by_day: dict[date, list[Task]] = defaultdict(list)
+    for task in db.scalars(
+        select(Task)
+        .where(Task.user_id == user_id, Task.scheduled_date.between(first, last))
+        .order_by(Task.scheduled_date, Task.created_at)
+    ):
+        tasks_by_day[task.scheduled_date].append(task)
+
+    return {
+        brief_date: _assemble_brief(
+            user_id,
+            brief_date,
+            BriefInputs(goal_statement=goal_row[0], minutes_available=minutes_by_day.get(brief_date)),
+            tasks_by_day.get(brief_date, []),
+        )
+        for brief_date in brief_dates
+    }
+
+
+def build_briefs_for_users(db: Session, user_dates: dict[str, date]) -> dict[str, DailyBrief]:
+    """Briefs for a page of users, each for its own date, in three queries whatever the page size.
+
+    Used by the email dispatch, which would otherwise pay two queries per user.
+    Users that do not exist are left out of the result.
+    """
+    if not user_dates:
+        return {}
+    user_ids = list(user_dates)
+    brief_dates = set(user_dates.values())
+
+    goals = dict(db.execute(select(User.id, _latest_goal_statement()).where(User.id.in_(user_ids))).all())
+    minutes = {
+        (user_id, day): minutes_available
+        for user_id, day, minutes_available in db.execute(
+            select(DailyAvailability.user_id, DailyAvailability.day, DailyAvailability.minutes_available).where(
+                DailyAvailability.user_id.in_(user_ids), DailyAvailability.day.in_(brief_dates)
+            )
+        )
+    }
+    tasks_by_user: dict[str, list[Task]] = defaultdict(list)
+    for task in db.scalars(
+        select(Task)
+        .where(Task.user_id.in_(user_ids), Task.scheduled_date.in_(brief_dates))
+        .order_by(Task.user_id, Task.created_at)
+    ):
+        if task.scheduled_date == user_dates[task.user_id]:
+            tasks_by_user[task.user_id].append(task)
+
+    return {
+        user_id: _assemble_brief(
+            user_id,
+            brief_date,
+            BriefInputs(goal_statement=goals[user_id], minutes_available=minutes.get((user_id, brief_date))),
+            tasks_by_user.get(user_id, []),
+        )
+        for user_id, brief_date in user_dates.items()
+        if user_id in goals
+    }
+
+
+def _assemble_brief(user_id: str, brief_date: date, inputs: BriefInputs, raw_tasks: list[Task]) -> DailyBrief:
     tasks = [task_service.serialize_task(t) for t in raw_tasks]
     total_task_minutes = sum(filter(None, (task.estimated_minutes for task in tasks)))
 
-    availability = availability_service.get_daily_availability(db, user_id=user_id, day=brief_date)
-    learning_minutes_budget = max(((availability.minutes_available if availability else 0) - total_task_minutes), 0)
+    learning_minutes_budget = max(((inputs.minutes_available or 0) - total_task_minutes), 0)
 
     suggestion_payload = build_learning_suggestions(
-        goal_statement=(user.goals[-1].goal_statement if user.goals else "Stay productive"),
+        goal_statement=inputs.goal_statement or "Stay productive",
         minutes_budget=learning_minutes_budget,
     )
 
@@ -38,6 +145,34 @@ def generate_daily_brief(db: Session, user_id: str, brief_date: date) -> DailyBr
     )
 
 
+def load_brief_inputs(db: Session, user_id: str, brief_date: date) -> BriefInputs | None:
+    """Latest goal statement and the day's availability in one query, or None if the user does not exist.
+
+    Only the latest goal is read, instead of loading the whole `User.goals`
+    relationship to look at its last element.
+    """
+    minutes_available = (
+        select(DailyAvailability.minutes_available)
+        .where(DailyAvailability.user_id == User.id, DailyAvailability.day == brief_date)
+        .limit(1)
+        .scalar_subquery()
+    )
+    row = db.execute(select(_latest_goal_statement(), minutes_available).where(User.id == user_id)).first()
+    if row is None:
+        return None
+    return BriefInputs(goal_statement=row[0], minutes_available=row[1])
+
+
+def _latest_goal_statement():
+    return (
+        select(Goal.goal_statement)
+        .where(Goal.user_id == User.id)
+        .order_by(Goal.created_at.desc(), Goal.id.desc())
+        .limit(1)
+        .scalar_subquery()
+    )
+
+
 def build_learning_suggestions(goal_statement: str, minutes_budget: int) -> dict:
     categories = [
         ("Skill Drill", "Hands-on exercise to sharpen a critical capability."),
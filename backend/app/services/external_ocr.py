@@ -1,42 +1,161 @@
 from __future__ import annotations
 
 import json
+import threading
+import time
 from pathlib import Path
-from typing import Iterable
+from typing import Any, Iterable
 
+from google.api_core.client_options import ClientOptions
 from google.cloud import documentai_v1 as documentai
 
 from app.core.config import settings
+from app.core.metrics import metrics
 
 
-def use_document_ai(pdf_path: Path) -> list[dict]:
-    project_id = settings.google_project_id
-    location = settings.google_location
-    processor_id = settings.google_processor_id
-    credentials_path = settings.google_credentials_path
+class FakeDocumentProcessor:
+    """Offline stand-in for `DocumentProcessorServiceClient` that answers with a canned `Document`.
 
-    if not (project_id and processor_id and credentials_path):
+    The document is loaded from JSON (as exported by Document AI) once. Page
+    selectors in the request are honoured, and an optional fixed latency makes
+    the path usable for benchmarks.
+    """
+
+    def __init__(self, document: documentai.Document, latency_seconds: float = 0.0) -> None:
+        self.document = document
+        self.latency_seconds = latency_seconds
+
+    @classmethod
+    def from_json_file(cls, path: str | Path, latency_seconds: float = 0.0) -> FakeDocumentProcessor:
+        document = documentai.Document.from_json(Path(path).read_text(encoding="utf-8"), ignore_unknown_fields=True)
+        return cls(document, latency_seconds)
+
+    @staticmethod
+    def processor_path(project: str, location: str, processor: str) -> str:
+        return documentai.DocumentProcessorServiceClient.processor_path(project, location, processor)
+
+    def process_document(
+        self, request: documentai.ProcessRequest, timeout: float | None = None
+    ) -> documentai.ProcessResponse:
+        if self.latency_seconds:
+            time.sleep(self.latency_seconds)
+        document = documentai.Document.deserialize(documentai.Document.serialize(self.document))
+        selected = set(request.process_options.individual_page_selector.pages)
+        if selected:
+            kept = [page for page in document.pages if page.page_number in selected]
+            del document.pages[:]
+            document.pages.extend(kept)
+        return documentai.ProcessResponse(document=document)
+
+
+class DocumentAIClientHolder:
+    """Process-wide Document AI client, created on first use and reused for every request.
+
+    Building a client parses the service account file and opens a gRPC channel, so
+    doing it per upload dominates small documents. The client is rebuilt only when
+    the credentials or location it was built for change.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._client: Any = None
+        self._key: tuple | None = None
+        self._override: Any = None
+
+    @property
+    def overridden(self) -> bool:
+        return self._override is not None
+
+    def get(self) -> Any:
+        if self._override is not None:
+            return self._override
+        key = _client_key()
+        client = self._client
+        if client is not None and self._key == key:
+            return client
+        with self._lock:
+            if self._client is None or self._key != key:
+                with metrics.timer("ocr.documentai.client_init_seconds"):
+                    self._client = _build_client(key)
+                self._key = key
+            return self._client
+
+    def set(self, client: Any) -> None:
+        """Pin a client (for example a `FakeDocumentProcessor`) until `reset` is called."""
+        self._override = client
+
+    def reset(self) -> None:
+        with self._lock:
+            self._client = None
+            self._key = None
+            self._override = None
+
+
+document_ai_clients = DocumentAIClientHolder()
+
+
+def _client_key() -> tuple:
+    if settings.document_ai_fake_document_path:
+        return ("fake", settings.document_ai_fake_document_path, settings.document_ai_fake_latency_seconds)
+    return ("google", settings.google_credentials_path, settings.google_location)
+
+
+def _build_client(key: tuple) -> Any:
+    if key[0] == "fake":
+        return FakeDocumentProcessor.from_json_file(key[1], latency_seconds=key[2])
+    _, credentials_path, location = key
+    # Processors outside the default "us" region are only reachable on their regional endpoint.
+    client_options = ClientOptions(api_endpoint=f"{location}-documentai.googleapis.com") if location != "us" else None
+    return documentai.DocumentProcessorServiceClient.from_service_account_file(
+        credentials_path, client_options=client_options
+    )
+
+
+def document_ai_configured() -> bool:
+    if document_ai_clients.overridden or settings.document_ai_fake_document_path:
+        return True
+    return bool(settings.google_project_id and settings.google_processor_id and settings.google_credentials_path)
+
+
+def use_document_ai(pdf_path: Path, page_indices: Iterable[int] | None = None) -> list[dict]:
+    if not document_ai_configured():
         return []
 
-    client = documentai.DocumentProcessorServiceClient.from_service_account_file(credentials_path)
-    name = client.processor_path(project_id, location, processor_id)
+    client = document_ai_clients.get()
+    name = client.processor_path(
+        settings.google_project_id or "local", settings.google_location, settings.google_processor_id or "fake"
+    )
 
-    with pdf_path.open("rb") as pdf_file:
-        raw_document = documentai.RawDocument(content=pdf_file.read(), mime_type="application/pdf")
+    # The request proto needs the PDF as `bytes`, so this path always holds a full copy
+    # of the file; mapping it first would only add a second one.
+    raw_document = documentai.RawDocument(content=Path(pdf_path).read_bytes(), mime_type="application/pdf")
 
     request = documentai.ProcessRequest(name=name, raw_document=raw_document)
-    result = client.process_document(request=request)
+    if page_indices is not None:
+        selector = documentai.ProcessOptions.IndividualPageSelector(pages=[index + 1 for index in page_indices])
+        request.process_options = documentai.ProcessOptions(individual_page_selector=selector)
+    with metrics.timer("ocr.documentai.request_seconds"):
+        result = client.process_document(request=request, timeout=settings.document_ai_timeout_seconds)
     document = result.document
 
     lines: list[dict] = []
-    for page_index, page in enumerate(document.pages):
+    for position, page in enumerate(document.pages):
+        # page_number is 1-based in the original PDF, which matters when only some pages were sent.
+        page_index = page.page_number - 1 if page.page_number else position
         source_elements = page.lines if page.lines else page.paragraphs
         for element in source_elements:
             text = _layout_to_text(element.layout, document)
             if not text.strip():
                 continue
             bbox = _extract_normalized_bbox(element.layout)
-            lines.append({"text": text.strip(), "bbox": bbox, "page_index": page_index})
+            lines.append(
+                {
+                    "text": text.strip(),
+                    "bbox": bbox,
+                    "page_index": page_index,
+                    "confidence": float(element.layout.confidence),
+                }
+            )
     return lines
 
 
@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import logging
+import os
+import socket
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Callable
+
+from sqlalchemy import func, select, update
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.models.pdf_ingestion import PDFIngestion
+from app.services import pdf_ingestions as pdf_service
+
+logger = logging.getLogger(__name__)
+
+
+def claim_next_ingestion(db: Session, worker_id: str | None = None) -> PDFIngestion | None:
+    """Move the oldest pending ingestion to `processing` on behalf of `worker_id` and return it.
+
+    The conditional UPDATE makes the claim safe across threads and API processes
+    sharing the same SQLite/Postgres database, so no external broker is needed.
+    """
+    candidates = select(PDFIngestion.id).where(PDFIngestion.status == "pending").order_by(PDFIngestion.created_at).limit(5)
+    for ingestion_id in db.scalars(candidates).all():
+        now = datetime.utcnow()
+        claimed = db.execute(
+            update(PDFIngestion)
+            .where(PDFIngestion.id == ingestion_id, PDFIngestion.status == "pending")
+            .values(status="processing", started_at=now, claimed_by=worker_id, heartbeat_at=now)
+        )
+        db.commit()
+        if claimed.rowcount == 1:
+            return db.get(PDFIngestion, ingestion_id, populate_existing=True)
+    return None
+
+
+def touch_ingestion(db: Session, ingestion_id: str, worker_id: str) -> bool:
+    """Refresh the heartbeat of an ingestion `worker_id` is still processing.
+
+    Returns False once the job has finished or been requeued to someone else.
+    """
+    result = db.execute(
+        update(PDFIngestion)
+        .where(
+            PDFIngestion.id == ingestion_id,
+            PDFIngestion.status == "processing",
+            PDFIngestion.claimed_by == worker_id,
+        )
+        .values(heartbeat_at=datetime.utcnow())
+    )
+    db.commit()
+    return result.rowcount == 1
+
+
+def requeue_stale_ingestions(db: Session, stale_after: timedelta) -> int:
+    """Return processing ingestions whose worker stopped heartbeating to `pending`.
+
+    Rows claimed before heartbeats existed fall back to `started_at`.
+    """
+    cutoff = datetime.utcnow() - stale_after
+    result = db.execute(
+        update(PDFIngestion)
+        .where(
+            PDFIngestion.status == "processing",
+            func.coalesce(PDFIngestion.heartbeat_at, PDFIngestion.started_at) < cutoff,
+        )
+        .values(status="pending", started_at=None, claimed_by=None, heartbeat_at=None)
+    )
+    db.commit()
+    return result.rowcount or 0
+
+
+class IngestionWorkerPool:
+    """Local thread pool that drains pending PDF ingestions from the database.
+
+    While a worker processes a job, a companion thread refreshes the job's
+    heartbeat every `heartbeat_interval` seconds. Idle workers requeue jobs whose
+    heartbeat is older than `stale_after`, so a job orphaned by a crashed process
+    is picked up again without waiting for a restart.
+    """
+
+    def __init__(
+        self,
+        size: int,
+        poll_interval: float,
+        session_factory: Callable[[], Session] = SessionLocal,
+        heartbeat_interval: float | None = None,
+        stale_after: float | None = None,
+    ) -> None:
+        self.size = size
+        self.poll_interval = poll_interval
+        self.session_factory = session_factory
+        self.heartbeat_interval = heartbeat_interval or settings.ingestion_heartbeat_interval_seconds
+        self.stale_after = stale_after or settings.ingestion_stale_after_seconds
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+        self._threads: list[threading.Thread] = []
+        self._requeue_lock = threading.Lock()
+        self._next_requeue_at = 0.0
+
+    @property
+    def running(self) -> bool:
+        return any(thread.is_alive() for thread in self._threads)
+
+    def start(self) -> None:
+        if self.running or self.size <= 0:
+            return
+        self._stopping.clear()
+        self._next_requeue_at = 0.0
+        self._threads = [
+            threading.Thread(target=self._run, name=f"pdf-ingestion-{idx}", daemon=True) for idx in range(self.size)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def stop(self, timeout: float = 10.0) -> None:
+        self._stopping.set()
+        self._wakeup.set()
+        for thread in self._threads:
+            thread.join(timeout=timeout)
+        self._threads = []
+
+    def notify(self) -> None:
+        self._wakeup.set()
+
+    def _run(self) -> None:
+        worker_id = f"{socket.gethostname()}:{os.getpid()}:{threading.current_thread().name}"
+        while not self._stopping.is_set():
+            # Clear before claiming, so a notify() that arrives while this worker is
+            # claiming or processing makes the next wait return at once.
+            self._wakeup.clear()
+            try:
+                self._requeue_stale_if_due()
+                processed = self._process_next(worker_id)
+            except Exception:  # pragma: no cover - keep the worker alive
+                logger.exception("PDF ingestion worker crashed while claiming a job")
+                processed = False
+            if processed:
+                continue
+            self._wakeup.wait(self.poll_interval)
+
+    def _requeue_stale_if_due(self) -> None:
+        # One worker per heartbeat interval is enough; the others skip straight to claiming.
+        with self._requeue_lock:
+            now = time.monotonic()
+            if now < self._next_requeue_at:
+                return
+            self._next_requeue_at = now + self.heartbeat_interval
+        with self.session_factory() as db:
+            requeued = requeue_stale_ingestions(db, timedelta(seconds=self.stale_after))
+        if requeued:
+            logger.info("Requeued %s stale PDF ingestions", requeued)
+
+    def _process_next(self, worker_id: str) -> bool:
+        with self.session_factory() as db:
+            ingestion = claim_next_ingestion(db, worker_id)
+            if ingestion is None:
+                return False
+            finished = threading.Event()
+            heartbeat = threading.Thread(
+                target=self._heartbeat,
+                args=(ingestion.id, worker_id, finished),
+                name=f"{threading.current_thread().name}-heartbeat",
+                daemon=True,
+            )
+            heartbeat.start()
+            try:
+                pdf_service.process_ingestion(db, ingestion)
+            except Exception:
+                logger.exception("PDF ingestion %s failed", ingestion.id)
+            finally:
+                finished.set()
+                heartbeat.join()
+            return True
+
+    def _heartbeat(self, ingestion_id: str, worker_id: str, finished: threading.Event) -> None:
+        while not finished.wait(self.heartbeat_interval):
+            try:
+                with self.session_factory() as db:
+                    if not touch_ingestion(db, ingestion_id, worker_id):
+                        return
+            except SQLAlchemyError as exc:
+                # A missed beat is harmless until `stale_after` passes, so keep trying.
+                logger.warning("Heartbeat for PDF ingestion %s failed: %s", ingestion_id, exc)
+
+
+ingestion_workers = IngestionWorkerPool(
+    size=settings.ingestion_worker_count,
+    poll_interval=settings.ingestion_poll_interval_seconds,
+)
@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import itertools
+import logging
+import re
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.metrics import metrics
+from app.db.session import SessionLocal
+from app.models.llm_response_cache import LLMResponseCache
+
+logger = logging.getLogger(__name__)
+
+WHITESPACE = re.compile(r"\s+")
+
+# Counts stores across threads; `next` on a count is atomic under the GIL.
+_store_counter = itertools.count(1)
+
+
+def cache_key(model: str, prompt: str) -> str:
+    normalized = WHITESPACE.sub(" ", prompt).strip()
+    return hashlib.sha256(f"{model}\n{normalized}".encode("utf-8")).hexdigest()
+
+
+def get_or_call(
+    namespace: str,
+    model: str,
+    prompt: str,
+    ttl_seconds: int,
+    call: Callable[[], str],
+    *,
+    bypass: bool = False,
+) -> str:
+    """Return the cached response for (model, prompt), or call the model and remember its answer.
+
+    Failures from `call` propagate and are never cached. Cache errors only log,
+    so a broken cache degrades to calling the model directly.
+    """
+    if _bypassed(ttl_seconds, bypass):
+        metrics.increment(f"llm_cache.{namespace}.bypass")
+        return call()
+
+    key = cache_key(model, prompt)
+    cached = _lookup(key)
+    if cached is not None:
+        metrics.increment(f"llm_cache.{namespace}.hit")
+        return cached
+
+    metrics.increment(f"llm_cache.{namespace}.miss")
+    response_text = call()
+    if response_text:
+        _store(key, namespace, model, response_text, ttl_seconds)
+    return response_text
+
+
+async def aget_or_call(
+    namespace: str,
+    model: str,
+    prompt: str,
+    ttl_seconds: int,
+    call: Callable[[], Awaitable[str]],
+    *,
+    bypass: bool = False,
+) -> str:
+    """Async twin of `get_or_call`; the short cache queries run on a worker thread."""
+    cached = await aget(namespace, model, prompt, ttl_seconds, bypass=bypass)
+    if cached is not None:
+        return cached
+    response_text = await call()
+    await aput(namespace, model, prompt, response_text, ttl_seconds, bypass=bypass)
+    return response_text
+
+
+async def aget(namespace: str, model: str, prompt: str, ttl_seconds: int, *, bypass: bool = False) -> str | None:
+    """Cached response or None, for callers such as streams that cannot hand over a single callable."""
+    if _bypassed(ttl_seconds, bypass):
+        metrics.increment(f"llm_cache.{namespace}.bypass")
+        return None
+    cached = await asyncio.to_thread(_lookup, cache_key(model, prompt))
+    metrics.increment(f"llm_cache.{namespace}.{'hit' if cached is not None else 'miss'}")
+    return cached
+
+
+async def aput(
+    namespace: str, model: str, prompt: str, response_text: str, ttl_seconds: int, *, bypass: bool = False
+) -> None:
+    if response_text and not _bypassed(ttl_seconds, bypass):
+        await asyncio.to_thread(_store, cache_key(model, prompt), namespace, model, response_text, ttl_seconds)
+
+
+def _bypassed(ttl_seconds: int, bypass: bool) -> bool:
+    return bypass or not settings.llm_cache_enabled or ttl_seconds <= 0
+
+
+def _lookup(key: str) -> str | None:
+    try:
+        with SessionLocal() as db:
+            entry = db.get(LLMResponseCache, key)
+            now = datetime.utcnow()
+            if entry is None or entry.expires_at <= now:
+                return None
+            entry.hit_count = (entry.hit_count or 0) + 1
+            entry.last_used_at = now
+            db.commit()
+            return entry.response_text
+    except SQLAlchemyError as exc:  # pragma: no cover
+        logger.warning("LLM cache lookup failed: %s", exc)
+        return None
+
+
+def _store(key: str, namespace: str, model: str, response_text: str, ttl_seconds: int) -> None:
+    now = datetime.utcnow()
+    try:
+        with SessionLocal() as db:
+            entry = db.get(LLMResponseCache, key)
+            if entry is None:
+                entry = LLMResponseCache(cache_key=key, namespace=namespace, model=model, hit_count=0)
+                db.add(entry)
+            entry.response_text = response_text
+            entry.created_at = now
+            entry.last_used_at = now
+            entry.expires_at = now + timedelta(seconds=ttl_seconds)
+            try:
+                db.commit()
+            except IntegrityError:
+                # Another worker stored the same prompt first; its answer is as good as ours.
+                db.rollback()
+                return
+            # Pruning counts the whole table, so it runs every `llm_cache_prune_every` stores
+            # rather than after each one; the cap can be overshot by that many entries meanwhile.
+            if next(_store_counter) % settings.llm_cache_prune_every == 0:
+                prune(db)
+    except SQLAlchemyError as exc:  # pragma: no cover
+        logger.warning("LLM cache store failed: %s", exc)
+
+
+def prune(db: Session) -> int:
+    removed = db.execute(delete(LLMResponseCache).where(LLMResponseCache.expires_at <= datetime.utcnow())).rowcount or 0
+
+    overflow = (db.scalar(select(func.count()).select_from(LLMResponseCache)) or 0) - settings.llm_cache_max_entries
+    if overflow > 0:
+        stale_keys = select(LLMResponseCache.cache_key).order_by(LLMResponseCache.last_used_at).limit(overflow)
+        removed += db.execute(
+            delete(LLMResponseCache).where(LLMResponseCache.cache_key.in_(stale_keys.scalar_subquery()))
+        ).rowcount or 0
+    db.commit()
+    if removed:
+        metrics.increment("llm_cache.evicted", removed)
+    return removed
@@ -3,20 +3,18 @@ from __future__ import annotations
 import logging
 from typing import Iterable
 
-import httpx
-from openai import OpenAI
-
 from app.core.config import settings
+from app.services import llm_cache
+from app.services.llm_client import llm_client
 
 logger = logging.getLogger(__name__)
 
 
-def clean_task_lines_with_llm(lines: Iterable[str]) -> list[str]:
-    api_key = settings.openai_api_key
-    if not api_key:
-        return list(lines)
+def clean_task_lines_with_llm(lines: Iterable[str], *, bypass_cache: bool = False) -> list[str]:
+    lines = list(lines)
+    if not llm_client.configured:
+        return lines
 
-    client = OpenAI(api_key=api_key)
     prompt_lines = "\n".join(f"- {line}" for line in lines)
     prompt = (
         "You are cleaning up messy OCR output from a handwritten to-do list. "
@@ -28,11 +26,14 @@ def clean_task_lines_with_llm(lines: Iterable[str]) -> list[str]:
     )
 
     try:
-        response = client.responses.create(
-            model=settings.openai_model,
-            input=prompt,
+        content = llm_cache.get_or_call(
+            "cleanup",
+            settings.openai_model,
+            prompt,
+            settings.llm_cache_cleanup_ttl_seconds,
+            lambda: llm_client.complete(prompt),
+            bypass=bypass_cache,
         )
-        content = response.output[0].content[0].text  # type: ignore[attr-defined]
         cleaned = []
         for line in content.splitlines():
             stripped = line.strip(" -")
@@ -44,6 +45,6 @@ def clean_task_lines_with_llm(lines: Iterable[str]) -> list[str]:
             else:
                 cleaned.append(stripped)
         return cleaned or list(lines)
-    except (httpx.HTTPError, Exception) as exc:  # pragma: no cover
+    except Exception as exc:  # pragma: no cover
         logger.warning("LLM cleanup failed: %s", exc)
         return list(lines)
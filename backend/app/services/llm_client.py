@@ -0,0 +1,233 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import threading
+import time
+from collections.abc import AsyncIterator
+from typing import Any
+
+import httpx
+from openai import APIConnectionError, AsyncOpenAI, InternalServerError, OpenAI, RateLimitError
+
+from app.core.config import settings
+from app.core.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+RETRYABLE_ERRORS = (APIConnectionError, RateLimitError, InternalServerError)
+
+
+class LLMUnavailableError(RuntimeError):
+    """The model could not answer within the retry budget or the request deadline."""
+
+
+class LLMClient:
+    """Application-scoped OpenAI clients sharing pooled HTTP connections.
+
+    The SDK's own retries are disabled; `complete`/`acomplete` retry transient
+    failures with jittered exponential backoff, and give up once the per-request
+    deadline is spent so callers can fall back to something local.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._client: OpenAI | None = None
+        self._async_client: AsyncOpenAI | None = None
+
+    @property
+    def configured(self) -> bool:
+        return bool(settings.openai_api_key)
+
+    def sync_client(self) -> OpenAI:
+        if self._client is None:
+            with self._lock:
+                if self._client is None:
+                    self._client = OpenAI(
+                        api_key=settings.openai_api_key,
+                        base_url=settings.openai_base_url,
+                        max_retries=0,
+                        timeout=_timeout(settings.openai_read_timeout_seconds),
+                        http_client=httpx.Client(limits=_limits(), timeout=_timeout(settings.openai_read_timeout_seconds)),
+                    )
+        return self._client
+
+    def async_client(self) -> AsyncOpenAI:
+        # The async client binds its connection pool to the running event loop, so it
+        # is created lazily from inside that loop.
+        if self._async_client is None:
+            self._async_client = AsyncOpenAI(
+                api_key=settings.openai_api_key,
+                base_url=settings.openai_base_url,
+                max_retries=0,
+                timeout=_timeout(settings.openai_read_timeout_seconds),
+                http_client=httpx.AsyncClient(limits=_limits(), timeout=_timeout(settings.openai_read_timeout_seconds)),
+            )
+        return self._async_client
+
+    def complete(self, prompt: str, *, model: str | None = None, deadline_seconds: float | None = None) -> str:
+        deadline = time.monotonic() + (deadline_seconds or settings.openai_request_deadline_seconds)
+        attempt = 0
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                metrics.increment("llm.deadline_exceeded")
+                raise LLMUnavailableError("LLM request deadline exceeded")
+            try:
+                with metrics.timer("llm.request_seconds"):
+                    response = self.sync_client().responses.create(
+                        model=model or settings.openai_model,
+                        input=prompt,
+                        timeout=_timeout(min(settings.openai_read_timeout_seconds, remaining)),
+                    )
+                return _response_text(response)
+            except RETRYABLE_ERRORS as exc:
+                delay = self._retry_delay(exc, attempt, deadline)
+                if delay is None:
+                    raise LLMUnavailableError(str(exc)) from exc
+                time.sleep(delay)
+                attempt += 1
+
+    async def acomplete(self, prompt: str, *, model: str | None = None, deadline_seconds: float | None = None) -> str:
+        deadline = time.monotonic() + (deadline_seconds or settings.openai_request_deadline_seconds)
+        attempt = 0
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                metrics.increment("llm.deadline_exceeded")
+                raise LLMUnavailableError("LLM request deadline exceeded")
+            try:
+                with metrics.timer("llm.request_seconds"):
+                    response = await asyncio.wait_for(
+                        self.async_client().responses.create(
+                            model=model or settings.openai_model,
+                            input=prompt,
+                            timeout=_timeout(min(settings.openai_read_timeout_seconds, remaining)),
+                        ),
+                        timeout=remaining,
+                    )
+                return _response_text(response)
+            except asyncio.TimeoutError as exc:
+                metrics.increment("llm.deadline_exceeded")
+                raise LLMUnavailableError("LLM request deadline exceeded") from exc
+            except RETRYABLE_ERRORS as exc:
+                delay = self._retry_delay(exc, attempt, deadline)
+                if delay is None:
+                    raise LLMUnavailableError(str(exc)) from exc
+                await asyncio.sleep(delay)
+                attempt += 1
+
+    async def astream(
+        self, prompt: str, *, model: str | None = None, deadline_seconds: float | None = None
+    ) -> AsyncIterator[str]:
+        """Yield output text deltas as they arrive.
+
+        Only opening the stream is retried; once text has been yielded a failure is
+        final. The deadline covers the whole stream, not each chunk.
+        """
+        deadline = time.monotonic() + (deadline_seconds or settings.openai_request_deadline_seconds)
+        attempt = 0
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                metrics.increment("llm.deadline_exceeded")
+                raise LLMUnavailableError("LLM request deadline exceeded")
+            try:
+                stream = await asyncio.wait_for(
+                    self.async_client().responses.create(
+                        model=model or settings.openai_model,
+                        input=prompt,
+                        stream=True,
+                        timeout=_timeout(min(settings.openai_read_timeout_seconds, remaining)),
+                    ),
+                    timeout=remaining,
+                )
+                break
+            except asyncio.TimeoutError as exc:
+                metrics.increment("llm.deadline_exceeded")
+                raise LLMUnavailableError("LLM request deadline exceeded") from exc
+            except RETRYABLE_ERRORS as exc:
+                delay = self._retry_delay(exc, attempt, deadline)
+                if delay is None:
+                    raise LLMUnavailableError(str(exc)) from exc
+                await asyncio.sleep(delay)
+                attempt += 1
+
+        events = stream.__aiter__()
+        try:
+            while True:
+                remaining = deadline - time.monotonic()
+                try:
+                    event = await asyncio.wait_for(events.__anext__(), timeout=max(remaining, 0))
+                except StopAsyncIteration:
+                    return
+                except asyncio.TimeoutError as exc:
+                    metrics.increment("llm.deadline_exceeded")
+                    raise LLMUnavailableError("LLM stream deadline exceeded") from exc
+                except RETRYABLE_ERRORS as exc:
+                    metrics.increment("llm.failed")
+                    raise LLMUnavailableError(str(exc)) from exc
+                if event.type == "response.output_text.delta":
+                    yield event.delta
+                elif event.type in ("response.failed", "error"):
+                    metrics.increment("llm.failed")
+                    raise LLMUnavailableError(f"LLM stream reported {event.type}")
+        finally:
+            await stream.close()
+
+    def close(self) -> None:
+        with self._lock:
+            client, self._client = self._client, None
+        if client is not None:
+            client.close()
+
+    async def aclose(self) -> None:
+        client, self._async_client = self._async_client, None
+        if client is not None:
+            await client.close()
+
+    @staticmethod
+    def _retry_delay(exc: Exception, attempt: int, deadline: float) -> float | None:
+        if attempt >= settings.openai_max_retries:
+            metrics.increment("llm.failed")
+            logger.warning("LLM request failed after %s attempts: %s", attempt + 1, exc)
+            return None
+        # Full jitter keeps concurrent workers from retrying in lockstep.
+        delay = random.uniform(0, settings.openai_retry_base_delay_seconds * 2**attempt)
+        retry_after = _retry_after_seconds(exc)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        if time.monotonic() + delay >= deadline:
+            metrics.increment("llm.deadline_exceeded")
+            return None
+        metrics.increment("llm.retried")
+        return delay
+
+
+llm_client = LLMClient()
+
+
+def _timeout(read_seconds: float) -> httpx.Timeout:
+    return httpx.Timeout(read_seconds, connect=min(settings.openai_connect_timeout_seconds, read_seconds))
+
+
+def _limits() -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=settings.openai_max_connections,
+        max_keepalive_connections=settings.openai_max_connections,
+    )
+
+
+def _response_text(response: Any) -> str:
+    return response.output[0].content[0].text  # type: ignore[attr-defined]
+
+
+def _retry_after_seconds(exc: Exception) -> float | None:
+    response = getattr(exc, "response", None)
+    if response is None:
+        return None
+    try:
+        return float(response.headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
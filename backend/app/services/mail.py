@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from collections import deque
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Protocol
+from uuid import uuid4
+
+import httpx
+
+from app.core.config import settings
+
+RESEND_EMAILS_URL = "https://api.resend.com/emails"
+
+
+@dataclass
+class MailMessage:
+    to: str
+    subject: str
+    html: str
+    text: str
+
+
+class MailDeliveryError(RuntimeError):
+    """Raised when a transport could not hand a message over; `retryable` says whether trying again may help."""
+
+    def __init__(self, message: str, *, retryable: bool) -> None:
+        super().__init__(message)
+        self.retryable = retryable
+
+
+class MailTransport(Protocol):
+    async def send(self, message: MailMessage) -> str:
+        """Deliver `message` and return the provider's message id."""
+        ...
+
+    async def aclose(self) -> None: ...
+
+
+class ResendTransport:
+    """Sends through the Resend HTTP API over one pooled connection per process."""
+
+    def __init__(self, api_key: str, sender: str, *, max_connections: int = 20, timeout_seconds: float = 10.0) -> None:
+        self.sender = sender
+        self._client = httpx.AsyncClient(
+            headers={"Authorization": f"Bearer {api_key}"},
+            timeout=timeout_seconds,
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+        )
+
+    async def send(self, message: MailMessage) -> str:
+        body = {
+            "from": self.sender,
+            "to": [message.to],
+            "subject": message.subject,
+            "html": message.html,
+            "text": message.text,
+        }
+        try:
+            response = await self._client.post(RESEND_EMAILS_URL, json=body)
+        except httpx.HTTPError as exc:
+            raise MailDeliveryError(f"Resend request failed: {exc}", retryable=True) from exc
+        if response.status_code == 429 or response.status_code >= 500:
+            raise MailDeliveryError(f"Resend answered {response.status_code}", retryable=True)
+        if response.status_code >= 400:
+            raise MailDeliveryError(f"Resend rejected the message: {response.text[:200]}", retryable=False)
+        return response.json().get("id", "")
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+
+class LocalMailTransport:
+    """Stand-in transport for development, tests and load runs; nothing leaves the machine.
+
+    Keeps the most recent messages in memory and, when `outbox_dir` is set, also
+    writes each one there as JSON. `latency_seconds` simulates the provider's
+    response time.
+    """
+
+    def __init__(self, outbox_dir: str | Path | None = None, *, latency_seconds: float = 0.0, keep: int = 1000) -> None:
+        self.outbox_dir = Path(outbox_dir) if outbox_dir else None
+        self.latency_seconds = latency_seconds
+        self.sent: deque[MailMessage] = deque(maxlen=keep)
+        self.sent_count = 0
+        if self.outbox_dir is not None:
+            self.outbox_dir.mkdir(parents=True, exist_ok=True)
+
+    async def send(self, message: MailMessage) -> str:
+        if self.latency_seconds:
+            await asyncio.sleep(self.latency_seconds)
+        message_id = str(uuid4())
+        self.sent.append(message)
+        self.sent_count += 1
+        if self.outbox_dir is not None:
+            path = self.outbox_dir / f"{message_id}.json"
+            await asyncio.to_thread(path.write_text, json.dumps(asdict(message)), "utf-8")
+        return message_id
+
+    async def aclose(self) -> None:
+        return None
+
+
+def build_mail_transport() -> MailTransport:
+    if settings.brief_mail_transport == "local":
+        return LocalMailTransport(settings.brief_mail_outbox_dir)
+    if not settings.resend_api_key:
+        raise ValueError("RESEND_API_KEY is required when BRIEF_MAIL_TRANSPORT=resend")
+    return ResendTransport(
+        settings.resend_api_key, settings.brief_mail_from, max_connections=settings.brief_dispatch_concurrency
+    )
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
+
+from app.core.config import settings
+from app.core.metrics import metrics
+
+if TYPE_CHECKING:  # pragma: no cover
+    import easyocr
+
+logger = logging.getLogger(__name__)
+
+
+class OCREngineRegistry:
+    """Process-wide holder for OCR models that are expensive to load.
+
+    The EasyOCR reader is built once per process, either eagerly from the app
+    lifespan (`OCR_PRELOAD_ON_STARTUP`) or lazily on first use. Calls into the
+    reader are serialized because EasyOCR does not document thread safety.
+    """
+
+    def __init__(self) -> None:
+        self._load_lock = threading.Lock()
+        self._use_lock = threading.Lock()
+        self._easyocr_reader: easyocr.Reader | None = None
+        self.easyocr_load_seconds: float | None = None
+
+    @property
+    def easyocr_loaded(self) -> bool:
+        return self._easyocr_reader is not None
+
+    def get_easyocr_reader(self) -> easyocr.Reader:
+        if self._easyocr_reader is None:
+            with self._load_lock:
+                if self._easyocr_reader is None:
+                    self._easyocr_reader = self._load_easyocr()
+        return self._easyocr_reader
+
+    def warm(self) -> None:
+        self.get_easyocr_reader()
+
+    @contextmanager
+    def easyocr_reader(self) -> Iterator[easyocr.Reader]:
+        reader = self.get_easyocr_reader()
+        with self._use_lock:
+            yield reader
+
+    def readtext(self, image, **kwargs) -> list:
+        with self.easyocr_reader() as reader:
+            started = time.perf_counter()
+            result = reader.readtext(image, **kwargs)
+            metrics.observe("ocr.easyocr.recognition_seconds", time.perf_counter() - started)
+        return result
+
+    def _load_easyocr(self) -> easyocr.Reader:
+        import easyocr
+
+        started = time.perf_counter()
+        reader = easyocr.Reader(["en"], gpu=settings.easyocr_gpu)
+        self.easyocr_load_seconds = time.perf_counter() - started
+        metrics.observe("ocr.easyocr.load_seconds", self.easyocr_load_seconds)
+        logger.info("Loaded EasyOCR reader in %.2fs", self.easyocr_load_seconds)
+        return reader
+
+
+ocr_engines = OCREngineRegistry()
+
+
+def warm_ocr_engines() -> None:
+    # Module-level so it can be pickled as a process pool initializer.
+    ocr_engines.warm()
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from pathlib import Path
+
+from pdf2image import convert_from_path, pdfinfo_from_path
+from PIL import Image
+
+from app.core.config import settings
+
+
+class PageImageProvider:
+    """Renders PDF pages to grayscale images on demand, one page at a time.
+
+    Only the most recently used `cache_size` renders are kept, so memory stays
+    bounded no matter how long the document is. Each purpose renders at its own
+    DPI: strikethrough checks only need a coarse image, OCR needs a sharp one.
+    """
+
+    def __init__(self, pdf_path: Path, cache_size: int | None = None) -> None:
+        self.pdf_path = pdf_path
+        self.cache_size = cache_size if cache_size is not None else settings.page_image_cache_size
+        self._cache: OrderedDict[tuple[int, int], Image.Image] = OrderedDict()
+        self._page_count: int | None = None
+
+    @property
+    def page_count(self) -> int:
+        if self._page_count is None:
+            try:
+                self._page_count = int(pdfinfo_from_path(str(self.pdf_path))["Pages"])
+            except Exception:  # pragma: no cover
+                self._page_count = 0
+        return self._page_count
+
+    def get(self, page_index: int, purpose: str = "ocr") -> Image.Image | None:
+        if not 0 <= page_index < self.page_count:
+            return None
+        dpi = _dpi_for(purpose)
+        key = (page_index, dpi)
+        image = self._cache.get(key)
+        if image is not None:
+            self._cache.move_to_end(key)
+            return image
+
+        image = self._render(page_index, dpi)
+        if image is not None and self.cache_size > 0:
+            self._cache[key] = image
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return image
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def _render(self, page_index: int, dpi: int) -> Image.Image | None:
+        page_number = page_index + 1
+        try:
+            rendered = convert_from_path(str(self.pdf_path), dpi=dpi, first_page=page_number, last_page=page_number)
+        except Exception:  # pragma: no cover
+            return None
+        if not rendered:
+            return None
+        return rendered[0].convert("L")
+
+
+def _dpi_for(purpose: str) -> int:
+    if purpose == "strikethrough":
+        return settings.strikethrough_dpi
+    if purpose == "ocr":
+        return settings.ocr_dpi
+    raise ValueError(f"Unknown page image purpose: {purpose}")
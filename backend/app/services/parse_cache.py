@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from sqlalchemy import delete, func, or_, select
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.metrics import metrics
+from app.models.pdf_parse_cache import PDFParseCache
+
+logger = logging.getLogger(__name__)
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+@dataclass
+class CachedParse:
+    lines: list[dict]
+    cleaned_lines: list[str]
+    page_engines: list[str]
+
+
+def hash_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def lookup(db: Session, content_hash: str, version: str) -> CachedParse | None:
+    if not settings.parse_cache_enabled:
+        return None
+    entry = db.get(PDFParseCache, content_hash)
+    if entry is None or entry.cache_version != version or entry.created_at < _expiry_cutoff():
+        metrics.increment("pdf_parse_cache.miss")
+        return None
+
+    entry.hit_count = (entry.hit_count or 0) + 1
+    entry.last_used_at = datetime.utcnow()
+    metrics.increment("pdf_parse_cache.hit")
+    return CachedParse(
+        lines=json.loads(entry.lines),
+        cleaned_lines=json.loads(entry.cleaned_lines),
+        page_engines=json.loads(entry.page_engines) if entry.page_engines else [],
+    )
+
+
+def store(
+    db: Session,
+    content_hash: str,
+    version: str,
+    lines: list[dict],
+    cleaned_lines: list[str],
+    page_engines: list[str],
+) -> None:
+    """Persist a parse result in its own commit.
+
+    Best effort: the ingestion it came from is already committed, so losing a
+    concurrent insert race or any other database error only logs.
+    """
+    if not settings.parse_cache_enabled:
+        return
+    now = datetime.utcnow()
+    entry = db.get(PDFParseCache, content_hash)
+    if entry is None:
+        entry = PDFParseCache(content_hash=content_hash, hit_count=0, created_at=now)
+        db.add(entry)
+    entry.cache_version = version
+    entry.lines = json.dumps(lines)
+    entry.cleaned_lines = json.dumps(cleaned_lines)
+    entry.page_engines = json.dumps(page_engines)
+    entry.created_at = now
+    entry.last_used_at = now
+    try:
+        db.commit()
+        prune(db, version)
+    except IntegrityError:
+        db.rollback()
+    except SQLAlchemyError as exc:
+        db.rollback()
+        logger.warning("PDF parse cache store failed: %s", exc)
+
+
+def prune(db: Session, version: str) -> int:
+    removed = db.execute(
+        delete(PDFParseCache).where(
+            or_(PDFParseCache.cache_version != version, PDFParseCache.created_at < _expiry_cutoff())
+        )
+    ).rowcount or 0
+
+    overflow = (db.scalar(select(func.count()).select_from(PDFParseCache)) or 0) - settings.parse_cache_max_entries
+    if overflow > 0:
+        stale_hashes = select(PDFParseCache.content_hash).order_by(PDFParseCache.last_used_at).limit(overflow)
+        removed += db.execute(
+            delete(PDFParseCache).where(PDFParseCache.content_hash.in_(stale_hashes.scalar_subquery()))
+        ).rowcount or 0
+    db.commit()
+    if removed:
+        metrics.increment("pdf_parse_cache.evicted", removed)
+        logger.info("Evicted %s PDF parse cache entries", removed)
+    return removed
+
+
+def _expiry_cutoff() -> datetime:
+    return datetime.utcnow() - timedelta(days=settings.parse_cache_max_age_days)
@@ -1,201 +1,343 @@
 from __future__ import annotations
 
+import hashlib
+import importlib.metadata
+import json
+import multiprocessing
 import re
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from datetime import date, datetime
-from difflib import get_close_matches
+from functools import lru_cache
 from pathlib import Path
 from typing import Iterable
 
 from fastapi import UploadFile
-from pdf2image import convert_from_path
 from PIL import Image
 from pytesseract import Output, image_to_data
-import easyocr
 import numpy as np
 from pypdf import PdfReader
 import pytesseract
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
+from app.core.config import settings
+from app.core.metrics import metrics
 from app.models.pdf_ingestion import PDFIngestion
 from app.models.task import Task
 from app.schemas.pdf import PDFIngestionWithTasks
+from app.services import parse_cache
+from app.services.brief_cache import brief_cache
 from app.services.llm_cleanup import clean_task_lines_with_llm
 from app.services.external_ocr import use_document_ai
-
-STORAGE_ROOT = Path(__file__).resolve().parents[2] / "storage" / "uploads"
-STORAGE_ROOT.mkdir(parents=True, exist_ok=True)
+from app.services.ocr_engines import ocr_engines, warm_ocr_engines
+from app.services.page_images import PageImageProvider
+from app.services.text_normalization import CANONICAL_WORDS, COMMON_FIXES, REPLACEMENTS, normalize_text_line
+from app.services.upload_storage import map_stored_file, save_upload_to_disk
 
 LINE_PATTERN = re.compile(r"^[\-\u2022\*\d\)\(\.\s]*(.+)$")
 DURATION_PATTERN = re.compile(r"\((\d{1,3})\s?(?:m|min|minutes)\)", re.IGNORECASE)
-REPLACEMENTS = {
-    "\\": "l",
-    "—": "-",
-    "°": "",
-    "|": "l",
-    "•": "-",
-}
-COMMON_FIXES = {
-    "inveryitw": "interview",
-    "agrnee": "agree",
-    "poupo": "followup",
-    "ibson": "gibson",
-}
-CANONICAL_WORDS = [
-    "workout",
-    "focus",
-    "time",
-    "test",
-    "ai",
-    "youtube",
-    "realtor",
-    "followup",
-    "paypal",
-    "interview",
-    "notes",
-    "house",
-    "laundry",
-    "prep",
-    "review",
-    "component",
-    "email",
-    "resume",
-]
-
-
-def save_upload_to_disk(file: UploadFile, ingestion_id: str) -> Path:
-    destination = STORAGE_ROOT / f"{ingestion_id}_{file.filename}"
-    with destination.open("wb") as buffer:
-        buffer.write(file.file.read())
-    return destination
-
-
-def extract_lines_from_pdf(pdf_path: Path) -> list[dict]:
-    reader = PdfReader(str(pdf_path))
-    lines: list[dict] = []
-    for page in reader.pages:
-        text = page.extract_text() or ""
-        for raw_line in text.splitlines():
-            match = LINE_PATTERN.match(raw_line.strip())
-            if not match:
-                continue
-            normalized = normalize_text_line(match.group(1))
-            if normalized:
-                lines.append({"text": normalized, "crossed": False})
-    return lines
 
 
-def ocr_pdf_lines(pdf_path: Path) -> list[dict]:
-    images: list[Image.Image] = []
+def extract_pdf_lines(pdf_path: Path) -> tuple[list[dict], list[str]]:
+    """Read each page from its text layer when it has one and OCR only the pages that do not.
+
+    Returns the merged lines in page order and, per page, the engine that produced them.
+    """
     try:
-        images = convert_from_path(str(pdf_path))
-    except Exception:  # pragma: no cover
-        images = []
+        text_pages = extract_text_layer_pages(pdf_path)
+    except Exception:  # pragma: no cover - unreadable text layer, OCR everything
+        lines = ocr_pdf_lines(pdf_path)
+        page_count = PageImageProvider(pdf_path).page_count
+        return lines, _page_engines(lines, page_count, default="none")
+
+    ocr_page_indices = [index for index, page_lines in enumerate(text_pages) if page_lines is None]
+    ocr_lines = ocr_pdf_lines(pdf_path, page_indices=ocr_page_indices) if ocr_page_indices else []
+
+    ocr_by_page: dict[int, list[dict]] = {}
+    for line in ocr_lines:
+        ocr_by_page.setdefault(line["page_index"], []).append(line)
+
+    lines: list[dict] = []
+    for page_index, page_lines in enumerate(text_pages):
+        lines.extend(page_lines if page_lines is not None else ocr_by_page.pop(page_index, []))
+    for page_index in sorted(ocr_by_page):
+        lines.extend(ocr_by_page[page_index])
+
+    engines = _page_engines(lines, len(text_pages), default="none")
+    for page_index, page_lines in enumerate(text_pages):
+        if page_lines is not None:
+            engines[page_index] = "text"
+    return lines, engines
+
+
+def extract_text_layer_pages(pdf_path: Path) -> list[list[dict] | None]:
+    """Lines per page from the PDF text layer, or None for pages without meaningful text."""
+    pages: list[list[dict] | None] = []
+    with map_stored_file(pdf_path) as mapped:
+        # pypdf copies path inputs into a BytesIO; a memory map avoids that second full read.
+        reader = PdfReader(mapped if mapped else str(pdf_path))
+        for page_index, page in enumerate(reader.pages):
+            text = page.extract_text() or ""
+            if sum(char.isalnum() for char in text) < settings.text_layer_min_chars:
+                pages.append(None)
+                continue
+            page_lines: list[dict] = []
+            for raw_line in text.splitlines():
+                match = LINE_PATTERN.match(raw_line.strip())
+                if not match:
+                    continue
+                normalized = normalize_text_line(match.group(1))
+                if normalized:
+                    page_lines.append(
+                        {
+                            "text": normalized,
+                            "crossed": False,
+                            "page_index": page_index,
+                            "engine": "text",
+                            "confidence": 1.0,
+                        }
+                    )
+            pages.append(page_lines)
+    return pages
+
+
+def _page_engines(lines: list[dict], page_count: int, default: str) -> list[str]:
+    engines = [default] * page_count
+    for line in lines:
+        page_index = line.get("page_index", 0)
+        if 0 <= page_index < page_count:
+            engines[page_index] = line.get("engine", default)
+    return engines
 
-    doc_ai_lines = use_document_ai(pdf_path)
+
+def ocr_pdf_lines(pdf_path: Path, page_indices: list[int] | None = None) -> list[dict]:
+    pages = PageImageProvider(pdf_path)
+    if page_indices is None:
+        page_indices = list(range(pages.page_count))
+    doc_ai_lines = use_document_ai(pdf_path, page_indices=page_indices)
     if doc_ai_lines:
         normalized: list[dict] = []
+        boxes_by_page: dict[int, list[tuple[int, list[tuple[float, float]]]]] = {}
         for item in doc_ai_lines:
             text = item.get("text", "").strip()
             if not text:
                 continue
             page_index = item.get("page_index", 0)
             bbox = item.get("bbox", [])
-            crossed = False
-            if bbox and page_index < len(images):
-                gray = images[page_index].convert("L")
-                pixel_bbox = _normalized_bbox_to_pixels(bbox, gray.size)
-                crossed = _detect_strikethrough(gray, pixel_bbox)
-            normalized.append({"text": normalize_text_line(text), "crossed": crossed})
+            if bbox:
+                boxes_by_page.setdefault(page_index, []).append((len(normalized), bbox))
+            normalized.append(
+                {
+                    "text": normalize_text_line(text),
+                    "crossed": False,
+                    "page_index": page_index,
+                    "engine": "documentai",
+                    "confidence": item.get("confidence", 0.0),
+                }
+            )
+
+        # Only pages that returned bounding boxes are rendered, at the cheaper strikethrough DPI.
+        for page_index, entries in sorted(boxes_by_page.items()):
+            image = pages.get(page_index, purpose="strikethrough")
+            if image is None:
+                continue
+            page = np.asarray(image)
+            size = (page.shape[1], page.shape[0])
+            pixel_boxes = [_normalized_bbox_to_pixels(bbox, size) for _, bbox in entries]
+            for (line_index, _), crossed in zip(entries, _detect_strikethrough_batch(page, pixel_boxes)):
+                normalized[line_index]["crossed"] = bool(crossed)
         return normalized
 
-    if not images:
-        return []
+    if settings.ocr_pool_size > 1 and len(page_indices) > 1:
+        return _ocr_pages_in_pool(pdf_path, page_indices)
 
     ocr_lines: list[dict] = []
-    reader = easyocr.Reader(["en"], gpu=False)
-
-    for image in images:
-        if not isinstance(image, Image.Image):
-            continue
-        gray = image.convert("L")
-        easy_lines = reader.readtext(np.array(gray), detail=1)
-        if easy_lines:
-            for bbox, raw_line, _ in easy_lines:
-                normalized = normalize_text_line(raw_line)
-                if not normalized:
-                    continue
-                top = min(point[1] for point in bbox)
-                bottom = max(point[1] for point in bbox)
-                left = min(point[0] for point in bbox)
-                right = max(point[0] for point in bbox)
-                crossed = _detect_strikethrough(gray, [left, top, right, bottom])
-                ocr_lines.append({"text": normalized, "crossed": crossed})
+    for page_index in page_indices:
+        image = pages.get(page_index, purpose="ocr")
+        if image is None:
             continue
+        ocr_lines.extend(_ocr_page_image(image, page_index))
+    return ocr_lines
 
-        data = image_to_data(gray, output_type=Output.DICT)
-        buckets: dict[tuple[int, int, int], dict] = {}
-        n = len(data["text"])
-        for idx in range(n):
-            text = data["text"][idx].strip()
-            if not text:
+
+def _ocr_page_image(image: Image.Image, page_index: int = 0) -> list[dict]:
+    ocr_lines: list[dict] = []
+    pixel_boxes: list[list[float]] = []
+    gray = image if image.mode == "L" else image.convert("L")
+    page = np.array(gray)
+    easy_lines = ocr_engines.readtext(page, detail=1)
+    if easy_lines:
+        for bbox, raw_line, confidence in easy_lines:
+            normalized = normalize_text_line(raw_line)
+            if not normalized:
                 continue
-            key = (data["block_num"][idx], data["par_num"][idx], data["line_num"][idx])
-            bucket = buckets.setdefault(
-                key,
+            top = min(point[1] for point in bbox)
+            bottom = max(point[1] for point in bbox)
+            left = min(point[0] for point in bbox)
+            right = max(point[0] for point in bbox)
+            pixel_boxes.append([left, top, right, bottom])
+            ocr_lines.append(
                 {
-                    "text": [],
-                    "bbox": [
-                        data["left"][idx],
-                        data["top"][idx],
-                        data["left"][idx] + data["width"][idx],
-                        data["top"][idx] + data["height"][idx],
-                    ],
-                },
+                    "text": normalized,
+                    "crossed": False,
+                    "page_index": page_index,
+                    "engine": "easyocr",
+                    "confidence": float(confidence),
+                }
             )
-            bucket["text"].append(text)
-            bbox = bucket["bbox"]
-            bbox[0] = min(bbox[0], data["left"][idx])
-            bbox[1] = min(bbox[1], data["top"][idx])
-            bbox[2] = max(bbox[2], data["left"][idx] + data["width"][idx])
-            bbox[3] = max(bbox[3], data["top"][idx] + data["height"][idx])
-
-        for bucket in buckets.values():
-            line_text = normalize_text_line(" ".join(bucket["text"]))
-            if not line_text:
-                continue
-            crossed = _detect_strikethrough(gray, bucket["bbox"])
-            ocr_lines.append({"text": line_text, "crossed": crossed})
+        return _mark_crossed_lines(page, ocr_lines, pixel_boxes)
+
+    data = image_to_data(gray, output_type=Output.DICT)
+    buckets: dict[tuple[int, int, int], dict] = {}
+    n = len(data["text"])
+    for idx in range(n):
+        text = data["text"][idx].strip()
+        if not text:
+            continue
+        key = (data["block_num"][idx], data["par_num"][idx], data["line_num"][idx])
+        bucket = buckets.setdefault(
+            key,
+            {
+                "text": [],
+                "confidences": [],
+                "bbox": [
+                    data["left"][idx],
+                    data["top"][idx],
+                    data["left"][idx] + data["width"][idx],
+                    data["top"][idx] + data["height"][idx],
+                ],
+            },
+        )
+        bucket["text"].append(text)
+        # Tesseract reports -1 for entries it did not score.
+        word_confidence = float(data["conf"][idx])
+        if word_confidence >= 0:
+            bucket["confidences"].append(word_confidence / 100.0)
+        bbox = bucket["bbox"]
+        bbox[0] = min(bbox[0], data["left"][idx])
+        bbox[1] = min(bbox[1], data["top"][idx])
+        bbox[2] = max(bbox[2], data["left"][idx] + data["width"][idx])
+        bbox[3] = max(bbox[3], data["top"][idx] + data["height"][idx])
+
+    for bucket in buckets.values():
+        line_text = normalize_text_line(" ".join(bucket["text"]))
+        if not line_text:
+            continue
+        pixel_boxes.append(bucket["bbox"])
+        confidences = bucket["confidences"]
+        ocr_lines.append(
+            {
+                "text": line_text,
+                "crossed": False,
+                "page_index": page_index,
+                "engine": "tesseract",
+                "confidence": sum(confidences) / len(confidences) if confidences else 0.0,
+            }
+        )
+    return _mark_crossed_lines(page, ocr_lines, pixel_boxes)
+
+
+def _mark_crossed_lines(page: np.ndarray, lines: list[dict], pixel_boxes: list[list[float]]) -> list[dict]:
+    for line, crossed in zip(lines, _detect_strikethrough_batch(page, pixel_boxes)):
+        line["crossed"] = bool(crossed)
+    return lines
+
+
+# Page-parallel OCR: each pool process rasterizes only its own page and warms its own
+# OCR engine registry once, so pages fan out without pickling full images.
+_ocr_pool: ProcessPoolExecutor | None = None
+_ocr_pool_lock = threading.Lock()
+
+
+def _get_ocr_pool() -> ProcessPoolExecutor:
+    global _ocr_pool
+    with _ocr_pool_lock:
+        if _ocr_pool is None:
+            _ocr_pool = ProcessPoolExecutor(
+                max_workers=settings.ocr_pool_size,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=warm_ocr_engines,
+            )
+        return _ocr_pool
+
+
+def shutdown_ocr_pool() -> None:
+    global _ocr_pool
+    with _ocr_pool_lock:
+        pool, _ocr_pool = _ocr_pool, None
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _ocr_page_in_worker(pdf_path: str, page_index: int) -> list[dict]:
+    image = PageImageProvider(Path(pdf_path), cache_size=0).get(page_index, purpose="ocr")
+    if image is None:
+        return []
+    return _ocr_page_image(image, page_index)
+
+
+def _ocr_pages_in_pool(pdf_path: Path, page_indices: list[int]) -> list[dict]:
+    pool = _get_ocr_pool()
+    ocr_lines: list[dict] = []
+    # map() yields in submission order, which keeps page and line ordering intact.
+    for page_lines in pool.map(_ocr_page_in_worker, [str(pdf_path)] * len(page_indices), page_indices):
+        ocr_lines.extend(page_lines)
     return ocr_lines
 
 
-def _detect_strikethrough(image: Image.Image, bbox: list[int]) -> bool:
-    x1, y1, x2, y2 = bbox
-    if x2 <= x1 or y2 <= y1:
-        return False
-    width = x2 - x1
-    height = y2 - y1
-    if width <= 0 or height <= 0:
-        return False
-    crop = image.crop((x1, y1, x2, y2))
-    arr = np.array(crop)
-    if arr.ndim == 3:
-        arr = arr[..., 0]
-    if arr.size == 0:
-        return False
-    row_dark = (arr < 90).mean(axis=1)
-    dark_rows = np.where(row_dark > 0.65)[0]
-    if not len(dark_rows):
-        return False
-    contiguous = 1
-    best = 1
-    for idx in range(1, len(dark_rows)):
-        if dark_rows[idx] == dark_rows[idx - 1] + 1:
-            contiguous += 1
-            best = max(best, contiguous)
-        else:
-            contiguous = 1
-    return best >= max(1, int(height * 0.05)) and best <= int(height * 0.4)
+def _detect_strikethrough_batch(page: np.ndarray, bboxes: list[list[float]]) -> np.ndarray:
+    """Flag every line box on a grayscale page whose crop contains a strikethrough band.
+
+    A row is dark when more than 65% of its pixels are below 90; a box is crossed when
+    its longest run of dark rows spans between 5% and 40% of the box height. Boxes are
+    rounded and padded with black outside the page exactly like `Image.crop`.
+    """
+    boxes = np.asarray(bboxes, dtype=np.float64).reshape(-1, 4)
+    crossed = np.zeros(len(boxes), dtype=bool)
+    if not len(boxes):
+        return crossed
+    if page.ndim == 3:
+        page = page[..., 0]
+    page_height, page_width = page.shape
+
+    # Row-wise integral image: row_dark[y, x] counts dark pixels in row y left of column x.
+    row_dark = np.zeros((page_height, page_width + 1), dtype=np.int64)
+    np.cumsum(page < 90, axis=1, out=row_dark[:, 1:])
+
+    x1, y1, x2, y2 = boxes.T
+    heights = y2 - y1
+    left, top, right, bottom = (np.rint(edge).astype(np.int64) for edge in (x1, y1, x2, y2))
+    crop_widths = right - left
+    crop_heights = bottom - top
+    candidates = np.flatnonzero((x2 > x1) & (y2 > y1) & (crop_widths > 0) & (crop_heights > 0))
+    if not len(candidates):
+        return crossed
+
+    offsets = np.arange(crop_heights[candidates].max())
+    rows = top[candidates, None] + offsets[None, :]
+    in_box = offsets[None, :] < crop_heights[candidates, None]
+    on_page = (rows >= 0) & (rows < page_height)
+    clamped_rows = np.clip(rows, 0, page_height - 1)
+    clamped_left = np.clip(left[candidates], 0, page_width)[:, None]
+    clamped_right = np.clip(right[candidates], 0, page_width)[:, None]
+    widths = crop_widths[candidates, None]
+
+    dark_counts = row_dark[clamped_rows, clamped_right] - row_dark[clamped_rows, clamped_left]
+    dark_counts += widths - (clamped_right - clamped_left)  # padding columns are black
+    dark_counts = np.where(on_page, dark_counts, widths)  # padding rows are black
+    dark_rows = in_box & (dark_counts / widths > 0.65)
+
+    # Longest run of consecutive dark rows per box, computed with cumulative sums.
+    run_totals = np.cumsum(dark_rows, axis=1)
+    run_starts = np.maximum.accumulate(np.where(dark_rows, 0, run_totals), axis=1)
+    longest = (run_totals - run_starts).max(axis=1)
+
+    box_heights = heights[candidates]
+    min_run = np.maximum(1, (box_heights * 0.05).astype(np.int64))
+    max_run = (box_heights * 0.4).astype(np.int64)
+    crossed[candidates] = (longest >= min_run) & (longest <= max_run)
+    return crossed
 
 
 def _normalized_bbox_to_pixels(bbox: list[tuple[float, float]], size: tuple[int, int]) -> list[int]:
@@ -207,6 +349,45 @@ def _normalized_bbox_to_pixels(bbox: list[tuple[float, float]], size: tuple[int,
     return [min(xs), min(ys), max(xs), max(ys)]
 
 
+def clean_low_confidence_lines(lines: Iterable[dict | str]) -> list[str]:
+    """Send only lines below the confidence threshold to the LLM and splice its output back in order.
+
+    Crossed-out lines are dropped. Lines read from the text layer or recognised
+    confidently pass through untouched, so clean documents never reach the model.
+    """
+    threshold = settings.llm_cleanup_confidence_threshold
+    texts: list[str] = []
+    low_positions: list[int] = []
+    for line in lines:
+        if isinstance(line, dict):
+            if line.get("crossed"):
+                continue
+            text, confidence = line["text"], line.get("confidence", 0.0)
+        else:
+            text, confidence = line, 0.0
+        if confidence < threshold:
+            low_positions.append(len(texts))
+        texts.append(text)
+
+    metrics.increment("llm_cleanup.lines_skipped", len(texts) - len(low_positions))
+    if not low_positions:
+        return texts
+    metrics.increment("llm_cleanup.lines_sent", len(low_positions))
+
+    cleaned = clean_task_lines_with_llm([texts[position] for position in low_positions])
+    if len(cleaned) == len(low_positions):
+        for position, text in zip(low_positions, cleaned):
+            texts[position] = text
+        return texts
+
+    # The model merged or split lines, so there is no 1:1 mapping; keep the cleaned
+    # block together where the first uncertain line was.
+    low = set(low_positions)
+    kept = [text for position, text in enumerate(texts) if position not in low]
+    insert_at = low_positions[0]
+    return kept[:insert_at] + cleaned + kept[insert_at:]
+
+
 def parse_tasks_from_lines(lines: Iterable[dict | str]) -> list[dict]:
     tasks: list[dict] = []
     for line in lines:
@@ -230,61 +411,78 @@ def parse_tasks_from_lines(lines: Iterable[dict | str]) -> list[dict]:
     return tasks
 
 
-def normalize_text_line(line: str) -> str:
-    cleaned = line.strip()
-    for bad, good in REPLACEMENTS.items():
-        cleaned = cleaned.replace(bad, good)
-    cleaned = re.sub(r"\s{2,}", " ", cleaned)
-    lower = cleaned.lower()
-    for typo, correct in COMMON_FIXES.items():
-        if typo in lower:
-            cleaned = lower.replace(typo, correct)
-            lower = cleaned
-    words = []
-    for token in cleaned.split():
-        if len(token) < 3:
-            words.append(token)
-            continue
-        match = get_close_matches(token.lower().strip("-"), CANONICAL_WORDS, n=1, cutoff=0.72)
-        if match:
-            replacement = match[0]
-            if token.istitle():
-                replacement = replacement.title()
-            words.append(replacement)
-        else:
-            words.append(token)
-    cleaned_text = " ".join(words)
-    return cleaned_text.strip(" -–.")
+# Bump when normalize_text_line or the OCR pipeline changes in ways the fingerprint
+# below cannot see, so cached parses produced by the old code are discarded.
+PARSE_CACHE_REVISION = 3
+
+
+@lru_cache
+def parse_cache_version() -> str:
+    fingerprint = {
+        "revision": PARSE_CACHE_REVISION,
+        "line_pattern": LINE_PATTERN.pattern,
+        "text_layer_min_chars": settings.text_layer_min_chars,
+        "llm_cleanup_confidence_threshold": settings.llm_cleanup_confidence_threshold,
+        "replacements": REPLACEMENTS,
+        "common_fixes": COMMON_FIXES,
+        "canonical_words": CANONICAL_WORDS,
+        "engines": {name: _package_version(name) for name in ("pypdf", "easyocr", "pytesseract", "google-cloud-documentai")},
+        "llm_model": settings.openai_model if settings.openai_api_key else None,
+    }
+    return hashlib.sha256(json.dumps(fingerprint, sort_keys=True).encode()).hexdigest()[:32]
+
+
+def _package_version(name: str) -> str | None:
+    try:
+        return importlib.metadata.version(name)
+    except importlib.metadata.PackageNotFoundError:
+        return None
 
 
-def ingest_pdf(
+def create_ingestion(
     db: Session,
     *,
     user_id: str,
     file: UploadFile,
     scheduled_date: date,
-) -> PDFIngestionWithTasks:
-    ingestion = PDFIngestion(user_id=user_id, original_filename=file.filename, stored_path="")
+) -> PDFIngestion:
+    ingestion = PDFIngestion(
+        user_id=user_id,
+        original_filename=file.filename,
+        stored_path="",
+        scheduled_date=scheduled_date,
+        status="pending",
+    )
     db.add(ingestion)
     db.flush()
 
+    stored = save_upload_to_disk(file, ingestion.id)
+    ingestion.stored_path = str(stored.path)
+    ingestion.content_hash = stored.content_hash
+    ingestion.file_size_bytes = stored.size_bytes
+    db.commit()
+    db.refresh(ingestion)
+    return ingestion
+
+
+def process_ingestion(db: Session, ingestion: PDFIngestion) -> PDFIngestionWithTasks:
     try:
-        stored_path = save_upload_to_disk(file, ingestion.id)
-        ingestion.stored_path = str(stored_path)
-        lines = extract_lines_from_pdf(stored_path)
+        if ingestion.scheduled_date is None:
+            raise ValueError("Ingestion has no scheduled date")
+        stored_path = Path(ingestion.stored_path)
+        if not ingestion.content_hash:
+            ingestion.content_hash = parse_cache.hash_file(stored_path)
+        cache_version = parse_cache_version()
+        cached = parse_cache.lookup(db, ingestion.content_hash, cache_version)
+
+        if cached is not None:
+            lines, cleaned_lines, page_engines = cached.lines, cached.cleaned_lines, cached.page_engines
+        else:
+            lines, page_engines = extract_pdf_lines(stored_path)
 
-        if not lines:
-            lines = ocr_pdf_lines(stored_path)
+            cleaned_lines = clean_low_confidence_lines(lines)
 
         raw_text = "\n".join(line["text"] if isinstance(line, dict) else line for line in lines)
-        eligible_for_cleanup = [
-            line["text"]
-            if isinstance(line, dict) and not line.get("crossed")
-            else line
-            for line in lines
-            if not (isinstance(line, dict) and line.get("crossed"))
-        ]
-        cleaned_lines = clean_task_lines_with_llm(eligible_for_cleanup)
         parsed_tasks = parse_tasks_from_lines(cleaned_lines)
 
         created_task_titles: list[str] = []
@@ -292,9 +490,9 @@ def ingest_pdf(
             if not payload["title"]:
                 continue
             task = Task(
-                user_id=user_id,
+                user_id=ingestion.user_id,
                 title=payload["title"],
-                scheduled_date=scheduled_date,
+                scheduled_date=ingestion.scheduled_date,
                 estimated_minutes=payload["estimated_minutes"],
                 source="pdf",
                 pdf_ingestion_id=ingestion.id,
@@ -306,28 +504,44 @@ def ingest_pdf(
         ingestion.parsed_task_count = len(created_task_titles)
         ingestion.completed_at = datetime.utcnow()
         ingestion.raw_text = raw_text
+        ingestion.page_engines = json.dumps(page_engines)
         db.commit()
         db.refresh(ingestion)
-
-        return PDFIngestionWithTasks(
-            id=ingestion.id,
-            user_id=user_id,
-            original_filename=ingestion.original_filename,
-            status=ingestion.status,
-            parsed_task_count=ingestion.parsed_task_count,
-            error_message=ingestion.error_message,
-            created_at=ingestion.created_at,
-            completed_at=ingestion.completed_at,
-            tasks_created=created_task_titles,
-        )
+        if created_task_titles:
+            brief_cache.invalidate(ingestion.user_id, ingestion.scheduled_date)
     except Exception as exc:  # pragma: no cover - defensive, logged upstream
+        db.rollback()
         ingestion.status = "failed"
         ingestion.error_message = str(exc)
         ingestion.completed_at = datetime.utcnow()
         db.commit()
         raise
 
+    # Outside the try: the tasks are committed, so a cache failure must not mark the ingestion failed.
+    if cached is None:
+        parse_cache.store(db, ingestion.content_hash, cache_version, lines, cleaned_lines, page_engines)
+    return serialize_ingestion(ingestion, tasks_created=created_task_titles)
+
 
 def get_ingestion(db: Session, ingestion_id: str) -> PDFIngestion | None:
     stmt = select(PDFIngestion).where(PDFIngestion.id == ingestion_id)
     return db.scalar(stmt)
+
+
+def serialize_ingestion(ingestion: PDFIngestion, tasks_created: list[str] | None = None) -> PDFIngestionWithTasks:
+    if tasks_created is None:
+        tasks_created = [task.title for task in ingestion.tasks]
+    return PDFIngestionWithTasks(
+        id=ingestion.id,
+        user_id=ingestion.user_id,
+        original_filename=ingestion.original_filename,
+        scheduled_date=ingestion.scheduled_date,
+        status=ingestion.status,
+        page_engines=json.loads(ingestion.page_engines) if ingestion.page_engines else [],
+        parsed_task_count=ingestion.parsed_task_count,
+        error_message=ingestion.error_message,
+        created_at=ingestion.created_at,
+        started_at=ingestion.started_at,
+        completed_at=ingestion.completed_at,
+        tasks_created=tasks_created,
+    )
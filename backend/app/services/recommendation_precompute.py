@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import time
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import delete, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import selectinload
+
+from app.core.config import settings
+from app.core.metrics import metrics
+from app.db.session import AsyncSessionLocal
+from app.models.precomputed_recommendation import PrecomputedRecommendation
+from app.models.user import User
+from app.services.llm_client import LLMUnavailableError, llm_client
+from app.services.recommendations import default_goal_context, generate_llm_todos, recommendation_fingerprint
+
+logger = logging.getLogger(__name__)
+
+# How far the pacer may slow down after the model starts refusing or timing out.
+MAX_BACKOFF_FACTOR = 8.0
+
+
+@dataclass
+class PrecomputeResult:
+    scheduled_date: date
+    users_seen: int = 0
+    generated: int = 0
+    skipped: int = 0
+    failed: int = 0
+    pruned: int = 0
+    elapsed_seconds: float = 0.0
+
+
+class RequestPacer:
+    """Spaces request starts to stay under a requests-per-minute budget.
+
+    After a failed request the spacing doubles (up to `MAX_BACKOFF_FACTOR`), and
+    each success brings it back down, so a rate-limited run slows itself rather
+    than burning the retry budget of every pending user.
+    """
+
+    def __init__(self, requests_per_minute: int) -> None:
+        self.interval = 60.0 / requests_per_minute
+        self.factor = 1.0
+        self._lock = asyncio.Lock()
+        self._next_start = 0.0
+
+    async def wait(self) -> None:
+        async with self._lock:
+            now = time.monotonic()
+            delay = self._next_start - now
+            self._next_start = max(now, self._next_start) + self.interval * self.factor
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def succeeded(self) -> None:
+        self.factor = max(1.0, self.factor / 2)
+
+    def failed(self) -> None:
+        self.factor = min(MAX_BACKOFF_FACTOR, self.factor * 2)
+
+
+def next_precompute_date() -> date:
+    return datetime.utcnow().date() + timedelta(days=1)
+
+
+async def precompute_recommendations(
+    scheduled_date: date | None = None,
+    *,
+    concurrency: int | None = None,
+    requests_per_minute: int | None = None,
+) -> PrecomputeResult:
+    """Generate and store next-day recommendations for every user with a goal.
+
+    Users are read in id-ordered pages, and a user whose stored set was built
+    from the same inputs is skipped, so an interrupted run picks up where it
+    stopped when started again. Only model answers are stored; users the model
+    could not serve are left to live generation.
+    """
+    scheduled_date = scheduled_date or next_precompute_date()
+    concurrency = concurrency or settings.precompute_concurrency
+    pacer = RequestPacer(requests_per_minute or settings.precompute_requests_per_minute)
+    semaphore = asyncio.Semaphore(concurrency)
+    result = PrecomputeResult(scheduled_date)
+    started = time.perf_counter()
+
+    if not llm_client.configured:
+        logger.info("Skipping recommendation precompute because OPENAI_API_KEY is not configured")
+        return result
+
+    result.pruned = await _prune_past_rows(datetime.utcnow().date())
+
+    async def precompute_user(user_id: str, context: tuple[str, str, str, int], fingerprint: str) -> None:
+        async with semaphore:
+            await pacer.wait()
+            try:
+                with metrics.timer("precompute.request_seconds"):
+                    todos = await generate_llm_todos(*context)
+            except LLMUnavailableError as exc:
+                pacer.failed()
+                result.failed += 1
+                metrics.increment("precompute.failed")
+                logger.warning("Precompute for user=%s failed: %s", user_id, exc)
+                return
+            except Exception as exc:  # pragma: no cover
+                # Non-retryable model errors (bad request, auth) must not abort the rest of the run.
+                result.failed += 1
+                metrics.increment("precompute.failed")
+                logger.warning("Precompute for user=%s failed unexpectedly: %s", user_id, exc)
+                return
+            pacer.succeeded()
+            if not todos:
+                result.failed += 1
+                metrics.increment("precompute.failed")
+                return
+            try:
+                await _store(user_id, scheduled_date, fingerprint, [todo.model_dump() for todo in todos])
+            except Exception as exc:  # pragma: no cover
+                result.failed += 1
+                metrics.increment("precompute.failed")
+                logger.warning("Storing precomputed recommendations for user=%s failed: %s", user_id, exc)
+                return
+            result.generated += 1
+            metrics.increment("precompute.generated")
+
+    last_user_id = ""
+    while True:
+        async with AsyncSessionLocal() as db:
+            users = (
+                await db.scalars(
+                    select(User)
+                    .options(selectinload(User.goals))
+                    .where(User.id > last_user_id, User.goals.any())
+                    .order_by(User.id)
+                    .limit(settings.precompute_page_size)
+                )
+            ).all()
+            if not users:
+                break
+            existing = dict(
+                (
+                    await db.execute(
+                        select(PrecomputedRecommendation.user_id, PrecomputedRecommendation.input_fingerprint).where(
+                            PrecomputedRecommendation.scheduled_date == scheduled_date,
+                            PrecomputedRecommendation.user_id.in_([user.id for user in users]),
+                        )
+                    )
+                ).all()
+            )
+        last_user_id = users[-1].id
+
+        pending = []
+        for user in users:
+            result.users_seen += 1
+            context = default_goal_context(user)
+            fingerprint = recommendation_fingerprint(*context)
+            if existing.get(user.id) == fingerprint:
+                result.skipped += 1
+                continue
+            pending.append(precompute_user(user.id, context, fingerprint))
+        await asyncio.gather(*pending)
+
+    result.elapsed_seconds = time.perf_counter() - started
+    metrics.observe("precompute.run_seconds", result.elapsed_seconds)
+    logger.info(
+        "Precomputed recommendations for %s: %s generated, %s skipped, %s failed of %s users in %.1fs",
+        scheduled_date,
+        result.generated,
+        result.skipped,
+        result.failed,
+        result.users_seen,
+        result.elapsed_seconds,
+    )
+    return result
+
+
+async def _store(user_id: str, scheduled_date: date, fingerprint: str, todos: list[dict]) -> None:
+    encoded = json.dumps(todos)
+    for _ in range(2):
+        async with AsyncSessionLocal() as db:
+            row = await db.scalar(
+                select(PrecomputedRecommendation).where(
+                    PrecomputedRecommendation.user_id == user_id,
+                    PrecomputedRecommendation.scheduled_date == scheduled_date,
+                )
+            )
+            if row is None:
+                db.add(
+                    PrecomputedRecommendation(
+                        user_id=user_id, scheduled_date=scheduled_date, input_fingerprint=fingerprint, todos=encoded
+                    )
+                )
+            else:
+                row.input_fingerprint = fingerprint
+                row.todos = encoded
+                row.created_at = datetime.utcnow()
+                row.served_at = None
+            try:
+                await db.commit()
+                return
+            except IntegrityError:
+                # Another run inserted the row first; update it on the second pass.
+                await db.rollback()
+
+
+async def _prune_past_rows(today: date) -> int:
+    async with AsyncSessionLocal() as db:
+        deleted = await db.execute(
+            delete(PrecomputedRecommendation).where(PrecomputedRecommendation.scheduled_date < today)
+        )
+        await db.commit()
+    return deleted.rowcount or 0
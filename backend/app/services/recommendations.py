@@ -1,32 +1,375 @@
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+from collections.abc import AsyncIterator
+from datetime import date, datetime, timedelta
 from typing import Sequence
+import hashlib
 import json
 import logging
+import time
 from urllib.parse import quote_plus
 
-from openai import OpenAI
-from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy import select, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, selectinload
 
+from app.core.coalescing import SingleFlight
 from app.core.config import settings
-from app.models.recommendation_history import RecommendationHistory
+from app.core.metrics import metrics
+from app.db.session import AsyncSessionLocal
+from app.models.precomputed_recommendation import PrecomputedRecommendation
+from app.models.recommendation_history import (
+    RecommendationHistory,
+    recommendation_title_key,
+    recommendation_url_key,
+)
+from app.models.user import User
 from app.schemas.recommendation import (
     RecommendationRequest,
     RecommendationsResponse,
     RecommendedTodo,
 )
-from app.services import users as user_service
+from app.services import llm_cache
+from app.services.llm_client import LLMUnavailableError, llm_client
 
 logger = logging.getLogger(__name__)
 
+DUPLICATE_WINDOW_DAYS = 15
+
+recommendation_flights: SingleFlight[RecommendationsResponse] = SingleFlight(
+    "recommendations",
+    ttl_seconds=settings.recommendations_result_cache_seconds,
+    max_entries=settings.recommendations_result_cache_max_entries,
+)
+
+
+async def generate_recommendations_coalesced(payload: RecommendationRequest) -> RecommendationsResponse:
+    """Share one LLM call and one history write between concurrent identical requests.
+
+    Identical requests (multiple tabs, mount plus focus refetch) arriving while one
+    is in flight wait for it, and for a short while afterwards get its result, so
+    they neither pay for another call nor see its output as recent duplicates.
+    The shared work opens its own session because it can outlive the request
+    that started it.
+    """
+    key = (
+        payload.user_id,
+        payload.scheduled_date,
+        payload.primary_goal,
+        payload.secondary_goals,
+        payload.skills_focus,
+        payload.bypass_cache,
+    )
+
+    async def generate() -> RecommendationsResponse:
+        async with AsyncSessionLocal() as db:
+            return await generate_recommendations_async(db, payload)
+
+    return await recommendation_flights.run(key, generate, use_cached=not payload.bypass_cache)
+
+
+async def generate_recommendations_async(db: AsyncSession, payload: RecommendationRequest) -> RecommendationsResponse:
+    """Recommendations for one request, without holding a thread while the model answers."""
+    started = time.perf_counter()
+    user = await db.get(User, payload.user_id, options=[selectinload(User.goals)])
+    if user is None:
+        raise LookupError("User not found")
+
+    primary_goal, secondary_goals, focus_term, budget = _resolve_goal_context(user, payload)
+    todos = await db.run_sync(_take_precomputed, payload, primary_goal, secondary_goals, focus_term, budget)
+    # End the read transaction so the pooled connection is not held while the model answers.
+    await db.commit()
+    if todos is None:
+        todos = await _call_llm_recommendations_async(
+            primary_goal, secondary_goals, focus_term, budget, bypass_cache=payload.bypass_cache
+        )
+        todos = _with_template_fallback(todos, primary_goal, secondary_goals, focus_term, budget)
+    # Without streaming, the first todo reaches the client together with the last one.
+    metrics.observe("recommendations.time_to_first_todo_seconds", time.perf_counter() - started)
+
+    filtered = await db.run_sync(_filter_recent_duplicates, payload.user_id, todos)
+    final_todos = _drop_recent_duplicates(filtered, todos, payload.user_id)
+    await db.run_sync(_persist_recommendation_history, payload.user_id, final_todos)
+    return _build_response(user, payload, primary_goal, final_todos)
+
+
+async def open_recommendation_stream(db: AsyncSession, payload: RecommendationRequest) -> AsyncIterator[str]:
+    """Validate the request up front, then return a generator of server-sent events.
 
-def generate_recommendations(db: Session, payload: RecommendationRequest) -> RecommendationsResponse:
-    user = user_service.get_user(db, payload.user_id)
+    Each todo is sent as a `todo` event as soon as the model has finished writing it
+    and it passed the recent-duplicate filter; a final `done` event carries the
+    goal statement and whether the todos came from the model or the templates.
+    """
+    started = time.perf_counter()
+    user = await db.get(User, payload.user_id, options=[selectinload(User.goals)])
     if user is None:
-        raise ValueError("User not found")
+        raise LookupError("User not found")
+    primary_goal, secondary_goals, focus_term, budget = _resolve_goal_context(user, payload)
+    precomputed = await db.run_sync(_take_precomputed, payload, primary_goal, secondary_goals, focus_term, budget)
+    await db.commit()
+
+    async def events() -> AsyncIterator[str]:
+        emitted: list[RecommendedTodo] = []
+        source = "llm"
+        if precomputed is not None:
+            llm_todos = _iterate(precomputed)
+        else:
+            llm_todos = _stream_llm_todos(
+                primary_goal, secondary_goals, focus_term, budget, bypass_cache=payload.bypass_cache
+            )
+        async for event in _emit_unique_todos(llm_todos, emitted, payload.user_id, started):
+            yield event
+        if not emitted:
+            source = "template"
+            logger.info("Falling back to template recommendations for goal=%s", primary_goal)
+            context = {"primary_goal": primary_goal, "secondary_goals": secondary_goals, "focus": focus_term}
+            templates = _iterate(_build_template_todos(context, _allocate_minutes(budget)))
+            async for event in _emit_unique_todos(templates, emitted, payload.user_id, started):
+                yield event
+
+        async with AsyncSessionLocal() as session:
+            await session.run_sync(_persist_recommendation_history, payload.user_id, emitted)
+        yield _sse_event(
+            "done",
+            {
+                "user_id": user.id,
+                "scheduled_date": payload.scheduled_date.isoformat(),
+                "goal_statement": primary_goal,
+                "source": source,
+                "count": len(emitted),
+            },
+        )
+
+    return events()
+
+
+def recommendation_fingerprint(primary_goal: str, secondary_goals: str, focus_term: str, budget: int) -> str:
+    """Identifies the inputs a set of todos was generated from: the model and the exact prompt."""
+    prompt = _build_recommendation_prompt(primary_goal, secondary_goals, focus_term, budget)
+    return hashlib.sha256(f"{settings.openai_model}\n{prompt}".encode("utf-8")).hexdigest()
 
+
+def default_goal_context(user: User) -> tuple[str, str, str, int]:
+    """The goal context a request without overrides resolves to, as used by the overnight precompute."""
+    return _resolve_goal_context(user, RecommendationRequest(user_id=user.id, scheduled_date=date.today()))
+
+
+async def generate_llm_todos(
+    primary_goal: str, secondary_goals: str, focus_term: str, budget: int
+) -> list[RecommendedTodo]:
+    """Ask the model for todos without the template fallback.
+
+    `LLMUnavailableError` is left to the caller, so a batch job can tell a
+    rate-limited or unreachable model from an unusable answer and back off.
+    """
+    prompt = _build_recommendation_prompt(primary_goal, secondary_goals, focus_term, budget)
+    content = await llm_cache.aget_or_call(
+        "recommendations",
+        settings.openai_model,
+        prompt,
+        settings.llm_cache_recommendations_ttl_seconds,
+        lambda: llm_client.acomplete(prompt),
+    )
+    return _parse_recommendation_content(content, budget)
+
+
+def _take_precomputed(
+    db: Session,
+    payload: RecommendationRequest,
+    primary_goal: str,
+    secondary_goals: str,
+    focus_term: str,
+    budget: int,
+) -> list[RecommendedTodo] | None:
+    """Todos precomputed overnight for this user and day, if they were built from the same inputs.
+
+    The row is marked served but not committed; the caller's next commit does that.
+    """
+    if payload.bypass_cache:
+        return None
+    row = db.scalar(
+        select(PrecomputedRecommendation).where(
+            PrecomputedRecommendation.user_id == payload.user_id,
+            PrecomputedRecommendation.scheduled_date == payload.scheduled_date,
+        )
+    )
+    if row is None:
+        metrics.increment("precompute.misses")
+        return None
+    if row.input_fingerprint != recommendation_fingerprint(primary_goal, secondary_goals, focus_term, budget):
+        # The goal, focus or model changed since the job ran.
+        metrics.increment("precompute.stale")
+        return None
+    try:
+        todos = [RecommendedTodo.model_validate(entry) for entry in json.loads(row.todos)]
+    except ValueError as exc:
+        logger.warning("Ignoring unreadable precomputed recommendations id=%s: %s", row.id, exc)
+        return None
+    if not todos:
+        return None
+    row.served_at = datetime.utcnow()
+    metrics.increment("precompute.hits")
+    return todos
+
+
+async def _emit_unique_todos(
+    todos: AsyncIterator[RecommendedTodo],
+    emitted: list[RecommendedTodo],
+    user_id: str,
+    started: float,
+) -> AsyncIterator[str]:
+    duplicates: list[RecommendedTodo] = []
+    async for todo in todos:
+        # A short session per todo keeps the pooled connection free while the model is still writing.
+        async with AsyncSessionLocal() as session:
+            seen_title_keys, seen_url_keys = await session.run_sync(_recent_duplicate_keys, user_id, [todo])
+        if _is_recent_duplicate(todo, seen_title_keys, seen_url_keys):
+            duplicates.append(todo)
+            continue
+        if not emitted:
+            metrics.observe("recommendations.time_to_first_todo_seconds", time.perf_counter() - started)
+        emitted.append(todo)
+        yield _sse_event("todo", todo.model_dump())
+
+    # Same rule as the non-streaming endpoint: if everything was a recent duplicate,
+    # the original set is still better than nothing.
+    if duplicates and not emitted:
+        logger.info("All recommended todos for user=%s were duplicates within 15 days; keeping original set", user_id)
+        for todo in duplicates:
+            if not emitted:
+                metrics.observe("recommendations.time_to_first_todo_seconds", time.perf_counter() - started)
+            emitted.append(todo)
+            yield _sse_event("todo", todo.model_dump())
+
+
+async def _stream_llm_todos(
+    primary_goal: str, secondary_goals: str, focus_term: str, budget: int, *, bypass_cache: bool = False
+) -> AsyncIterator[RecommendedTodo]:
+    if not llm_client.configured:
+        logger.info("Skipping LLM recommendations because OPENAI_API_KEY is not configured")
+        return
+
+    prompt = _build_recommendation_prompt(primary_goal, secondary_goals, focus_term, budget)
+    ttl = settings.llm_cache_recommendations_ttl_seconds
+    parser = RecommendedTodoStreamParser()
+    try:
+        cached = await llm_cache.aget("recommendations", settings.openai_model, prompt, ttl, bypass=bypass_cache)
+        chunks = _iterate([cached]) if cached is not None else llm_client.astream(prompt)
+        received: list[str] = []
+        async for chunk in chunks:
+            received.append(chunk)
+            for entry in parser.feed(chunk):
+                # Like the non-streaming parser, only the first three entries count.
+                if parser.entries_seen > 3:
+                    continue
+                todo = _normalize_todo_entry(entry, budget)
+                if todo is not None:
+                    yield todo
+        if cached is None:
+            await llm_cache.aput(
+                "recommendations", settings.openai_model, prompt, "".join(received), ttl, bypass=bypass_cache
+            )
+    except LLMUnavailableError as exc:
+        logger.warning("LLM recommendation stream unavailable: %s", exc)
+    except Exception as exc:  # pragma: no cover
+        logger.warning("LLM recommendation stream failed: %s", exc)
+
+
+class RecommendedTodoStreamParser:
+    """Pulls complete objects out of the `recommended_todos` array while the JSON is still arriving.
+
+    Only string, escape and nesting state is tracked, so each object is decoded
+    with `json.loads` the moment its closing brace arrives.
+    """
+
+    def __init__(self, key: str = "recommended_todos") -> None:
+        self.key = f'"{key}"'
+        self.entries_seen = 0
+        self._buffer = ""
+        self._position = 0
+        self._in_array = False
+        self._done = False
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._object_start: int | None = None
+
+    def feed(self, chunk: str) -> list[dict]:
+        if self._done:
+            return []
+        self._buffer += chunk
+        if not self._in_array and not self._find_array_start():
+            return []
+
+        entries: list[dict] = []
+        buffer = self._buffer
+        index = self._position
+        while index < len(buffer):
+            char = buffer[index]
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char in "{[":
+                if self._depth == 0 and char == "{":
+                    self._object_start = index
+                self._depth += 1
+            elif char in "}]":
+                if self._depth == 0:
+                    self._done = True
+                    break
+                self._depth -= 1
+                if self._depth == 0 and self._object_start is not None:
+                    entry = self._decode(buffer[self._object_start : index + 1])
+                    self._object_start = None
+                    if entry is not None:
+                        entries.append(entry)
+            index += 1
+
+        # Keep only the unfinished object so the buffer does not grow with the response.
+        keep_from = self._object_start if self._object_start is not None else index
+        self._buffer = buffer[keep_from:]
+        self._position = index - keep_from
+        if self._object_start is not None:
+            self._object_start = 0
+        return entries
+
+    def _find_array_start(self) -> bool:
+        key_index = self._buffer.find(self.key)
+        if key_index == -1:
+            return False
+        bracket = self._buffer.find("[", key_index + len(self.key))
+        if bracket == -1:
+            return False
+        self._in_array = True
+        self._buffer = self._buffer[bracket + 1 :]
+        self._position = 0
+        return True
+
+    def _decode(self, raw: str) -> dict | None:
+        self.entries_seen += 1
+        try:
+            entry = json.loads(raw)
+        except json.JSONDecodeError:
+            return None
+        return entry if isinstance(entry, dict) else None
+
+
+async def _iterate(items: Sequence) -> AsyncIterator:
+    for item in items:
+        yield item
+
+
+def _sse_event(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+def _resolve_goal_context(user: User, payload: RecommendationRequest) -> tuple[str, str, str, int]:
     latest_goal = user.goals[-1] if user.goals else None
     if latest_goal is None:
         raise ValueError("User has not set a goal yet")
@@ -35,43 +378,71 @@ def generate_recommendations(db: Session, payload: RecommendationRequest) -> Rec
     secondary_goals = payload.secondary_goals or latest_goal.secondary_goals or "related priorities"
     focus_term = payload.skills_focus or latest_goal.skills_focus or "progress"
     budget = latest_goal.default_learning_minutes or 90
+    return primary_goal, secondary_goals, focus_term, budget
+
 
+def _with_template_fallback(
+    todos: list[RecommendedTodo], primary_goal: str, secondary_goals: str, focus_term: str, budget: int
+) -> list[RecommendedTodo]:
+    if todos:
+        return todos
     context = {
         "primary_goal": primary_goal,
         "secondary_goals": secondary_goals,
         "focus": focus_term,
     }
+    logger.info("Falling back to template recommendations for goal=%s", primary_goal)
+    return _build_template_todos(context, _allocate_minutes(budget))
 
-    todos = _call_llm_recommendations(primary_goal, secondary_goals, focus_term, budget)
-    if not todos:
-        durations = _allocate_minutes(budget)
-        logger.info("Falling back to template recommendations for goal=%s", primary_goal)
-        todos = _build_template_todos(context, durations)
 
-    filtered = _filter_recent_duplicates(db, payload.user_id, todos)
+def _drop_recent_duplicates(
+    filtered: list[RecommendedTodo], todos: list[RecommendedTodo], user_id: str
+) -> list[RecommendedTodo]:
     if filtered:
-        final_todos = filtered
-    else:
-        final_todos = todos
-        logger.info("All recommended todos for user=%s were duplicates within 15 days; keeping original set", payload.user_id)
+        return filtered
+    logger.info("All recommended todos for user=%s were duplicates within 15 days; keeping original set", user_id)
+    return todos
 
-    _persist_recommendation_history(db, payload.user_id, final_todos)
 
+def _build_response(
+    user: User, payload: RecommendationRequest, primary_goal: str, todos: list[RecommendedTodo]
+) -> RecommendationsResponse:
     return RecommendationsResponse(
         user_id=user.id,
         scheduled_date=payload.scheduled_date,
         goal_statement=primary_goal,
-        recommended_todos=final_todos,
+        recommended_todos=todos,
     )
 
 
-def _call_llm_recommendations(primary_goal: str, secondary_goals: str, focus_term: str, budget: int) -> list[RecommendedTodo]:
-    api_key = settings.openai_api_key
-    if not api_key:
+async def _call_llm_recommendations_async(
+    primary_goal: str, secondary_goals: str, focus_term: str, budget: int, *, bypass_cache: bool = False
+) -> list[RecommendedTodo]:
+    if not llm_client.configured:
         logger.info("Skipping LLM recommendations because OPENAI_API_KEY is not configured")
         return []
 
-    prompt = (
+    prompt = _build_recommendation_prompt(primary_goal, secondary_goals, focus_term, budget)
+    try:
+        content = await llm_cache.aget_or_call(
+            "recommendations",
+            settings.openai_model,
+            prompt,
+            settings.llm_cache_recommendations_ttl_seconds,
+            lambda: llm_client.acomplete(prompt),
+            bypass=bypass_cache,
+        )
+        return _parse_recommendation_content(content, budget)
+    except LLMUnavailableError as exc:
+        logger.warning("LLM recommendation unavailable, using templates: %s", exc)
+        return []
+    except Exception as exc:  # pragma: no cover
+        logger.warning("LLM recommendation failed: %s", exc)
+        return []
+
+
+def _build_recommendation_prompt(primary_goal: str, secondary_goals: str, focus_term: str, budget: int) -> str:
+    return (
         "You are a focused productivity coach crafting three recommended to-dos for a professional. "
         "Always use the following structure and output valid JSON with a top-level `recommended_todos` array. "
         "Each todo must include `title`, `description`, `category`, `estimated_minutes`, and `resource_url`. "
@@ -85,49 +456,48 @@ def _call_llm_recommendations(primary_goal: str, secondary_goals: str, focus_ter
         "Keep descriptions practical and action-oriented."
     )
 
-    try:
-        client = OpenAI(api_key=api_key)
-        response = client.responses.create(model=settings.openai_model, input=prompt)
-        content = response.output[0].content[0].text  # type: ignore[attr-defined]
-        payload = _extract_json_block(content)
-        if not payload:
-            logger.warning("LLM response did not include parsable JSON block; content=%s", content)
-            return []
-        todos_data = payload.get("recommended_todos")
-        if not isinstance(todos_data, list):
-            logger.warning("LLM response missing recommended_todos array; payload=%s", payload)
-            return []
 
-        normalized: list[RecommendedTodo] = []
-        for entry in todos_data[:3]:
-            if not isinstance(entry, dict):
-                continue
-            title = entry.get("title")
-            description = entry.get("description")
-            category = entry.get("category")
-            minutes = entry.get("estimated_minutes") or entry.get("estimatedMinutes")
-            resource_url = entry.get("resource_url") or entry.get("resourceUrl")
-            if not (title and description and category):
-                continue
-            try:
-                minutes = int(minutes)
-            except (TypeError, ValueError):
-                minutes = max(budget // 3, 15)
-            minutes = max(10, min(minutes, 240))
-            normalized.append(
-                RecommendedTodo(
-                    title=title,
-                    description=description,
-                    category=category,
-                    estimated_minutes=minutes,
-                    resource_url=resource_url,
-                )
-            )
-        return normalized
-    except Exception as exc:  # pragma: no cover
-        logger.warning("LLM recommendation failed: %s", exc)
+def _parse_recommendation_content(content: str, budget: int) -> list[RecommendedTodo]:
+    payload = _extract_json_block(content)
+    if not payload:
+        logger.warning("LLM response did not include parsable JSON block; content=%s", content)
+        return []
+    todos_data = payload.get("recommended_todos")
+    if not isinstance(todos_data, list):
+        logger.warning("LLM response missing recommended_todos array; payload=%s", payload)
         return []
 
+    normalized: list[RecommendedTodo] = []
+    for entry in todos_data[:3]:
+        todo = _normalize_todo_entry(entry, budget)
+        if todo is not None:
+            normalized.append(todo)
+    return normalized
+
+
+def _normalize_todo_entry(entry: object, budget: int) -> RecommendedTodo | None:
+    if not isinstance(entry, dict):
+        return None
+    title = entry.get("title")
+    description = entry.get("description")
+    category = entry.get("category")
+    minutes = entry.get("estimated_minutes") or entry.get("estimatedMinutes")
+    resource_url = entry.get("resource_url") or entry.get("resourceUrl")
+    if not (title and description and category):
+        return None
+    try:
+        minutes = int(minutes)
+    except (TypeError, ValueError):
+        minutes = max(budget // 3, 15)
+    minutes = max(10, min(minutes, 240))
+    return RecommendedTodo(
+        title=title,
+        description=description,
+        category=category,
+        estimated_minutes=minutes,
+        resource_url=resource_url,
+    )
+
 
 def _extract_json_block(raw: str) -> dict | None:
     if not raw:
@@ -171,23 +541,47 @@ def _build_template_todos(context: dict[str, str], durations: list[int]) -> list
 def _filter_recent_duplicates(db: Session, user_id: str, todos: list[RecommendedTodo]) -> list[RecommendedTodo]:
     if not todos:
         return []
-    cutoff = datetime.utcnow() - timedelta(days=15)
-    stmt = select(RecommendationHistory).where(
-        RecommendationHistory.user_id == user_id,
-        RecommendationHistory.created_at >= cutoff,
-    )
-    history = db.scalars(stmt).all()
-    seen_titles = {entry.title.strip().lower() for entry in history if entry.title}
-    seen_urls = {entry.resource_url for entry in history if entry.resource_url}
-    unique: list[RecommendedTodo] = []
-    for todo in todos:
-        title_key = todo.title.strip().lower()
-        if title_key in seen_titles:
-            continue
-        if todo.resource_url and todo.resource_url in seen_urls:
-            continue
-        unique.append(todo)
-    return unique
+    seen_title_keys, seen_url_keys = _recent_duplicate_keys(db, user_id, todos)
+    return [todo for todo in todos if not _is_recent_duplicate(todo, seen_title_keys, seen_url_keys)]
+
+
+def _recent_duplicate_keys(
+    db: Session, user_id: str, todos: Sequence[RecommendedTodo]
+) -> tuple[set[str], set[str]]:
+    """Title and URL keys of the candidate todos that were already recommended in the last 15 days.
+
+    Only the candidates' keys are looked up, through the (user_id, key, created_at)
+    indexes, so the cost no longer depends on how much history the user has.
+    """
+    title_keys = {recommendation_title_key(todo.title) for todo in todos}
+    url_keys = {key for key in (recommendation_url_key(todo.resource_url) for todo in todos) if key}
+    cutoff = datetime.utcnow() - timedelta(days=DUPLICATE_WINDOW_DAYS)
+
+    def recent(key_filter):
+        return select(RecommendationHistory.title_key, RecommendationHistory.url_key).where(
+            RecommendationHistory.user_id == user_id,
+            key_filter,
+            RecommendationHistory.created_at >= cutoff,
+        )
+
+    # One branch per key rather than an OR, so each side is a seek on its own composite index.
+    stmt = recent(RecommendationHistory.title_key.in_(title_keys))
+    if url_keys:
+        stmt = union_all(stmt, recent(RecommendationHistory.url_key.in_(url_keys)))
+    seen_title_keys: set[str] = set()
+    seen_url_keys: set[str] = set()
+    for title_key, url_key in db.execute(stmt):
+        seen_title_keys.add(title_key)
+        if url_key:
+            seen_url_keys.add(url_key)
+    return seen_title_keys & title_keys, seen_url_keys & url_keys
+
+
+def _is_recent_duplicate(todo: RecommendedTodo, seen_title_keys: set[str], seen_url_keys: set[str]) -> bool:
+    if recommendation_title_key(todo.title) in seen_title_keys:
+        return True
+    url_key = recommendation_url_key(todo.resource_url)
+    return bool(url_key and url_key in seen_url_keys)
 
 
 def _persist_recommendation_history(db: Session, user_id: str, todos: list[RecommendedTodo]) -> None:
@@ -199,6 +593,8 @@ def _persist_recommendation_history(db: Session, user_id: str, todos: list[Recom
             user_id=user_id,
             title=todo.title,
             resource_url=todo.resource_url,
+            title_key=recommendation_title_key(todo.title),
+            url_key=recommendation_url_key(todo.resource_url),
             category=todo.category,
             estimated_minutes=todo.estimated_minutes,
             created_at=now,
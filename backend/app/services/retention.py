@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import gzip
+import json
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.metrics import metrics
+from app.models.recommendation_history import RecommendationHistory
+from app.services.recommendations import DUPLICATE_WINDOW_DAYS
+
+logger = logging.getLogger(__name__)
+
+ARCHIVED_COLUMNS = ("id", "user_id", "title", "resource_url", "category", "estimated_minutes", "created_at")
+
+
+@dataclass
+class RetentionResult:
+    cutoff: datetime
+    rows_purged: int
+    batches: int
+    elapsed_seconds: float
+    archive_path: Path | None = None
+    dry_run: bool = False
+
+
+def purge_recommendation_history(
+    db: Session,
+    *,
+    retention_days: int | None = None,
+    batch_size: int | None = None,
+    archive_dir: str | Path | None = None,
+    dry_run: bool = False,
+) -> RetentionResult:
+    """Delete history older than the retention window in short batches, optionally archiving it first.
+
+    Each batch is its own transaction, so the table is never locked for the whole
+    run and an interrupted run can simply be started again. Rows are written to
+    the gzip JSONL archive before the batch that removes them is committed.
+    """
+    retention_days = retention_days or settings.recommendation_history_retention_days
+    if retention_days < DUPLICATE_WINDOW_DAYS:
+        raise ValueError(
+            f"Retention of {retention_days} days is shorter than the {DUPLICATE_WINDOW_DAYS}-day duplicate window"
+        )
+    batch_size = batch_size or settings.retention_batch_size
+    archive_dir = archive_dir if archive_dir is not None else settings.retention_archive_dir
+    cutoff = datetime.utcnow() - timedelta(days=retention_days)
+    started = time.perf_counter()
+
+    if dry_run:
+        expired = db.scalar(
+            select(func.count()).select_from(RecommendationHistory).where(RecommendationHistory.created_at < cutoff)
+        )
+        return RetentionResult(cutoff, expired or 0, 0, time.perf_counter() - started, dry_run=True)
+
+    archive_path = None
+    archive = None
+    if archive_dir:
+        archive_path = Path(archive_dir) / f"recommendation_history_{datetime.utcnow():%Y%m%dT%H%M%S}.jsonl.gz"
+        archive_path.parent.mkdir(parents=True, exist_ok=True)
+        archive = gzip.open(archive_path, "at", encoding="utf-8")
+
+    rows_purged = 0
+    batches = 0
+    try:
+        while True:
+            columns = [getattr(RecommendationHistory, name) for name in ARCHIVED_COLUMNS] if archive else [
+                RecommendationHistory.id
+            ]
+            rows = db.execute(
+                select(*columns)
+                .where(RecommendationHistory.created_at < cutoff)
+                .order_by(RecommendationHistory.created_at)
+                .limit(batch_size)
+            ).all()
+            if not rows:
+                break
+            if archive:
+                for row in rows:
+                    archive.write(json.dumps(dict(zip(ARCHIVED_COLUMNS, row)), default=str) + "\n")
+                archive.flush()
+            db.execute(delete(RecommendationHistory).where(RecommendationHistory.id.in_([row.id for row in rows])))
+            db.commit()
+            rows_purged += len(rows)
+            batches += 1
+            metrics.increment("retention.recommendation_history.purged", len(rows))
+    finally:
+        if archive:
+            archive.close()
+
+    elapsed = time.perf_counter() - started
+    metrics.observe("retention.recommendation_history.run_seconds", elapsed)
+    logger.info(
+        "Purged %s recommendation_history rows older than %s in %s batches (%.2fs)",
+        rows_purged,
+        cutoff.isoformat(),
+        batches,
+        elapsed,
+    )
+    if archive_path and rows_purged == 0:
+        archive_path.unlink(missing_ok=True)
+        archive_path = None
+    return RetentionResult(cutoff, rows_purged, batches, elapsed, archive_path)
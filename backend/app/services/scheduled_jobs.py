@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import logging
+
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from apscheduler.triggers.cron import CronTrigger
+
+from app.core.config import settings
+from app.services.brief_dispatch import dispatch_daily_briefs
+from app.services.recommendation_precompute import precompute_recommendations
+from app.services.task_rollover import rollover_incomplete_tasks
+
+logger = logging.getLogger(__name__)
+
+
+class ScheduledJobs:
+    """Background jobs that run inside the API process on a clock.
+
+    Each job is opt-in through settings. With several API instances, enable a
+    job on only one of them; the jobs tolerate a concurrent run but would pay
+    for the same work twice.
+    """
+
+    def __init__(self) -> None:
+        self._scheduler: AsyncIOScheduler | None = None
+
+    def start(self) -> None:
+        if self._scheduler is not None:
+            return
+        scheduler = AsyncIOScheduler(timezone="UTC")
+        if settings.precompute_enabled:
+            scheduler.add_job(
+                precompute_recommendations,
+                CronTrigger(hour=settings.precompute_hour_utc, minute=0, timezone="UTC"),
+                id="precompute_recommendations",
+                max_instances=1,
+                coalesce=True,
+                misfire_grace_time=3600,
+            )
+        if settings.brief_dispatch_enabled:
+            # Hourly, because the send hour is local to each user's timezone.
+            scheduler.add_job(
+                dispatch_daily_briefs,
+                CronTrigger(minute=0, timezone="UTC"),
+                id="dispatch_daily_briefs",
+                max_instances=1,
+                coalesce=True,
+                misfire_grace_time=1800,
+            )
+        if settings.rollover_enabled:
+            # Hourly as well: each timezone rolls over at its own midnight. The job is
+            # synchronous, so APScheduler runs it on its thread pool.
+            scheduler.add_job(
+                rollover_incomplete_tasks,
+                CronTrigger(minute=0, timezone="UTC"),
+                id="rollover_incomplete_tasks",
+                max_instances=1,
+                coalesce=True,
+                misfire_grace_time=1800,
+            )
+        if not scheduler.get_jobs():
+            return
+        scheduler.start()
+        self._scheduler = scheduler
+        logger.info("Started scheduled jobs: %s", ", ".join(job.id for job in scheduler.get_jobs()))
+
+    def stop(self) -> None:
+        if self._scheduler is None:
+            return
+        self._scheduler.shutdown(wait=False)
+        self._scheduler = None
+
+
+scheduled_jobs = ScheduledJobs()
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import logging
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta, timezone
+
+from sqlalchemy import or_, select, update
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.metrics import metrics
+from app.db.session import SessionLocal
+from app.models.task import Task
+from app.models.user import User
+from app.services.brief_cache import brief_cache
+from app.services.brief_dispatch import due_timezones
+
+logger = logging.getLogger(__name__)
+
+# Local hour at which yesterday's unfinished tasks move to today.
+ROLLOVER_LOCAL_HOUR = 0
+
+
+@dataclass
+class RolloverChunk:
+    users: int
+    rows_moved: int
+    elapsed_seconds: float
+
+
+@dataclass
+class RolloverResult:
+    run_at: datetime
+    due_timezones: dict[str | None, date] = field(default_factory=dict)
+    chunks: list[RolloverChunk] = field(default_factory=list)
+    elapsed_seconds: float = 0.0
+
+    @property
+    def rows_moved(self) -> int:
+        return sum(chunk.rows_moved for chunk in self.chunks)
+
+
+def rollover_incomplete_tasks(now: datetime | None = None, *, chunk_size: int | None = None) -> RolloverResult:
+    """Carry yesterday's incomplete tasks forward for every user whose local day just started.
+
+    Meant to run at the top of every hour. Users in timezones where it is now
+    midnight are read in id-ordered chunks, and each chunk's tasks are moved
+    with one UPDATE per local date in its own transaction, so a large night
+    never holds one long lock and an interrupted run can simply be repeated.
+    """
+    now = now or datetime.now(timezone.utc)
+    if now.tzinfo is None:
+        now = now.replace(tzinfo=timezone.utc)
+    result = RolloverResult(run_at=now)
+    started = time.perf_counter()
+    chunk_size = chunk_size or settings.rollover_chunk_size
+
+    with SessionLocal() as db:
+        timezones = db.scalars(select(User.timezone).distinct()).all()
+        result.due_timezones = due_timezones(timezones, now, ROLLOVER_LOCAL_HOUR)
+        if not result.due_timezones:
+            return result
+
+        named = [name for name in result.due_timezones if name is not None]
+        due_filter = User.timezone.in_(named)
+        if None in result.due_timezones:
+            due_filter = or_(due_filter, User.timezone.is_(None))
+
+        last_user_id = ""
+        while True:
+            chunk_started = time.perf_counter()
+            users = db.execute(
+                select(User.id, User.timezone)
+                .where(due_filter, User.id > last_user_id)
+                .order_by(User.id)
+                .limit(chunk_size)
+            ).all()
+            if not users:
+                break
+            last_user_id = users[-1].id
+
+            users_by_day: dict[date, list[str]] = defaultdict(list)
+            for user_id, zone in users:
+                users_by_day[result.due_timezones[zone]].append(user_id)
+            rows_moved = 0
+            moved: set[tuple[str, date, date]] = set()
+            for today, user_ids in users_by_day.items():
+                yesterday = today - timedelta(days=1)
+                moved_user_ids = _move_incomplete_tasks(db, user_ids, yesterday, today)
+                rows_moved += len(moved_user_ids)
+                moved.update((user_id, yesterday, today) for user_id in moved_user_ids)
+            db.commit()
+            # Invalidate only after the commit, so a brief rebuilt in between cannot see the old rows.
+            for user_id, from_date, to_date in moved:
+                brief_cache.invalidate(user_id, from_date, to_date)
+
+            chunk = RolloverChunk(
+                users=len(users), rows_moved=rows_moved, elapsed_seconds=time.perf_counter() - chunk_started
+            )
+            result.chunks.append(chunk)
+            metrics.increment("rollover.rows_moved", rows_moved)
+            metrics.observe("rollover.chunk_seconds", chunk.elapsed_seconds)
+            logger.info(
+                "Rollover chunk %s: moved %s tasks for %s users in %.3fs",
+                len(result.chunks),
+                rows_moved,
+                chunk.users,
+                chunk.elapsed_seconds,
+            )
+
+    result.elapsed_seconds = time.perf_counter() - started
+    metrics.observe("rollover.run_seconds", result.elapsed_seconds)
+    return result
+
+
+def _move_incomplete_tasks(db: Session, user_ids: list[str], from_date: date, to_date: date) -> list[str]:
+    """Move the tasks and return the owner of each moved row."""
+    criteria = (Task.user_id.in_(user_ids), Task.scheduled_date == from_date, Task.status != "complete")
+    values = {"scheduled_date": to_date, "status": "pending", "updated_at": datetime.utcnow()}
+    stmt = update(Task).where(*criteria).values(**values).execution_options(synchronize_session=False)
+
+    if db.get_bind().dialect.update_returning:
+        moved_user_ids = list(db.scalars(stmt.returning(Task.user_id)))
+    else:
+        # Without RETURNING (SQLite before 3.35), find the affected users before updating.
+        moved_user_ids = list(db.scalars(select(Task.user_id).where(*criteria)))
+        db.execute(stmt)
+    return moved_user_ids
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
-from datetime import date, timedelta
+from datetime import date, datetime, timedelta
 
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.orm import Session
 
 from app.models.task import Task
 from app.schemas.task import CarryForwardRequest, TaskCreate, TaskRead, TaskUpdate
+from app.services.brief_cache import brief_cache
 
 
 def create_task(db: Session, payload: TaskCreate) -> Task:
@@ -21,6 +22,7 @@ def create_task(db: Session, payload: TaskCreate) -> Task:
     db.add(task)
     db.commit()
     db.refresh(task)
+    brief_cache.invalidate(task.user_id, task.scheduled_date)
     return task
 
 
@@ -34,35 +36,51 @@ def update_task(db: Session, task_id: str, payload: TaskUpdate) -> Task | None:
     if task is None:
         return None
 
+    previous_date = task.scheduled_date
     for field, value in payload.model_dump(exclude_unset=True).items():
         setattr(task, field, value)
 
     db.commit()
     db.refresh(task)
+    brief_cache.invalidate(task.user_id, previous_date, task.scheduled_date)
     return task
 
 
 def carry_forward_tasks(db: Session, request: CarryForwardRequest) -> list[Task]:
+    """Move the user's incomplete tasks from one day to another with a single UPDATE."""
     to_date = request.to_date or request.from_date + timedelta(days=1)
-    stmt = select(Task).where(
+    criteria = (
         Task.user_id == request.user_id,
         Task.scheduled_date == request.from_date,
         Task.status != "complete",
     )
-    tasks = list(db.scalars(stmt))
-    for task in tasks:
-        task.scheduled_date = to_date
-        task.status = "pending"
+    values = {"scheduled_date": to_date, "status": "pending", "updated_at": datetime.utcnow()}
+
+    if db.get_bind().dialect.update_returning:
+        tasks = list(db.scalars(update(Task).where(*criteria).values(**values).returning(Task)))
+    else:
+        # Without RETURNING (SQLite before 3.35), pick the rows first and update exactly those.
+        task_ids = list(db.scalars(select(Task.id).where(*criteria)))
+        tasks = []
+        if task_ids:
+            db.execute(
+                update(Task).where(Task.id.in_(task_ids)).values(**values).execution_options(synchronize_session="fetch")
+            )
+            tasks = list(db.scalars(select(Task).where(Task.id.in_(task_ids))))
     db.commit()
-    return tasks
+    if tasks:
+        brief_cache.invalidate(request.user_id, request.from_date, to_date)
+    return sorted(tasks, key=lambda task: task.created_at)
 
 
 def delete_task(db: Session, task_id: str) -> bool:
     task = db.get(Task, task_id)
     if task is None:
         return False
+    user_id, scheduled_date = task.user_id, task.scheduled_date
     db.delete(task)
     db.commit()
+    brief_cache.invalidate(user_id, scheduled_date)
     return True
 
 
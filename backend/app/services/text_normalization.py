@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import re
+from difflib import SequenceMatcher
+from functools import lru_cache
+from typing import Mapping, Sequence
+
+import numpy as np
+
+REPLACEMENTS = {
+    "\\": "l",
+    "—": "-",
+    "°": "",
+    "|": "l",
+    "•": "-",
+}
+COMMON_FIXES = {
+    "inveryitw": "interview",
+    "agrnee": "agree",
+    "poupo": "followup",
+    "ibson": "gibson",
+}
+CANONICAL_WORDS = [
+    "workout",
+    "focus",
+    "time",
+    "test",
+    "ai",
+    "youtube",
+    "realtor",
+    "followup",
+    "paypal",
+    "interview",
+    "notes",
+    "house",
+    "laundry",
+    "prep",
+    "review",
+    "component",
+    "email",
+    "resume",
+]
+FUZZY_CUTOFF = 0.72
+WHITESPACE_RUN = re.compile(r"\s{2,}")
+
+
+class FuzzyWordIndex:
+    """Exact drop-in for `get_close_matches(term, words, n=1, cutoff)` that scales with vocabulary size.
+
+    Every word's character counts are precomputed into one matrix. For a term, the
+    multiset intersection with all words (the bound behind `quick_ratio`) is a single
+    vectorized `np.minimum`, and only words whose bound clears the cutoff are scored
+    with `SequenceMatcher`, best bound first, stopping once no candidate can win.
+    """
+
+    def __init__(self, words: Sequence[str], cutoff: float = FUZZY_CUTOFF) -> None:
+        self.words = list(words)
+        self.cutoff = cutoff
+        alphabet = sorted({char for word in self.words for char in word})
+        self._columns = {char: idx for idx, char in enumerate(alphabet)}
+        self._counts = np.zeros((len(self.words), len(alphabet)), dtype=np.int32)
+        for row, word in enumerate(self.words):
+            for char in word:
+                self._counts[row, self._columns[char]] += 1
+        self._lengths = np.array([len(word) for word in self.words], dtype=np.int32)
+
+    def best_match(self, term: str) -> str | None:
+        if not self.words or not term:
+            return None
+        term_counts = np.zeros(len(self._columns), dtype=np.int32)
+        for char in term:
+            column = self._columns.get(char)
+            if column is not None:
+                term_counts[column] += 1
+        shared = np.minimum(self._counts, term_counts).sum(axis=1)
+        bounds = 2.0 * shared / (self._lengths + len(term))
+        candidates = np.flatnonzero(bounds >= self.cutoff)
+        if not len(candidates):
+            return None
+
+        best: tuple[float, str] | None = None
+        matcher = SequenceMatcher()
+        matcher.set_seq2(term)
+        for idx in candidates[np.argsort(-bounds[candidates], kind="stable")]:
+            if best is not None and bounds[idx] < best[0]:
+                break
+            word = self.words[idx]
+            matcher.set_seq1(word)
+            score = matcher.ratio()
+            # get_close_matches keeps the largest (score, word) tuple.
+            if score >= self.cutoff and (best is None or (score, word) > best):
+                best = (score, word)
+        return best[1] if best else None
+
+
+class TextNormalizer:
+    """Cleans one OCR/text-layer line: character replacements, typo fixes, fuzzy vocabulary snapping."""
+
+    def __init__(
+        self,
+        replacements: Mapping[str, str],
+        common_fixes: Mapping[str, str],
+        canonical_words: Sequence[str],
+        cutoff: float = FUZZY_CUTOFF,
+        memo_size: int = 8192,
+    ) -> None:
+        self.replacements = dict(replacements)
+        self.common_fixes = dict(common_fixes)
+        self._translation = str.maketrans(self.replacements) if _translate_is_equivalent(self.replacements) else None
+        self._fixes_pattern = (
+            re.compile("|".join(re.escape(typo) for typo in self.common_fixes))
+            if self.common_fixes and _single_pass_is_equivalent(self.common_fixes)
+            else None
+        )
+        self._index = FuzzyWordIndex(canonical_words, cutoff)
+        self._correct_token = lru_cache(maxsize=memo_size)(self._index.best_match)
+
+    def normalize(self, line: str) -> str:
+        cleaned = line.strip()
+        if self._translation is not None:
+            cleaned = cleaned.translate(self._translation)
+        else:
+            for bad, good in self.replacements.items():
+                cleaned = cleaned.replace(bad, good)
+        cleaned = WHITESPACE_RUN.sub(" ", cleaned)
+        cleaned = self._apply_common_fixes(cleaned)
+
+        words = []
+        for token in cleaned.split():
+            if len(token) < 3:
+                words.append(token)
+                continue
+            replacement = self._correct_token(token.lower().strip("-"))
+            if replacement is None:
+                words.append(token)
+                continue
+            words.append(replacement.title() if token.istitle() else replacement)
+        return " ".join(words).strip(" -–.")
+
+    def _apply_common_fixes(self, cleaned: str) -> str:
+        # Any fix lowercases the whole line; lines without a typo keep their casing.
+        lower = cleaned.lower()
+        if self._fixes_pattern is not None:
+            if not self._fixes_pattern.search(lower):
+                return cleaned
+            return self._fixes_pattern.sub(lambda match: self.common_fixes[match.group(0)], lower)
+        for typo, correct in self.common_fixes.items():
+            if typo in lower:
+                cleaned = lower.replace(typo, correct)
+                lower = cleaned
+        return cleaned
+
+
+def _translate_is_equivalent(replacements: Mapping[str, str]) -> bool:
+    # str.translate only maps single characters, and applies them all at once rather
+    # than in order, so a value must not contain a key that is replaced later.
+    keys = list(replacements)
+    if any(len(key) != 1 for key in keys):
+        return False
+    return not any(later in replacements[key] for idx, key in enumerate(keys) for later in keys[idx + 1 :])
+
+
+def _single_pass_is_equivalent(fixes: Mapping[str, str]) -> bool:
+    # One alternation pass matches sequential str.replace calls as long as no typo
+    # overlaps another typo, and no fix creates a typo that a later fix would catch.
+    typos = list(fixes)
+    for idx, typo in enumerate(typos):
+        for other in typos[idx + 1 :]:
+            if _overlaps(typo, other) or _overlaps(fixes[typo], other):
+                return False
+    return True
+
+
+def _overlaps(left: str, right: str) -> bool:
+    if left in right or right in left:
+        return True
+    shortest = min(len(left), len(right))
+    return any(left.endswith(right[:size]) or right.endswith(left[:size]) for size in range(1, shortest))
+
+
+default_normalizer = TextNormalizer(REPLACEMENTS, COMMON_FIXES, CANONICAL_WORDS)
+
+
+def normalize_text_line(line: str) -> str:
+    return default_normalizer.normalize(line)
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import hashlib
+import mmap
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+
+from fastapi import UploadFile
+
+from app.core.config import settings
+
+STORAGE_ROOT = Path(__file__).resolve().parents[2] / "storage" / "uploads"
+STORAGE_ROOT.mkdir(parents=True, exist_ok=True)
+
+UPLOAD_CHUNK_SIZE = 256 * 1024
+
+
+class UploadTooLargeError(ValueError):
+    pass
+
+
+@dataclass
+class StoredUpload:
+    path: Path
+    content_hash: str
+    size_bytes: int
+
+
+def save_upload_to_disk(file: UploadFile, ingestion_id: str) -> StoredUpload:
+    """Stream an upload to storage in fixed-size chunks, hashing and size-checking as it goes."""
+    destination = STORAGE_ROOT / f"{ingestion_id}_{Path(file.filename or 'upload.pdf').name}"
+    partial = destination.with_name(destination.name + ".part")
+    max_bytes = settings.upload_max_bytes
+    digest = hashlib.sha256()
+    size = 0
+
+    try:
+        with partial.open("wb") as buffer:
+            while chunk := file.file.read(UPLOAD_CHUNK_SIZE):
+                size += len(chunk)
+                if size > max_bytes:
+                    raise UploadTooLargeError(f"Upload exceeds the {max_bytes} byte limit")
+                digest.update(chunk)
+                buffer.write(chunk)
+        partial.replace(destination)
+    except BaseException:
+        partial.unlink(missing_ok=True)
+        raise
+
+    return StoredUpload(path=destination, content_hash=digest.hexdigest(), size_bytes=size)
+
+
+@contextmanager
+def map_stored_file(path: Path) -> Iterator[mmap.mmap | bytes]:
+    """Read-only memory map of a stored upload, so stages share page cache instead of copying."""
+    with path.open("rb") as handle:
+        if path.stat().st_size == 0:
+            yield b""
+            return
+        mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            yield mapped
+        finally:
+            mapped.close()
@@ -5,6 +5,7 @@ from sqlalchemy.orm import Session
 
 from app.models.user import Goal, User
 from app.schemas.user import GoalCreate, GoalRead, UserCreate, UserRead
+from app.services.brief_cache import brief_cache
 
 
 def upsert_user_with_goal(db: Session, payload: UserCreate) -> User:
@@ -33,6 +34,9 @@ def upsert_user_with_goal(db: Session, payload: UserCreate) -> User:
 
     db.commit()
     db.refresh(user)
+    if payload.goal:
+        # The latest goal feeds every brief, so drop all of the user's dates.
+        brief_cache.invalidate(user.id)
     return user
 
 
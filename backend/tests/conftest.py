@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import os
+import tempfile
+from collections.abc import Generator
+from contextlib import contextmanager
+from pathlib import Path
+
+import pytest
+
+# Settings are read once at import time, so point them at a throwaway database first.
+_TEST_DIR = Path(tempfile.mkdtemp(prefix="planner-tests-"))
+os.environ["DATABASE_URL"] = f"sqlite:///{_TEST_DIR / 'test.db'}"
+os.environ["ENVIRONMENT"] = "staging"
+os.environ["BRIEF_CACHE_BACKEND"] = "none"
+os.environ["INGESTION_WORKER_COUNT"] = "0"
+os.environ["OPENAI_API_KEY"] = ""
+
+from sqlalchemy import event  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+from app import models  # noqa: F401,E402
+from app.db.base import Base  # noqa: E402
+from app.db.session import SessionLocal, engine  # noqa: E402
+from app.models.user import User  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def _schema() -> Generator[None, None, None]:
+    Base.metadata.create_all(engine)
+    yield
+    Base.metadata.drop_all(engine)
+
+
+@pytest.fixture
+def db() -> Generator[Session, None, None]:
+    with SessionLocal() as session:
+        yield session
+
+
+@pytest.fixture
+def user(db: Session) -> User:
+    user = User(email="ada@example.com", full_name="Ada Lovelace", timezone="UTC")
+    db.add(user)
+    db.commit()
+    return user
+
+
+class StatementCounter:
+    def __init__(self) -> None:
+        self.statements: list[str] = []
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+
+@contextmanager
+def _count_statements() -> Generator[StatementCounter, None, None]:
+    counter = StatementCounter()
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        counter.statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield counter
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+@pytest.fixture
+def count_statements():
+    """Context manager recording every SQL statement the sync engine runs inside the block."""
+    return _count_statements
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from datetime import date
+
+from app.services.brief_cache import MemoryBriefCacheBackend
+
+DAY = date(2025, 12, 1)
+
+
+def test_memory_generations_stay_bounded():
+    backend = MemoryBriefCacheBackend(max_entries=4)
+    for index in range(100):
+        backend.delete(f"user-{index}", [DAY])
+
+    assert len(backend._generations) == 4
+
+
+def test_stale_store_is_rejected_after_its_generation_is_evicted():
+    backend = MemoryBriefCacheBackend(max_entries=2)
+    generation = backend.generation("ada")
+    backend.delete("ada", [DAY])  # invalidation lands while ada's brief is being built
+    backend.delete("grace", [DAY])
+    backend.delete("linus", [DAY])  # evicts ada's generation
+
+    backend.set_many("ada", {DAY: "stale"}, ttl_seconds=60, generation=generation)
+
+    assert backend.get_many("ada", [DAY]) == {}
+
+
+def test_store_with_current_generation_is_kept():
+    backend = MemoryBriefCacheBackend(max_entries=2)
+    backend.delete("ada", [DAY])
+    generation = backend.generation("ada")
+
+    backend.set_many("ada", {DAY: "fresh"}, ttl_seconds=60, generation=generation)
+
+    assert backend.get_many("ada", [DAY]) == {DAY: "fresh"}
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from datetime import date
+
+import pytest
+
+from app.models.availability import DailyAvailability
+from app.models.task import Task
+from app.models.user import Goal
+from app.services import briefs as brief_service
+from app.services.brief_cache import DatabaseBriefCacheBackend, brief_cache
+
+BRIEF_DATE = date(2025, 12, 1)
+
+
+def test_brief_takes_two_statements(db, user, count_statements):
+    db.add_all(
+        [
+            Goal(user_id=user.id, goal_statement="Become a staff engineer"),
+            Goal(user_id=user.id, goal_statement="Ship the planner"),
+            DailyAvailability(user_id=user.id, day=BRIEF_DATE, minutes_available=120),
+            Task(user_id=user.id, title="Write the design doc", scheduled_date=BRIEF_DATE, estimated_minutes=45),
+            Task(user_id=user.id, title="Review pull requests", scheduled_date=BRIEF_DATE, estimated_minutes=30),
+        ]
+    )
+    db.commit()
+    db.expunge_all()
+
+    with count_statements() as counter:
+        brief = brief_service.generate_daily_brief(db, user_id=user.id, brief_date=BRIEF_DATE)
+
+    assert counter.count == 2, counter.statements
+    assert brief.goal_statement == "Ship the planner"
+    assert brief.total_task_minutes == 75
+    assert [task.title for task in brief.tasks] == ["Write the design doc", "Review pull requests"]
+
+
+def test_unknown_user_takes_one_statement(db, count_statements):
+    with count_statements() as counter, pytest.raises(LookupError):
+        brief_service.generate_daily_brief(db, user_id="missing", brief_date=BRIEF_DATE)
+
+    assert counter.count == 1, counter.statements
+
+
+def test_cached_range_batches_database_cache_reads_and_writes(db, user, count_statements, monkeypatch):
+    monkeypatch.setattr(brief_cache, "backend", DatabaseBriefCacheBackend())
+    db.add(Goal(user_id=user.id, goal_statement="Ship the planner"))
+    db.commit()
+    start, end = date(2025, 12, 1), date(2025, 12, 31)
+
+    with count_statements() as cold:
+        briefs = brief_service.generate_daily_briefs(db, user_id=user.id, start_date=start, end_date=end)
+    with count_statements() as warm:
+        cached = brief_service.generate_daily_briefs(db, user_id=user.id, start_date=start, end_date=end)
+
+    assert len(briefs) == 31
+    assert cached == briefs
+    # Lookup, generation, three build queries, then one claimed batch store.
+    assert cold.count <= 10, cold.statements
+    assert warm.count == 1, warm.statements
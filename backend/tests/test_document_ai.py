@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from collections.abc import Generator
+from pathlib import Path
+
+import pytest
+from PIL import Image
+
+from app.core.config import settings
+from app.core.metrics import metrics
+from app.services import pdf_ingestions
+from app.services.external_ocr import FakeDocumentProcessor, document_ai_clients, use_document_ai
+from app.services.pdf_ingestions import ocr_pdf_lines
+
+CANNED_DOCUMENT = Path(__file__).parent / "data" / "documentai_three_pages.json"
+
+
+class RecordingPageImages:
+    """Stands in for `PageImageProvider` (which needs poppler) and records every page it renders."""
+
+    rendered: list[tuple[int, str]] = []
+
+    def __init__(self, pdf_path: Path) -> None:
+        self.pdf_path = pdf_path
+        self.page_count = 3
+
+    def get(self, page_index: int, purpose: str = "ocr") -> Image.Image:
+        self.rendered.append((page_index, purpose))
+        return Image.new("L", (200, 260), 255)
+
+
+@pytest.fixture
+def fake_document_ai(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Generator[Path, None, None]:
+    monkeypatch.setattr(settings, "document_ai_fake_document_path", str(CANNED_DOCUMENT))
+    monkeypatch.setattr(pdf_ingestions, "PageImageProvider", RecordingPageImages)
+    RecordingPageImages.rendered = []
+    document_ai_clients.reset()
+    metrics.reset()
+    pdf_path = tmp_path / "list.pdf"
+    # The fake processor never parses the upload, so any bytes will do.
+    pdf_path.write_bytes(b"%PDF-1.4\n%%EOF\n")
+    yield pdf_path
+    document_ai_clients.reset()
+
+
+def test_only_pages_with_boxes_are_rasterized(fake_document_ai):
+    lines = ocr_pdf_lines(fake_document_ai)
+
+    assert [(line["text"], line["page_index"]) for line in lines] == [
+        ("Buy milk", 0),
+        ("Call the bank", 1),
+        ("Pay rent", 2),
+    ]
+    assert all(line["engine"] == "documentai" for line in lines)
+    # Page 2 came back without bounding boxes, so it is never rendered.
+    assert RecordingPageImages.rendered == [(0, "strikethrough"), (2, "strikethrough")]
+
+
+def test_page_selector_is_honoured(fake_document_ai):
+    lines = use_document_ai(fake_document_ai, page_indices=[1, 2])
+
+    assert [(line["text"], line["page_index"]) for line in lines] == [("Call the bank", 1), ("Pay rent", 2)]
+    assert [coordinate for vertex in lines[1]["bbox"] for coordinate in vertex] == pytest.approx(
+        [0.2, 0.3, 0.5, 0.3, 0.5, 0.35, 0.2, 0.35]
+    )
+
+    ocr_pdf_lines(fake_document_ai, page_indices=[0, 1])
+    assert RecordingPageImages.rendered == [(0, "strikethrough")]
+
+
+def test_client_is_reused_across_calls(fake_document_ai):
+    use_document_ai(fake_document_ai)
+    client = document_ai_clients.get()
+    use_document_ai(fake_document_ai, page_indices=[0])
+
+    assert isinstance(client, FakeDocumentProcessor)
+    assert document_ai_clients.get() is client
+    assert metrics.snapshot()["timings"]["ocr.documentai.client_init_seconds"]["count"] == 1
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import threading
+import time
+from datetime import datetime, timedelta
+
+from app.db.session import SessionLocal
+from app.models.pdf_ingestion import PDFIngestion
+from app.services import ingestion_queue
+from app.services.ingestion_queue import (
+    IngestionWorkerPool,
+    claim_next_ingestion,
+    requeue_stale_ingestions,
+    touch_ingestion,
+)
+
+
+def _ingestion(user, **values) -> PDFIngestion:
+    return PDFIngestion(user_id=user.id, original_filename="plan.pdf", stored_path="/tmp/plan.pdf", **values)
+
+
+def test_requeue_only_touches_jobs_with_a_stale_heartbeat(db, user):
+    long_ago = datetime.utcnow() - timedelta(hours=1)
+    crashed = _ingestion(user, status="processing", started_at=long_ago, claimed_by="gone", heartbeat_at=long_ago)
+    slow = _ingestion(user, status="processing", started_at=long_ago, claimed_by="alive", heartbeat_at=datetime.utcnow())
+    legacy = _ingestion(user, status="processing", started_at=long_ago)
+    db.add_all([crashed, slow, legacy])
+    db.commit()
+
+    assert requeue_stale_ingestions(db, timedelta(minutes=5)) == 2
+
+    for ingestion in (crashed, slow, legacy):
+        db.refresh(ingestion)
+    assert (crashed.status, crashed.claimed_by, crashed.heartbeat_at) == ("pending", None, None)
+    assert legacy.status == "pending"
+    assert (slow.status, slow.claimed_by) == ("processing", "alive")
+
+
+def test_only_the_claiming_worker_can_touch_a_job(db, user):
+    db.add(_ingestion(user, scheduled_date=datetime.utcnow().date()))
+    db.commit()
+
+    ingestion = claim_next_ingestion(db, "worker-a")
+    assert ingestion.claimed_by == "worker-a"
+    assert ingestion.heartbeat_at == ingestion.started_at
+
+    assert touch_ingestion(db, ingestion.id, "worker-a")
+    assert not touch_ingestion(db, ingestion.id, "worker-b")
+
+
+def test_worker_heartbeats_while_processing_and_requeues_from_the_poll_loop(db, user, monkeypatch):
+    long_ago = datetime.utcnow() - timedelta(hours=1)
+    orphan = _ingestion(user, status="processing", started_at=long_ago, claimed_by="gone", heartbeat_at=long_ago)
+    db.add(orphan)
+    db.commit()
+
+    processing = threading.Event()
+    release = threading.Event()
+    seen: list[str | None] = []
+
+    def process_ingestion(session, ingestion):
+        seen.append(ingestion.claimed_by)
+        processing.set()
+        release.wait(timeout=5)
+        ingestion.status = "parsed"
+        session.commit()
+
+    monkeypatch.setattr(ingestion_queue.pdf_service, "process_ingestion", process_ingestion)
+    pool = IngestionWorkerPool(size=1, poll_interval=0.05, heartbeat_interval=0.05, stale_after=60)
+    pool.start()
+    try:
+        # Nothing is pending, so the orphan only runs if the poll loop requeues it.
+        assert processing.wait(timeout=5)
+        with SessionLocal() as check:
+            first_beat = check.get(PDFIngestion, orphan.id).heartbeat_at
+        time.sleep(0.3)
+        with SessionLocal() as check:
+            assert check.get(PDFIngestion, orphan.id).heartbeat_at > first_beat
+    finally:
+        release.set()
+        pool.stop()
+
+    assert seen and seen[0].endswith(":pdf-ingestion-0")
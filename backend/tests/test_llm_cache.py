@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import itertools
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import func, select, update
+
+from app.core.config import settings
+from app.core.metrics import metrics
+from app.models.llm_response_cache import LLMResponseCache
+from app.services import llm_cache
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "llm_cache_enabled", True)
+    monkeypatch.setattr(llm_cache, "_store_counter", itertools.count(1))
+    metrics.reset()
+
+
+class CountingModel:
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+
+    def answer(self, prompt: str):
+        def call() -> str:
+            self.calls.append(prompt)
+            return f"answer to {prompt}"
+
+        return call
+
+
+def _ask(model: CountingModel, prompt: str, ttl_seconds: int = 60, bypass: bool = False) -> str:
+    return llm_cache.get_or_call("cleanup", "fake-model", prompt, ttl_seconds, model.answer(prompt), bypass=bypass)
+
+
+def _cached_count(db) -> int:
+    return db.scalar(select(func.count()).select_from(LLMResponseCache))
+
+
+def test_second_identical_prompt_is_a_hit(db):
+    model = CountingModel()
+
+    assert _ask(model, "tidy  these\nlines") == "answer to tidy  these\nlines"
+    # Whitespace differences normalize to the same key.
+    assert _ask(model, "tidy these lines") == "answer to tidy  these\nlines"
+
+    assert len(model.calls) == 1
+    counters = metrics.snapshot()["counters"]
+    assert (counters["llm_cache.cleanup.miss"], counters["llm_cache.cleanup.hit"]) == (1, 1)
+
+
+def test_expired_entry_is_a_miss(db):
+    model = CountingModel()
+    _ask(model, "tidy these lines")
+    db.execute(update(LLMResponseCache).values(expires_at=datetime.utcnow() - timedelta(seconds=1)))
+    db.commit()
+
+    _ask(model, "tidy these lines")
+
+    assert len(model.calls) == 2
+    assert metrics.snapshot()["counters"]["llm_cache.cleanup.miss"] == 2
+
+
+def test_least_recently_used_entry_is_evicted_at_the_cap(db, monkeypatch):
+    monkeypatch.setattr(settings, "llm_cache_max_entries", 2)
+    monkeypatch.setattr(settings, "llm_cache_prune_every", 1)
+    model = CountingModel()
+    _ask(model, "first")
+    _ask(model, "second")
+    _ask(model, "first")
+
+    _ask(model, "third")
+
+    assert _cached_count(db) == 2
+    assert db.get(LLMResponseCache, llm_cache.cache_key("fake-model", "second")) is None
+    assert metrics.snapshot()["counters"]["llm_cache.evicted"] == 1
+
+
+def test_prune_runs_every_n_stores(db, monkeypatch):
+    monkeypatch.setattr(settings, "llm_cache_max_entries", 1)
+    monkeypatch.setattr(settings, "llm_cache_prune_every", 3)
+    model = CountingModel()
+
+    _ask(model, "first")
+    _ask(model, "second")
+    assert _cached_count(db) == 2
+
+    _ask(model, "third")
+    assert _cached_count(db) == 1
+
+
+@pytest.mark.parametrize("bypass, ttl_seconds", [(True, 60), (False, 0)])
+def test_bypass_always_calls_and_stores_nothing(db, bypass, ttl_seconds):
+    model = CountingModel()
+
+    _ask(model, "tidy these lines", ttl_seconds=ttl_seconds, bypass=bypass)
+    _ask(model, "tidy these lines", ttl_seconds=ttl_seconds, bypass=bypass)
+
+    assert len(model.calls) == 2
+    assert _cached_count(db) == 0
+    assert metrics.snapshot()["counters"]["llm_cache.cleanup.bypass"] == 2
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Generator
+
+import pytest
+
+from app.core.config import settings
+from app.core.metrics import metrics
+from app.devtools.fake_openai import FakeOpenAIServer, start_in_thread
+from app.services.llm_client import LLMClient, LLMUnavailableError
+from app.services.recommendations import (
+    _allocate_minutes,
+    _build_template_todos,
+    _call_llm_recommendations_async,
+    _with_template_fallback,
+)
+
+
+@pytest.fixture
+def fake_openai(monkeypatch: pytest.MonkeyPatch) -> Generator[Callable[..., FakeOpenAIServer], None, None]:
+    """Start a fake OpenAI server with the given options and point the settings at it."""
+    servers: list[FakeOpenAIServer] = []
+
+    def start(latency: float = 0.0, fail_every: int = 0) -> FakeOpenAIServer:
+        server = start_in_thread(latency=latency, fail_every=fail_every)
+        servers.append(server)
+        monkeypatch.setattr(settings, "openai_base_url", server.base_url)
+        return server
+
+    monkeypatch.setattr(settings, "openai_api_key", "fake")
+    monkeypatch.setattr(settings, "openai_retry_base_delay_seconds", 0.01)
+    monkeypatch.setattr(settings, "llm_cache_enabled", False)
+    metrics.reset()
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.mark.asyncio
+async def test_server_errors_are_retried_the_configured_number_of_times(fake_openai, monkeypatch):
+    monkeypatch.setattr(settings, "openai_max_retries", 2)
+    server = fake_openai(fail_every=1)
+    client = LLMClient()
+
+    with pytest.raises(LLMUnavailableError):
+        await client.acomplete("hello", deadline_seconds=10)
+    await client.aclose()
+
+    # Request numbers start at one, so three answered requests leave the counter at four.
+    assert server.next_request_number() == 4
+    counters = metrics.snapshot()["counters"]
+    assert counters["llm.retried"] == 2
+    assert counters["llm.failed"] == 1
+
+
+@pytest.mark.asyncio
+async def test_slow_response_hits_the_deadline_and_falls_back_to_templates(fake_openai, monkeypatch):
+    fake_openai(latency=2.0)
+    monkeypatch.setattr(settings, "openai_request_deadline_seconds", 0.3)
+    client = LLMClient()
+    monkeypatch.setattr("app.services.recommendations.llm_client", client)
+
+    todos = await _call_llm_recommendations_async("Learn Rust", "Ship a CLI", "ownership", 90)
+    await client.aclose()
+    todos = _with_template_fallback(todos, "Learn Rust", "Ship a CLI", "ownership", 90)
+
+    assert metrics.snapshot()["counters"]["llm.deadline_exceeded"] == 1
+    context = {"primary_goal": "Learn Rust", "secondary_goals": "Ship a CLI", "focus": "ownership"}
+    assert todos == _build_template_todos(context, _allocate_minutes(90))
+
+
+@pytest.mark.asyncio
+async def test_normal_response_is_parsed(fake_openai, monkeypatch):
+    fake_openai()
+    client = LLMClient()
+    monkeypatch.setattr("app.services.recommendations.llm_client", client)
+
+    todos = await _call_llm_recommendations_async("Learn Rust", "Ship a CLI", "ownership", 90)
+    await client.aclose()
+
+    assert [todo.category for todo in todos] == ["Research", "Practice", "Share"]
+    assert [todo.estimated_minutes for todo in todos] == [30, 25, 20]
+    assert todos[0].title == "Research: fake recommendation"
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from app.services.pdf_ingestions import _detect_strikethrough_batch
+
+
+def _detect_strikethrough_per_box(image: Image.Image, bbox: list[float]) -> bool:
+    """The detector the batch version replaced: one crop and one Python loop per box."""
+    x1, y1, x2, y2 = bbox
+    if x2 <= x1 or y2 <= y1:
+        return False
+    height = y2 - y1
+    arr = np.array(image.crop((x1, y1, x2, y2)))
+    if arr.ndim == 3:
+        arr = arr[..., 0]
+    if arr.size == 0:
+        return False
+    dark_rows = np.where((arr < 90).mean(axis=1) > 0.65)[0]
+    if not len(dark_rows):
+        return False
+    contiguous = 1
+    best = 1
+    for idx in range(1, len(dark_rows)):
+        if dark_rows[idx] == dark_rows[idx - 1] + 1:
+            contiguous += 1
+            best = max(best, contiguous)
+        else:
+            contiguous = 1
+    return best >= max(1, int(height * 0.05)) and best <= int(height * 0.4)
+
+
+def _generated_page(rng: np.random.Generator, width: int = 320, height: int = 420) -> tuple[np.ndarray, list[list[float]]]:
+    """A white page with text-like noise, some struck-through lines and the line boxes around them."""
+    page = np.full((height, width), 255, dtype=np.uint8)
+    boxes: list[list[float]] = []
+    y = 8
+    while y < height - 24:
+        line_height = int(rng.integers(12, 24))
+        left = int(rng.integers(0, 40))
+        right = int(rng.integers(left + 40, width))
+        glyphs = rng.random((line_height, right - left)) < 0.3
+        page[y : y + line_height, left:right][glyphs] = rng.integers(0, 80)
+        if rng.random() < 0.5:
+            strike = y + line_height // 2
+            thickness = int(rng.integers(1, max(2, line_height // 3)))
+            page[strike : strike + thickness, left:right] = int(rng.integers(0, 60))
+        boxes.append([left - rng.random() * 3, y - rng.random() * 3, right + rng.random() * 3, y + line_height])
+        y += line_height + int(rng.integers(2, 10))
+    return page, boxes
+
+
+def _random_boxes(rng: np.random.Generator, width: int, height: int, count: int) -> list[list[float]]:
+    """Arbitrary boxes, including ones that are empty, inverted or hang off the page."""
+    boxes = []
+    for _ in range(count):
+        x1, x2 = rng.uniform(-30, width + 30, size=2)
+        y1, y2 = rng.uniform(-30, height + 30, size=2)
+        if rng.random() < 0.8:
+            x1, x2 = sorted((x1, x2))
+            y1, y2 = sorted((y1, y2))
+        if rng.random() < 0.2:
+            x1, y1, x2, y2 = (float(round(value)) + 0.5 for value in (x1, y1, x2, y2))
+        boxes.append([x1, y1, x2, y2])
+    return boxes
+
+
+@pytest.mark.parametrize("seed", range(12))
+def test_batch_detector_matches_per_box_detector(seed):
+    rng = np.random.default_rng(seed)
+    page, boxes = _generated_page(rng)
+    boxes += _random_boxes(rng, page.shape[1], page.shape[0], 150)
+    image = Image.fromarray(page, mode="L")
+
+    expected = [_detect_strikethrough_per_box(image, box) for box in boxes]
+    actual = _detect_strikethrough_batch(page, boxes)
+
+    assert actual.tolist() == expected
+    assert any(expected), "generated pages should contain struck-through lines"
+
+
+def test_batch_detector_handles_rgb_pages_and_no_boxes():
+    rng = np.random.default_rng(99)
+    page, boxes = _generated_page(rng)
+    rgb = np.repeat(page[..., None], 3, axis=2)
+    image = Image.fromarray(rgb, mode="RGB")
+
+    assert _detect_strikethrough_batch(rgb, boxes).tolist() == [
+        _detect_strikethrough_per_box(image, box) for box in boxes
+    ]
+    assert _detect_strikethrough_batch(page, []).tolist() == []
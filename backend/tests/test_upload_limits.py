@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import httpx
+import pytest
+
+from app.api import middleware
+from app.api.v1 import uploads
+from app.core.config import settings
+from app.main import app
+
+CHUNK = b"x" * 4096
+
+
+@pytest.fixture
+def small_upload_limit(monkeypatch):
+    monkeypatch.setattr(settings, "upload_max_bytes", 8 * 1024)
+    monkeypatch.setattr(middleware, "MULTIPART_OVERHEAD_BYTES", 1024)
+
+
+@pytest.fixture
+def accept_calls(monkeypatch):
+    calls = []
+    monkeypatch.setattr(uploads, "_accept_upload", lambda *args: calls.append(args))
+    return calls
+
+
+def _multipart_head(boundary: str, user_id: str) -> bytes:
+    return (
+        f'--{boundary}\r\nContent-Disposition: form-data; name="user_id"\r\n\r\n{user_id}\r\n'
+        f'--{boundary}\r\nContent-Disposition: form-data; name="scheduled_date"\r\n\r\n2025-12-01\r\n'
+        f'--{boundary}\r\nContent-Disposition: form-data; name="file"; filename="plan.pdf"\r\n'
+        "Content-Type: application/pdf\r\n\r\n"
+    ).encode()
+
+
+@pytest.mark.asyncio
+async def test_chunked_upload_is_rejected_before_the_body_is_buffered(user, small_upload_limit, accept_calls):
+    boundary = "test-boundary"
+    chunks_sent = 0
+
+    async def body():
+        nonlocal chunks_sent
+        yield _multipart_head(boundary, user.id)
+        for _ in range(256):  # 1 MiB, far over the limit
+            chunks_sent += 1
+            yield CHUNK
+        yield f"\r\n--{boundary}--\r\n".encode()
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.post(
+            "/api/v1/uploads/pdf",
+            content=body(),
+            headers={"Content-Type": f"multipart/form-data; boundary={boundary}"},
+        )
+
+    assert response.status_code == 413
+    assert chunks_sent < 10
+    assert accept_calls == []
+
+
+@pytest.mark.asyncio
+async def test_declared_content_length_over_the_limit_is_rejected(user, small_upload_limit, accept_calls):
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.post(
+            "/api/v1/uploads/pdf",
+            data={"user_id": user.id, "scheduled_date": "2025-12-01"},
+            files={"file": ("plan.pdf", CHUNK * 8, "application/pdf")},
+        )
+
+    assert response.status_code == 413
+    assert accept_calls == []
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+
+import httpx
+import pytest
+
+from app.api.v1 import uploads
+from app.main import app
+from app.services import upload_storage
+
+PDF_BYTES = b"%PDF-1.4\n1 0 obj << /Type /Catalog >> endobj\ntrailer << /Root 1 0 R >>\n%%EOF\n"
+
+
+@pytest.mark.asyncio
+async def test_api_stays_responsive_while_an_upload_is_in_flight(user, monkeypatch, tmp_path):
+    monkeypatch.setattr(upload_storage, "STORAGE_ROOT", tmp_path)
+    started = threading.Event()
+    release = threading.Event()
+    accept_upload = uploads._accept_upload
+
+    def slow_accept_upload(*args, **kwargs):
+        started.set()
+        release.wait(timeout=10)
+        return accept_upload(*args, **kwargs)
+
+    monkeypatch.setattr(uploads, "_accept_upload", slow_accept_upload)
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        upload = asyncio.create_task(
+            client.post(
+                "/api/v1/uploads/pdf",
+                data={"user_id": user.id, "scheduled_date": "2025-12-01"},
+                files={"file": ("plan.pdf", PDF_BYTES, "application/pdf")},
+            )
+        )
+        try:
+            assert await asyncio.to_thread(started.wait, 5)
+
+            health, tasks = await asyncio.wait_for(
+                asyncio.gather(
+                    client.get("/healthz"),
+                    client.get("/api/v1/tasks", params={"user_id": user.id, "scheduled_date": "2025-12-01"}),
+                ),
+                timeout=2,
+            )
+            assert health.status_code == 200
+            assert tasks.status_code == 200
+            assert not upload.done()
+        finally:
+            release.set()
+
+        response = await upload
+    assert response.status_code == 202
+    assert response.json()["status"] == "pending"
@@ -12,6 +12,14 @@ export type UploadPdfPayload = {
   file: File;
 };
 
+export type PdfIngestionStatus = {
+  id: string;
+  status: "pending" | "processing" | "parsed" | "failed";
+  parsed_task_count: number;
+  error_message?: string | null;
+  tasks_created: string[];
+};
+
 export type FetchTasksParams = {
   userId: string;
   scheduledDate: string;
@@ -63,11 +71,28 @@ export const plannerApi = {
       method: "POST",
       body: form,
     });
-    return handleResponse<{
-      id: string;
-      parsed_task_count: number;
-      tasks_created: string[];
-    }>(res);
+    const accepted = await handleResponse<PdfIngestionStatus>(res);
+    return plannerApi.waitForIngestion(accepted.id);
+  },
+
+  async fetchIngestion(ingestionId: string) {
+    const res = await fetch(`${API_BASE_URL}/api/v1/uploads/${ingestionId}`);
+    return handleResponse<PdfIngestionStatus>(res);
+  },
+
+  async waitForIngestion(ingestionId: string, intervalMs = 1500, timeoutMs = 5 * 60 * 1000) {
+    const deadline = Date.now() + timeoutMs;
+    while (Date.now() < deadline) {
+      const ingestion = await plannerApi.fetchIngestion(ingestionId);
+      if (ingestion.status === "parsed") {
+        return ingestion;
+      }
+      if (ingestion.status === "failed") {
+        throw new Error(ingestion.error_message || "PDF parsing failed");
+      }
+      await new Promise((resolve) => setTimeout(resolve, intervalMs));
+    }
+    throw new Error("Timed out waiting for PDF parsing");
   },
 
   async fetchTasks({ userId, scheduledDate }: FetchTasksParams) {